@@ -12,5 +12,6 @@ class HousingJobStreamResponse(BaseModel):
     """주택 작업 스트림 응답 모델."""
 
     job_id: str = Field(description="작업 식별자")
+    event_id: str | None = Field(default=None, description="이벤트 ID. 다음 조회의 last_event_id로 쓴다")
     event: dict | None = Field(default=None, description="스트림 이벤트")
     empty: bool = Field(description="이벤트 존재 여부")
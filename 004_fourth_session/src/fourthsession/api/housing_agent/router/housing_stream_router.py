@@ -1,12 +1,14 @@
 # 목적: 주택 작업 스트림 라우터를 정의한다.
-# 설명: 스트림 이벤트를 조회한다.
+# 설명: 작업 스트림 이벤트를 SSE(text/event-stream)로 내보낸다.
 # 디자인 패턴: 라우터 패턴
 # 참조: fourthsession/api/housing_agent/service/housing_job_service.py
 
 """주택 작업 스트림 라우터 모듈."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
+from fourthsession.api.housing_agent.const.api_constants import HousingApiConstants
 from fourthsession.api.housing_agent.service.housing_job_service import HousingJobService
 
 
@@ -20,6 +22,7 @@ class HousingJobStreamRouter:
             service (HousingJobService): 작업 서비스.
         """
         self._service = service
+        self._constants = HousingApiConstants()
 
     def build(self) -> APIRouter:
         """라우터를 생성해 반환한다.
@@ -27,8 +30,42 @@ class HousingJobStreamRouter:
         Returns:
             APIRouter: 구성된 라우터.
         """
-        # TODO: GET /housing/jobs/{job_id}/stream 엔드포인트를 등록한다.
-        # - HousingJobStreamResponse 사용
-        # - Redis 스트림은 rpush/lpop 정책 사용
-        # - HousingApiConstants.job_stream_path, job_tag 반영
-        raise NotImplementedError("TODO: 작업 스트림 라우터 구현")
+        router = APIRouter(tags=[self._constants.job_tag])
+        router.add_api_route(
+            self._constants.job_stream_path,
+            self.stream_job,
+            methods=["GET"],
+            response_class=StreamingResponse,
+        )
+        return router
+
+    async def stream_job(
+        self,
+        job_id: str,
+        last_event_id: str | None = Query(default=None, description="마지막으로 받은 이벤트 ID"),
+        last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+    ) -> StreamingResponse:
+        """작업 이벤트를 done 이벤트까지 한 연결로 내보낸다.
+
+        브라우저 EventSource는 재접속할 때 Last-Event-ID 헤더를 보내므로 헤더를
+        먼저 보고, 첫 접속에서 이어 받으려면 last_event_id 쿼리를 쓴다.
+        없는 작업이면 하트비트만 보내며 기다리지 않고 404로 응답한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID(쿼리).
+            last_event_id_header (str | None): 마지막으로 받은 이벤트 ID(헤더).
+
+        Returns:
+            StreamingResponse: SSE 응답.
+
+        Raises:
+            HTTPException: 작업이 없으면 404.
+        """
+        if not self._service.has_job(job_id):
+            raise HTTPException(status_code=404, detail=f"작업이 없습니다: {job_id}")
+        return StreamingResponse(
+            self._service.stream_events(job_id, last_event_id_header or last_event_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -7,6 +7,10 @@
 
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import AsyncIterator
+
 from fourthsession.api.housing_agent.model.job_cancel_response import (
     HousingJobCancelResponse,
 )
@@ -18,15 +22,57 @@ from fourthsession.api.housing_agent.model.job_status_response import (
 from fourthsession.api.housing_agent.model.job_stream_response import (
     HousingJobStreamResponse,
 )
+from fourthsession.core.common.queue.inmemory_job_store import InMemoryJobStore
+from fourthsession.core.common.queue.job_cancellation import RedisCancellationSignal
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.queue.job_record import TERMINAL_JOB_STATUSES
+from fourthsession.core.common.queue.stream_event_queue import RedisStreamEventQueue
+
+# 스트림을 끝내는 이벤트 타입.
+DONE_EVENT_TYPE = "done"
+# 짧게 몰려 오므로 모아서 내보내는 이벤트 타입.
+TOKEN_EVENT_TYPE = "token"
 
 
 class HousingJobService:
     """주택 작업 서비스."""
 
-    def __init__(self) -> None:
-        """서비스를 초기화한다."""
-        # TODO: RedisJobQueue, RedisStreamEventQueue, InMemoryJobStore를 주입한다.
-        raise NotImplementedError("TODO: 작업 서비스 초기화 구현")
+    def __init__(
+        self,
+        job_queue: RedisJobQueue | None = None,
+        stream_queue: RedisStreamEventQueue | None = None,
+        job_store: InMemoryJobStore | None = None,
+        cancellation: RedisCancellationSignal | None = None,
+        stream_heartbeat_seconds: float = 15.0,
+        stream_flush_ms: int = 50,
+        stream_batch_size: int = 100,
+        stream_idle_timeout_seconds: float = 300.0,
+        stream_retry_ms: int = 3000,
+    ) -> None:
+        """서비스를 초기화한다.
+
+        Args:
+            job_queue (RedisJobQueue | None): 작업 큐.
+            stream_queue (RedisStreamEventQueue | None): 스트림 이벤트 큐.
+            job_store (InMemoryJobStore | None): 작업 저장소.
+            cancellation (RedisCancellationSignal | None): 실행 중인 워커에 알릴 취소 신호.
+            stream_heartbeat_seconds (float): 이벤트가 없을 때 하트비트 주석을 보내는 간격(초).
+                XREAD BLOCK 대기 시간으로도 쓴다.
+            stream_flush_ms (int): token 이벤트를 모아 한 번에 내보낼 최대 대기 시간(ms).
+            stream_batch_size (int): 한 번에 내보낼 최대 이벤트 수.
+            stream_idle_timeout_seconds (float): 이 시간 동안 이벤트가 없으면 연결을 닫는다.
+                클라이언트는 Last-Event-ID로 다시 접속한다.
+            stream_retry_ms (int): 클라이언트 재접속 대기 시간(SSE retry 필드, ms).
+        """
+        self._job_queue = job_queue or RedisJobQueue()
+        self._stream_queue = stream_queue or RedisStreamEventQueue()
+        self._job_store = job_store or InMemoryJobStore()
+        self._cancellation = cancellation or RedisCancellationSignal()
+        self._stream_heartbeat_seconds = stream_heartbeat_seconds
+        self._stream_flush_ms = stream_flush_ms
+        self._stream_batch_size = stream_batch_size
+        self._stream_idle_timeout_seconds = stream_idle_timeout_seconds
+        self._stream_retry_ms = stream_retry_ms
 
     def create_job(self, request: HousingJobRequest) -> HousingJobResponse:
         """작업을 생성한다.
@@ -43,14 +89,38 @@ class HousingJobService:
     def cancel_job(self, job_id: str) -> HousingJobCancelResponse:
         """작업을 취소한다.
 
+        끝나지 않은 작업만 확인과 갱신을 한 번에 하는 비교 후 갱신으로 CANCELLED로
+        바꾼다. 바꾼 경우에만 취소 신호를 발행해 실행 중인 워커가 다음 노드나 Tool
+        호출 전에 멈추게 하고, 스트림에 done 이벤트를 넣어 SSE 연결을 바로 닫는다.
+        신호 발행이 실패하면 상태를 되돌리고 예외를 그대로 올린다.
+
         Args:
             job_id (str): 작업 식별자.
 
         Returns:
             HousingJobCancelResponse: 취소 응답.
         """
-        # TODO: 작업 상태를 CANCELLED로 갱신한다.
-        raise NotImplementedError("TODO: 작업 취소 구현")
+        record = self._job_store.get(job_id)
+        if record is None:
+            return HousingJobCancelResponse(job_id=job_id, status="NOT_FOUND")
+        previous_status = record.status
+        record, cancelled = self._job_store.update_status_unless(
+            job_id,
+            "CANCELLED",
+            TERMINAL_JOB_STATUSES,
+        )
+        if record is None:
+            return HousingJobCancelResponse(job_id=job_id, status="NOT_FOUND")
+        if not cancelled:
+            return HousingJobCancelResponse(job_id=job_id, status=record.status)
+        try:
+            self._cancellation.cancel(job_id)
+        except Exception:
+            # 워커에 알리지 못했으면 취소되지 않은 것이므로 상태를 되돌린다.
+            self._job_store.update_status_if(job_id, previous_status, "CANCELLED")
+            raise
+        self._stream_queue.push_event(job_id, {"type": DONE_EVENT_TYPE, "status": "CANCELLED"})
+        return HousingJobCancelResponse(job_id=job_id, status="CANCELLED")
 
     def get_status(self, job_id: str) -> HousingJobStatusResponse:
         """작업 상태를 조회한다.
@@ -64,14 +134,112 @@ class HousingJobService:
         # TODO: 작업 저장소에서 상태 조회 후 응답한다.
         raise NotImplementedError("TODO: 작업 상태 조회 구현")
 
-    def stream(self, job_id: str) -> HousingJobStreamResponse:
-        """스트림 이벤트를 조회한다.
+    def has_job(self, job_id: str) -> bool:
+        """작업 저장소에 작업이 있는지 확인한다.
 
         Args:
             job_id (str): 작업 식별자.
 
+        Returns:
+            bool: 작업이 있으면 True.
+        """
+        return self._job_store.get(job_id) is not None
+
+    def stream(self, job_id: str, last_event_id: str | None = None) -> HousingJobStreamResponse:
+        """last_event_id 다음 스트림 이벤트 하나를 기다리지 않고 조회한다.
+
+        SSE를 쓸 수 없는 클라이언트용 단건 조회다. 보통은 stream_events를 쓴다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID.
+
         Returns:
             HousingJobStreamResponse: 스트림 응답.
         """
-        # TODO: Redis 스트림 리스트에서 lpop으로 이벤트를 가져온다.
-        raise NotImplementedError("TODO: 스트림 조회 구현")
+        found = self._stream_queue.pop_event(job_id, last_event_id)
+        if found is None:
+            return HousingJobStreamResponse(job_id=job_id, empty=True)
+        event_id, event = found
+        return HousingJobStreamResponse(job_id=job_id, event_id=event_id, event=event, empty=False)
+
+    async def stream_events(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+    ) -> AsyncIterator[str]:
+        """스트림 이벤트를 도착하는 대로 SSE 텍스트로 내보낸다.
+
+        asyncio Redis 클라이언트의 XREAD BLOCK으로 새 이벤트를 기다리므로 열린
+        연결이 많아도 서버 스레드 풀을 차지하지 않는다. 하트비트 간격 동안 이벤트가
+        없으면 주석 줄을 보내 프록시가 연결을 끊지 않게 한다. token 이벤트는 flush
+        대기 시간 동안 모아 한 번에 내보내며, done 이벤트를 보내면 끝낸다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID(Last-Event-ID).
+                없으면 처음부터 보낸다.
+
+        Yields:
+            str: 한 번에 flush할 SSE 텍스트.
+        """
+        yield f"retry: {self._stream_retry_ms}\n\n"
+        heartbeat_ms = max(int(self._stream_heartbeat_seconds * 1000), 1)
+        last_received = time.monotonic()
+        while True:
+            batch = await self._stream_queue.read_events_async(
+                job_id,
+                last_event_id,
+                block_ms=heartbeat_ms,
+                count=self._stream_batch_size,
+            )
+            if not batch:
+                if time.monotonic() - last_received >= self._stream_idle_timeout_seconds:
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            batch = await self._collect_tokens(job_id, batch)
+            last_received = time.monotonic()
+
+            chunks = []
+            done = False
+            for event_id, event in batch:
+                chunks.append(self._format_sse(event_id, event))
+                last_event_id = event_id
+                if event.get("type") == DONE_EVENT_TYPE:
+                    done = True
+                    break
+            yield "".join(chunks)
+            if done:
+                return
+
+    async def _collect_tokens(
+        self,
+        job_id: str,
+        batch: list[tuple[str, dict]],
+    ) -> list[tuple[str, dict]]:
+        """배치가 token 이벤트로 끝나면 flush 대기 시간 동안 뒤따르는 이벤트를 더 모은다."""
+        deadline = time.monotonic() + self._stream_flush_ms / 1000
+        while (
+            len(batch) < self._stream_batch_size
+            and batch[-1][1].get("type") == TOKEN_EVENT_TYPE
+        ):
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            # BLOCK 0은 무한 대기이므로 남은 시간이 1ms 미만이면 그만 모은다.
+            if remaining_ms <= 0:
+                break
+            more = await self._stream_queue.read_events_async(
+                job_id,
+                batch[-1][0],
+                block_ms=remaining_ms,
+                count=self._stream_batch_size - len(batch),
+            )
+            if not more:
+                break
+            batch.extend(more)
+        return batch
+
+    def _format_sse(self, event_id: str, event: dict) -> str:
+        """이벤트 하나를 SSE 메시지로 만든다."""
+        data = json.dumps(event, ensure_ascii=False)
+        return f"id: {event_id}\ndata: {data}\n\n"
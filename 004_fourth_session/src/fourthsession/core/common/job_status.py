@@ -0,0 +1,13 @@
+# 목적: 작업 상태 상수를 정의한다.
+# 설명: 큐(redis)와 SQLite 저장소가 함께 쓰는 상태 값을 의존성 없는 모듈에 둔다.
+# 디자인 패턴: 상수 모듈
+# 참조: fourthsession/core/common/queue/job_record.py,
+#       fourthsession/core/common/repository/sqlite/report_job_repository.py
+
+"""작업 상태 상수 모듈."""
+
+from __future__ import annotations
+
+
+# 더 이상 바뀌지 않는 작업 상태. 저장소는 이 상태의 작업을 TTL 후 지운다.
+TERMINAL_JOB_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED"})
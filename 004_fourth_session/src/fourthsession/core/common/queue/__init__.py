@@ -1,14 +1,23 @@
 """공통 큐 패키지."""
 
 from fourthsession.core.common.queue.inmemory_job_store import InMemoryJobStore
-from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.queue.job_cancellation import (
+    CancellationToken,
+    JobCancelledError,
+    RedisCancellationSignal,
+)
+from fourthsession.core.common.queue.job_queue import JobLease, RedisJobQueue
 from fourthsession.core.common.queue.job_record import JobRecord
 from fourthsession.core.common.queue.redis_connection_provider import RedisConnectionProvider
 from fourthsession.core.common.queue.stream_event_queue import RedisStreamEventQueue
 
 __all__ = [
+    "CancellationToken",
     "InMemoryJobStore",
+    "JobCancelledError",
+    "JobLease",
     "JobRecord",
+    "RedisCancellationSignal",
     "RedisConnectionProvider",
     "RedisJobQueue",
     "RedisStreamEventQueue",
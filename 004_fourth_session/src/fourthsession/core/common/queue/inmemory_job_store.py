@@ -1,20 +1,67 @@
 # 목적: 인메모리 작업 저장소를 정의한다.
-# 설명: 작업 상태를 프로세스 메모리에 저장한다.
+# 설명: 작업 상태를 프로세스 메모리에 저장하고 끝난 작업은 TTL 후 지운다.
 # 디자인 패턴: 리포지토리 패턴
 # 참조: fourthsession/core/common/queue/job_record.py
 
 """인메모리 작업 저장소 모듈."""
 
-from fourthsession.core.common.queue.job_record import JobRecord
+from __future__ import annotations
 
+import heapq
+import threading
+import time
+from collections.abc import Collection
+from datetime import datetime
 
-class InMemoryJobStore:
-    """인메모리 작업 저장소."""
+from fourthsession.core.common.queue.job_record import TERMINAL_JOB_STATUSES, JobRecord
+
+
+class _Shard:
+    """락 하나가 지키는 저장소 조각."""
+
+    __slots__ = ("lock", "records", "expires_at", "expiry_heap")
 
     def __init__(self) -> None:
-        """저장소를 초기화한다."""
-        # TODO: 내부 저장 구조(딕셔너리, Lock)를 준비한다.
-        raise NotImplementedError("TODO: 저장소 초기화 구현")
+        self.lock = threading.Lock()
+        self.records: dict[str, JobRecord] = {}
+        # 종료 상태 작업의 만료 시각. 상태가 다시 바뀌면 지운다.
+        self.expires_at: dict[str, float] = {}
+        # (만료 시각, job_id). expires_at과 다른 항목은 지난 항목이므로 건너뛴다.
+        self.expiry_heap: list[tuple[float, str]] = []
+
+
+class InMemoryJobStore:
+    """인메모리 작업 저장소.
+
+    job_id 해시로 고른 조각마다 락을 따로 두므로 서로 다른 작업의
+    create/update_status/get은 서로 기다리지 않는다. 종료 상태가 된 작업은
+    ttl_seconds 뒤 백그라운드 정리 스레드가 지우고, 그 전에 만료된 작업은
+    get에서 없는 작업으로 본다.
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 16,
+        ttl_seconds: float = 600.0,
+        sweep_interval_seconds: float = 30.0,
+    ) -> None:
+        """저장소를 초기화한다.
+
+        Args:
+            shard_count (int): 조각 수. 동시에 접근하는 스레드 수보다 크게 둔다.
+            ttl_seconds (float): 종료 상태 작업을 보관할 시간(초).
+            sweep_interval_seconds (float): 만료 작업을 정리하는 주기(초).
+        """
+        if shard_count < 1:
+            raise ValueError("shard_count는 1 이상이어야 합니다.")
+        self._shards = tuple(_Shard() for _ in range(shard_count))
+        self._ttl_seconds = ttl_seconds
+        self._sweep_interval = sweep_interval_seconds
+        self._counter_lock = threading.Lock()
+        self._created = 0
+        self._evicted = 0
+        self._stop_event = threading.Event()
+        self._sweeper: threading.Thread | None = None
 
     def create(self, job_id: str, payload: dict) -> JobRecord:
         """작업 레코드를 생성한다.
@@ -26,21 +73,94 @@ class InMemoryJobStore:
         Returns:
             JobRecord: 생성된 레코드.
         """
-        # TODO: JobRecord를 생성하고 저장한다.
-        raise NotImplementedError("TODO: 작업 생성 구현")
+        self._ensure_sweeper()
+        now = datetime.utcnow().isoformat()
+        record = JobRecord(
+            job_id=job_id,
+            status="CREATED",
+            payload=payload,
+            created_at=now,
+            updated_at=now,
+        )
+        shard = self._shard(job_id)
+        with shard.lock:
+            shard.records[job_id] = record
+            shard.expires_at.pop(job_id, None)
+        with self._counter_lock:
+            self._created += 1
+        return record
 
     def update_status(self, job_id: str, status: str) -> JobRecord | None:
-        """작업 상태를 갱신한다.
+        """작업 상태를 갱신한다. 종료 상태면 만료 시각을 잡는다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            status (str): 변경 상태.
+
+        Returns:
+            JobRecord | None: 갱신된 레코드. 없거나 만료된 작업이면 None.
+        """
+        now = time.monotonic()
+        shard = self._shard(job_id)
+        with shard.lock:
+            record = self._live_record(shard, job_id, now)
+            if record is None:
+                return None
+            self._set_status(shard, record, status, now)
+        return record
+
+    def update_status_unless(
+        self,
+        job_id: str,
+        status: str,
+        blocked_statuses: Collection[str],
+    ) -> tuple[JobRecord | None, bool]:
+        """현재 상태가 blocked_statuses에 없을 때만 상태를 갱신한다.
+
+        확인과 갱신을 같은 조각 락 안에서 하므로 그 사이에 다른 스레드가 쓴
+        상태를 덮어쓰지 않는다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            status (str): 변경 상태.
+            blocked_statuses (Collection[str]): 이 상태면 바꾸지 않는다.
+
+        Returns:
+            tuple[JobRecord | None, bool]: (레코드, 갱신 여부). 없거나 만료된 작업이면 (None, False).
+        """
+        now = time.monotonic()
+        shard = self._shard(job_id)
+        with shard.lock:
+            record = self._live_record(shard, job_id, now)
+            if record is None or record.status in blocked_statuses:
+                return record, False
+            self._set_status(shard, record, status, now)
+        return record, True
+
+    def update_status_if(
+        self,
+        job_id: str,
+        status: str,
+        expected_status: str,
+    ) -> tuple[JobRecord | None, bool]:
+        """현재 상태가 expected_status일 때만 상태를 갱신한다.
 
         Args:
             job_id (str): 작업 식별자.
             status (str): 변경 상태.
+            expected_status (str): 기대하는 현재 상태.
 
         Returns:
-            JobRecord | None: 갱신된 레코드.
+            tuple[JobRecord | None, bool]: (레코드, 갱신 여부). 없거나 만료된 작업이면 (None, False).
         """
-        # TODO: 저장된 레코드의 상태/시간을 갱신한다.
-        raise NotImplementedError("TODO: 작업 상태 갱신 구현")
+        now = time.monotonic()
+        shard = self._shard(job_id)
+        with shard.lock:
+            record = self._live_record(shard, job_id, now)
+            if record is None or record.status != expected_status:
+                return record, False
+            self._set_status(shard, record, status, now)
+        return record, True
 
     def get(self, job_id: str) -> JobRecord | None:
         """작업 레코드를 조회한다.
@@ -49,7 +169,107 @@ class InMemoryJobStore:
             job_id (str): 작업 식별자.
 
         Returns:
-            JobRecord | None: 작업 레코드.
+            JobRecord | None: 작업 레코드. 없거나 만료된 작업이면 None.
+        """
+        shard = self._shard(job_id)
+        with shard.lock:
+            return self._live_record(shard, job_id, time.monotonic())
+
+    def sweep(self) -> int:
+        """만료된 종료 상태 작업을 지운다.
+
+        조각마다 락을 따로 잡으므로 정리하는 동안에도 다른 조각은 쓸 수 있다.
+
+        Returns:
+            int: 지운 작업 수.
+        """
+        now = time.monotonic()
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                heap = shard.expiry_heap
+                while heap and heap[0][0] <= now:
+                    expires_at, job_id = heapq.heappop(heap)
+                    if shard.expires_at.get(job_id) == expires_at:
+                        del shard.expires_at[job_id]
+                        del shard.records[job_id]
+                        evicted += 1
+        if evicted:
+            with self._counter_lock:
+                self._evicted += evicted
+        return evicted
+
+    def metrics(self) -> dict:
+        """저장소 크기와 정리 지표를 반환한다.
+
+        Returns:
+            dict: 전체/종료 상태 작업 수, 조각별 최대 크기, 누적 생성/정리 건수.
         """
-        # TODO: job_id로 레코드를 조회한다.
-        raise NotImplementedError("TODO: 작업 조회 구현")
+        sizes = []
+        terminal = 0
+        for shard in self._shards:
+            with shard.lock:
+                sizes.append(len(shard.records))
+                terminal += len(shard.expires_at)
+        with self._counter_lock:
+            created, evicted = self._created, self._evicted
+        return {
+            "size": sum(sizes),
+            "terminal": terminal,
+            "shard_count": len(self._shards),
+            "max_shard_size": max(sizes),
+            "created": created,
+            "evicted": evicted,
+            "ttl_seconds": self._ttl_seconds,
+        }
+
+    def close(self) -> None:
+        """정리 스레드를 멈춘다."""
+        self._stop_event.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    def _set_status(self, shard: _Shard, record: JobRecord, status: str, now: float) -> None:
+        """조각 락을 잡은 상태에서 상태를 바꾸고 종료 상태면 만료 시각을 잡는다."""
+        record.status = status
+        record.updated_at = datetime.utcnow().isoformat()
+        if status in TERMINAL_JOB_STATUSES:
+            expires_at = now + self._ttl_seconds
+            shard.expires_at[record.job_id] = expires_at
+            heapq.heappush(shard.expiry_heap, (expires_at, record.job_id))
+        else:
+            shard.expires_at.pop(record.job_id, None)
+
+    def _shard(self, job_id: str) -> _Shard:
+        """job_id가 속한 조각을 반환한다."""
+        return self._shards[hash(job_id) % len(self._shards)]
+
+    def _live_record(self, shard: _Shard, job_id: str, now: float) -> JobRecord | None:
+        """만료되지 않은 레코드를 반환한다. 만료됐으면 지운다. 조각 락 안에서 호출한다."""
+        expires_at = shard.expires_at.get(job_id)
+        if expires_at is not None and expires_at <= now:
+            del shard.expires_at[job_id]
+            del shard.records[job_id]
+            with self._counter_lock:
+                self._evicted += 1
+            return None
+        return shard.records.get(job_id)
+
+    def _ensure_sweeper(self) -> None:
+        """정리 스레드가 없으면 띄운다."""
+        if self._sweeper is not None or self._stop_event.is_set():
+            return
+        with self._counter_lock:
+            if self._sweeper is None:
+                self._sweeper = threading.Thread(
+                    target=self._run_sweeper,
+                    name="job-store-sweeper",
+                    daemon=True,
+                )
+                self._sweeper.start()
+
+    def _run_sweeper(self) -> None:
+        """close()가 호출될 때까지 주기적으로 만료 작업을 지운다."""
+        while not self._stop_event.wait(self._sweep_interval):
+            self.sweep()
@@ -0,0 +1,281 @@
+# 목적: 작업 취소 신호를 정의한다.
+# 설명: Redis pub/sub으로 취소를 알리고 프로세스 안에서는 Event로 바로 깨운다.
+# 디자인 패턴: 옵저버 패턴
+# 참조: fourthsession/api/housing_agent/service/housing_job_service.py, fourthsession/core/housing_agent/graph/graph_builder.py
+
+"""작업 취소 신호 모듈."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from fourthsession.core.common.queue.redis_connection_provider import RedisConnectionProvider
+
+logger = logging.getLogger(__name__)
+
+# LangGraph config["configurable"]에 취소 토큰을 넣을 때 쓰는 키.
+CANCEL_TOKEN_CONFIG_KEY = "cancel_token"
+
+
+class JobCancelledError(Exception):
+    """작업이 취소되어 실행을 멈출 때 발생한다."""
+
+    def __init__(self, job_id: str | None = None) -> None:
+        """예외를 초기화한다.
+
+        Args:
+            job_id (str | None): 취소된 작업 식별자.
+        """
+        super().__init__(f"작업이 취소되었습니다: {job_id}" if job_id else "작업이 취소되었습니다.")
+        self.job_id = job_id
+
+
+class CancellationToken:
+    """작업 하나의 취소 상태.
+
+    실행 중인 코드는 cancelled/raise_if_cancelled로 확인하고, 기다리는 코드는
+    add_callback으로 취소되는 즉시 깨어날 수 있다.
+    """
+
+    __slots__ = ("job_id", "_event", "_lock", "_callbacks")
+
+    def __init__(self, job_id: str | None = None) -> None:
+        """토큰을 초기화한다.
+
+        Args:
+            job_id (str | None): 작업 식별자.
+        """
+        self.job_id = job_id
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부를 반환한다."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """토큰을 취소 상태로 바꾸고 등록된 콜백을 호출한다."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001 - 콜백 하나의 실패로 나머지를 건너뛰지 않는다.
+                logger.exception("취소 콜백 실행 중 오류가 발생했습니다.")
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """취소될 때까지 기다린다.
+
+        Args:
+            timeout (float | None): 최대 대기 시간(초).
+
+        Returns:
+            bool: 취소되었으면 True.
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        """취소되었으면 JobCancelledError를 발생시킨다."""
+        if self._event.is_set():
+            raise JobCancelledError(self.job_id)
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """취소될 때 호출할 콜백을 등록한다. 이미 취소되었으면 바로 호출한다.
+
+        Args:
+            callback (Callable[[], None]): 취소 시 호출할 함수. 취소한 스레드에서 호출된다.
+
+        Returns:
+            Callable[[], None]: 등록을 해제하는 함수.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        """등록한 콜백을 해제한다."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def get_cancel_token(config: dict[str, Any] | None) -> CancellationToken | None:
+    """LangGraph config에서 취소 토큰을 꺼낸다.
+
+    Args:
+        config (dict[str, Any] | None): 노드가 받은 RunnableConfig.
+
+    Returns:
+        CancellationToken | None: 취소 토큰. 없으면 None.
+    """
+    if not config:
+        return None
+    return (config.get("configurable") or {}).get(CANCEL_TOKEN_CONFIG_KEY)
+
+
+class RedisCancellationSignal:
+    """Redis 기반 작업 취소 신호.
+
+    cancel()은 취소 키를 남기고 채널에 job_id를 발행한다. 워커 프로세스는
+    register()로 실행 중인 작업의 토큰을 받아 두고, 구독 스레드가 메시지를
+    받으면 해당 토큰을 바로 취소한다. 구독 전에 취소된 작업은 register()가
+    취소 키로 확인한다.
+    """
+
+    def __init__(
+        self,
+        connection_provider: RedisConnectionProvider | None = None,
+        channel: str = "housing:cancel",
+        key_prefix: str = "housing:cancelled",
+        ttl_seconds: int = 3600,
+        reconnect_interval: float = 1.0,
+    ) -> None:
+        """취소 신호를 초기화한다.
+
+        Args:
+            connection_provider (RedisConnectionProvider | None): Redis 연결 제공자.
+            channel (str): 취소 메시지를 발행할 채널.
+            key_prefix (str): 작업별 취소 키 접두사.
+            ttl_seconds (int): 취소 키 보관 시간(초).
+            reconnect_interval (float): 구독이 끊겼을 때 다시 시도할 간격(초).
+        """
+        self._provider = connection_provider or RedisConnectionProvider()
+        self._channel = channel
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._reconnect_interval = reconnect_interval
+        self._tokens: dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+        self._subscribed = threading.Event()
+        self._stop_event = threading.Event()
+        self._listener: threading.Thread | None = None
+
+    def cancel(self, job_id: str) -> None:
+        """작업 취소를 알린다.
+
+        Args:
+            job_id (str): 작업 식별자.
+        """
+        # 같은 프로세스에서 실행 중이면 Redis를 거치지 않고 바로 깨운다.
+        with self._lock:
+            token = self._tokens.get(job_id)
+        if token is not None:
+            token.cancel()
+        pipeline = self._provider.get_client().pipeline(transaction=False)
+        pipeline.set(self._key(job_id), "1", ex=self._ttl_seconds)
+        pipeline.publish(self._channel, job_id)
+        pipeline.execute()
+
+    def is_cancelled(self, job_id: str) -> bool:
+        """작업이 취소되었는지 확인한다. 큐에서 꺼낸 작업을 시작하기 전에 쓴다.
+
+        Args:
+            job_id (str): 작업 식별자.
+
+        Returns:
+            bool: 취소되었으면 True.
+        """
+        with self._lock:
+            token = self._tokens.get(job_id)
+        if token is not None and token.cancelled:
+            return True
+        return bool(self._provider.get_client().exists(self._key(job_id)))
+
+    def register(self, job_id: str) -> CancellationToken:
+        """실행을 시작하는 작업의 취소 토큰을 만든다.
+
+        Args:
+            job_id (str): 작업 식별자.
+
+        Returns:
+            CancellationToken: 취소 토큰. 작업이 끝나면 release()로 해제한다.
+        """
+        self._ensure_listener()
+        with self._lock:
+            token = self._tokens.get(job_id)
+            if token is None:
+                token = self._tokens[job_id] = CancellationToken(job_id)
+        # 구독 후에 키를 보므로 그 사이 취소는 키나 메시지 둘 중 하나로 잡힌다.
+        if self._provider.get_client().exists(self._key(job_id)):
+            token.cancel()
+        return token
+
+    def release(self, job_id: str) -> None:
+        """작업의 취소 토큰을 해제한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+        """
+        with self._lock:
+            self._tokens.pop(job_id, None)
+
+    def close(self) -> None:
+        """구독 스레드를 멈춘다."""
+        self._stop_event.set()
+        if self._listener is not None:
+            self._listener.join()
+            self._listener = None
+
+    def _ensure_listener(self) -> None:
+        """구독 스레드가 없으면 띄우고 구독이 끝날 때까지 기다린다."""
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen,
+                    name="job-cancel-listener",
+                    daemon=True,
+                )
+                self._listener.start()
+        self._subscribed.wait(self._reconnect_interval * 5)
+
+    def _listen(self) -> None:
+        """취소 채널을 구독하고 메시지가 오면 해당 토큰을 취소한다."""
+        while not self._stop_event.is_set():
+            pubsub = self._provider.get_client().pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self._channel)
+                self._subscribed.set()
+                # 다시 구독했다면 끊긴 동안 놓친 메시지를 취소 키로 확인한다.
+                self._recheck_registered()
+                while not self._stop_event.is_set():
+                    message = pubsub.get_message(timeout=self._reconnect_interval)
+                    if message is None or message.get("type") != "message":
+                        continue
+                    with self._lock:
+                        token = self._tokens.get(message["data"])
+                    if token is not None:
+                        token.cancel()
+            except Exception:  # noqa: BLE001 - 연결이 끊기면 잠시 뒤 다시 구독한다.
+                self._subscribed.clear()
+                logger.exception("작업 취소 채널 구독 중 오류가 발생했습니다.")
+                time.sleep(self._reconnect_interval)
+            finally:
+                pubsub.close()
+
+    def _recheck_registered(self) -> None:
+        """등록된 작업 중 취소 키가 있는 작업의 토큰을 취소한다."""
+        with self._lock:
+            tokens = list(self._tokens.values())
+        if not tokens:
+            return
+        pipeline = self._provider.get_client().pipeline(transaction=False)
+        for token in tokens:
+            pipeline.exists(self._key(token.job_id))
+        for token, exists in zip(tokens, pipeline.execute()):
+            if exists:
+                token.cancel()
+
+    def _key(self, job_id: str) -> str:
+        """작업별 취소 키를 만든다."""
+        return f"{self._key_prefix}:{job_id}"
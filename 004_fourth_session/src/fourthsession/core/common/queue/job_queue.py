@@ -5,14 +5,83 @@
 
 """작업 큐 모듈."""
 
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+from dataclasses import dataclass
+from uuid import uuid4
+
+from fourthsession.core.common.queue.redis_connection_provider import RedisConnectionProvider
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class JobLease:
+    """reserve로 꺼낸 작업. ack하기 전까지 처리 중 리스트에 남아 있다."""
+
+    payload: dict
+    raw: str
+
 
 class RedisJobQueue:
-    """Redis 작업 큐."""
+    """Redis 작업 큐.
+
+    기본 소비는 lpop/blpop이다. 신뢰 모드에서는 reserve가 BLMOVE로 작업을
+    소비자별 처리 중 리스트로 옮기고, 처리가 끝나면 ack로 지운다. 소비자는
+    heartbeat로 lease 키를 갱신하며, recover는 자기 처리 중 리스트와 lease가
+    만료된(죽은) 소비자의 리스트만 큐 앞쪽에 되돌린다. JSON 객체로 읽을 수 없는
+    작업은 dead-letter 리스트로 옮겨 다시 꺼내지 않는다.
+    """
+
+    def __init__(
+        self,
+        connection_provider: RedisConnectionProvider | None = None,
+        queue_key: str = "housing:jobs",
+        consumer_id: str | None = None,
+        lease_seconds: int = 30,
+    ) -> None:
+        """작업 큐를 초기화한다.
+
+        Args:
+            connection_provider (RedisConnectionProvider | None): Redis 연결 제공자.
+            queue_key (str): 작업 리스트 키.
+            consumer_id (str | None): 신뢰 모드에서 처리 중 리스트를 구분할 소비자 식별자.
+                워커마다 달라야 한다. 없으면 "호스트:pid:임의값"을 쓴다. 고정 값을 주면
+                재시작한 워커가 자기 리스트에 남은 작업을 바로 되찾는다.
+            lease_seconds (int): heartbeat가 끊긴 소비자를 죽은 것으로 보는 시간(초).
+        """
+        self._provider = connection_provider or RedisConnectionProvider()
+        self._queue_key = queue_key
+        self._consumer_id = consumer_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._lease_seconds = lease_seconds
+        self._consumers_key = f"{queue_key}:consumers"
+        self._dead_letter_key = f"{queue_key}:dead"
+        self._processing_key = self._processing_key_of(self._consumer_id)
+        self._heartbeat_key = self._heartbeat_key_of(self._consumer_id)
+
+    @property
+    def consumer_id(self) -> str:
+        """이 소비자의 식별자를 반환한다."""
+        return self._consumer_id
+
+    @property
+    def lease_seconds(self) -> int:
+        """소비자 lease 유지 시간(초)을 반환한다."""
+        return self._lease_seconds
 
-    def __init__(self) -> None:
-        """작업 큐를 초기화한다."""
-        # TODO: RedisConnectionProvider를 주입한다.
-        raise NotImplementedError("TODO: 작업 큐 초기화 구현")
+    @property
+    def processing_key(self) -> str:
+        """이 소비자의 처리 중 리스트 키를 반환한다."""
+        return self._processing_key
+
+    @property
+    def dead_letter_key(self) -> str:
+        """읽을 수 없는 작업을 모아 두는 dead-letter 리스트 키를 반환한다."""
+        return self._dead_letter_key
 
     def enqueue(self, payload: dict) -> int:
         """작업을 큐에 적재한다.
@@ -23,14 +92,141 @@ class RedisJobQueue:
         Returns:
             int: 큐 길이.
         """
-        # TODO: Redis 리스트에 rpush로 payload를 적재한다.
-        raise NotImplementedError("TODO: 작업 큐 enqueue 구현")
+        return self._provider.get_client().rpush(
+            self._queue_key,
+            json.dumps(payload, ensure_ascii=False),
+        )
 
-    def dequeue(self) -> dict | None:
+    def dequeue(self, timeout: float | None = None) -> dict | None:
         """작업을 큐에서 가져온다.
 
+        Args:
+            timeout (float | None): 없으면 lpop으로 바로 반환한다. 있으면 blpop으로
+                작업이 들어올 때까지 최대 timeout초 기다린다.
+
         Returns:
-            dict | None: 작업 페이로드.
+            dict | None: 작업 페이로드. 작업이 없거나 읽을 수 없어 dead-letter로
+                옮겼으면 None.
         """
-        # TODO: Redis 리스트에서 lpop으로 payload를 꺼낸다.
-        raise NotImplementedError("TODO: 작업 큐 dequeue 구현")
+        client = self._provider.get_client()
+        if timeout is None:
+            raw = client.lpop(self._queue_key)
+        else:
+            popped = client.blpop([self._queue_key], timeout=timeout)
+            raw = popped[1] if popped else None
+        if raw is None:
+            return None
+        payload = self._decode(raw)
+        if payload is None:
+            client.rpush(self._dead_letter_key, raw)
+        return payload
+
+    def reserve(self, timeout: float) -> JobLease | None:
+        """작업을 처리 중 리스트로 옮기며 가져온다(BLMOVE).
+
+        Args:
+            timeout (float): 최대 대기 시간(초).
+
+        Returns:
+            JobLease | None: 꺼낸 작업. 시간 안에 작업이 없거나 읽을 수 없어
+                dead-letter로 옮겼으면 None.
+        """
+        client = self._provider.get_client()
+        raw = client.blmove(
+            self._queue_key,
+            self._processing_key,
+            timeout,
+            "LEFT",
+            "RIGHT",
+        )
+        if raw is None:
+            return None
+        payload = self._decode(raw)
+        if payload is None:
+            # 처리 중 리스트에 남기면 recover가 큐로 되돌려 계속 다시 꺼낸다.
+            pipeline = client.pipeline(transaction=True)
+            pipeline.rpush(self._dead_letter_key, raw)
+            pipeline.lrem(self._processing_key, 1, raw)
+            pipeline.execute()
+            return None
+        return JobLease(payload=payload, raw=raw)
+
+    def ack(self, lease: JobLease) -> bool:
+        """처리가 끝난 작업을 처리 중 리스트에서 지운다.
+
+        Args:
+            lease (JobLease): reserve가 반환한 작업.
+
+        Returns:
+            bool: 지웠으면 True.
+        """
+        return bool(self._provider.get_client().lrem(self._processing_key, 1, lease.raw))
+
+    def heartbeat(self) -> None:
+        """소비자 lease를 갱신한다. lease_seconds보다 짧은 주기로 호출한다."""
+        pipeline = self._provider.get_client().pipeline(transaction=False)
+        pipeline.set(self._heartbeat_key, "1", ex=self._lease_seconds)
+        pipeline.sadd(self._consumers_key, self._consumer_id)
+        pipeline.execute()
+
+    def release(self) -> None:
+        """정상 종료하는 소비자의 lease를 지운다.
+
+        처리 중 리스트가 비어 있을 때만 소비자 목록에서 뺀다. 남은 작업이 있으면
+        lease만 지워 다른 워커의 recover가 바로 되찾게 한다.
+        """
+        client = self._provider.get_client()
+        client.delete(self._heartbeat_key)
+        if client.llen(self._processing_key) == 0:
+            client.srem(self._consumers_key, self._consumer_id)
+
+    def recover(self) -> int:
+        """자기 처리 중 리스트와 lease가 만료된 소비자의 리스트를 큐 앞쪽으로 되돌린다.
+
+        살아 있는(lease가 남은) 다른 소비자의 리스트는 건드리지 않는다. 워커가
+        시작할 때 heartbeat 뒤에 호출한다.
+
+        Returns:
+            int: 되돌린 작업 수.
+        """
+        client = self._provider.get_client()
+        moved = self._move_back(self._processing_key)
+        for consumer_id in client.smembers(self._consumers_key):
+            if consumer_id == self._consumer_id or client.exists(self._heartbeat_key_of(consumer_id)):
+                continue
+            moved += self._move_back(self._processing_key_of(consumer_id))
+            client.srem(self._consumers_key, consumer_id)
+        return moved
+
+    def size(self) -> int:
+        """대기 중인 작업 수를 반환한다."""
+        return self._provider.get_client().llen(self._queue_key)
+
+    def _decode(self, raw: str) -> dict | None:
+        """작업 페이로드를 읽는다. JSON 객체가 아니면 경고를 남기고 None을 반환한다."""
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            logger.warning("읽을 수 없는 작업을 dead-letter 리스트로 옮깁니다: %.200r", raw)
+            return None
+        return payload
+
+    def _move_back(self, processing_key: str) -> int:
+        """처리 중 리스트의 작업을 큐 앞쪽으로 옮긴다."""
+        client = self._provider.get_client()
+        moved = 0
+        # 오래된 작업이 먼저 처리되도록 처리 중 리스트의 끝에서부터 큐 앞에 넣는다.
+        # LMOVE는 원자적이므로 여러 워커가 동시에 되돌려도 작업이 중복되지 않는다.
+        while client.lmove(processing_key, self._queue_key, "RIGHT", "LEFT") is not None:
+            moved += 1
+        return moved
+
+    def _processing_key_of(self, consumer_id: str) -> str:
+        """소비자의 처리 중 리스트 키를 만든다."""
+        return f"{self._queue_key}:processing:{consumer_id}"
+
+    def _heartbeat_key_of(self, consumer_id: str) -> str:
+        """소비자의 lease 키를 만든다."""
+        return f"{self._queue_key}:consumer:{consumer_id}"
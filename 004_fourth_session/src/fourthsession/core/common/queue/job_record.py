@@ -10,10 +10,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from fourthsession.core.common.job_status import TERMINAL_JOB_STATUSES  # noqa: F401 - 기존 import 경로 유지
 
-@dataclass
+
+@dataclass(slots=True)
 class JobRecord:
-    """작업 레코드."""
+    """작업 레코드.
+
+    작업이 많이 쌓이는 저장소에 보관하므로 __dict__ 없이 슬롯으로 둔다.
+    """
 
     job_id: str
     status: str
@@ -5,7 +5,11 @@
 
 """Redis 연결 제공자 모듈."""
 
+import os
+import threading
+
 import redis
+import redis.asyncio
 
 
 class RedisConnectionProvider:
@@ -19,14 +23,52 @@ class RedisConnectionProvider:
             port (int | None): Redis 포트.
             db (int | None): Redis DB 인덱스.
         """
-        # TODO: 환경 변수 기반 기본값을 설정한다.
-        raise NotImplementedError("TODO: Redis 연결 설정 구현")
+        self._host = host or os.getenv("REDIS_HOST", "localhost")
+        self._port = port if port is not None else int(os.getenv("REDIS_PORT", "6379"))
+        self._db = db if db is not None else int(os.getenv("REDIS_DB", "0"))
+        self._client: redis.Redis | None = None
+        self._async_client: redis.asyncio.Redis | None = None
+        self._lock = threading.Lock()
 
     def get_client(self) -> redis.Redis:
         """Redis 클라이언트를 반환한다.
 
+        클라이언트는 내부 연결 풀을 가지므로 한 번 만들어 스레드 간에 공유한다.
+        BLPOP 같은 블로킹 명령을 쓰므로 소켓 읽기 제한 시간은 두지 않는다.
+
         Returns:
             redis.Redis: Redis 클라이언트.
         """
-        # TODO: redis.Redis 인스턴스를 생성한다.
-        raise NotImplementedError("TODO: Redis 클라이언트 생성 구현")
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = redis.Redis(
+                        host=self._host,
+                        port=self._port,
+                        db=self._db,
+                        decode_responses=True,
+                        health_check_interval=30,
+                    )
+        return self._client
+
+    def get_async_client(self) -> redis.asyncio.Redis:
+        """asyncio용 Redis 클라이언트를 반환한다.
+
+        SSE처럼 XREAD BLOCK으로 오래 기다리는 경로에서 쓴다. 기다리는 동안 스레드를
+        잡지 않으므로 연결 수가 늘어도 서버 스레드 풀이 고갈되지 않는다. 클라이언트는
+        처음 사용한 이벤트 루프에 묶이므로 애플리케이션 루프 안에서만 쓴다.
+
+        Returns:
+            redis.asyncio.Redis: asyncio Redis 클라이언트.
+        """
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = redis.asyncio.Redis(
+                        host=self._host,
+                        port=self._port,
+                        db=self._db,
+                        decode_responses=True,
+                        health_check_interval=30,
+                    )
+        return self._async_client
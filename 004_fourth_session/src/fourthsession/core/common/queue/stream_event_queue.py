@@ -1,20 +1,49 @@
 # 목적: 스트림 이벤트 큐를 정의한다.
-# 설명: 작업별 스트림 이벤트를 Redis 리스트로 관리한다.
+# 설명: 작업별 스트림 이벤트를 Redis Stream으로 관리한다.
 # 디자인 패턴: 큐 패턴
 # 참조: fourthsession/core/common/queue/redis_connection_provider.py
 
 """스트림 이벤트 큐 모듈."""
 
+from __future__ import annotations
+
+import json
+
+from fourthsession.core.common.queue.redis_connection_provider import RedisConnectionProvider
+
+# Redis Stream의 처음 위치. 이 ID 다음 이벤트부터 읽으면 전체를 읽는다.
+STREAM_START_ID = "0-0"
+
 
 class RedisStreamEventQueue:
-    """Redis 기반 스트림 이벤트 큐."""
+    """Redis 기반 스트림 이벤트 큐.
 
-    def __init__(self) -> None:
-        """스트림 이벤트 큐를 초기화한다."""
-        # TODO: RedisConnectionProvider와 key_prefix를 설정한다.
-        raise NotImplementedError("TODO: 스트림 큐 초기화 구현")
+    작업마다 Redis Stream 하나를 두고 XADD로 적재, XREAD로 읽는다. 읽어도
+    지워지지 않으므로 여러 구독자가 같은 이벤트를 받고, 끊겼던 클라이언트는
+    마지막으로 받은 이벤트 ID(Last-Event-ID) 다음부터 이어 읽는다.
+    """
+
+    def __init__(
+        self,
+        connection_provider: RedisConnectionProvider | None = None,
+        key_prefix: str = "housing:stream",
+        maxlen: int = 1000,
+        ttl_seconds: int = 3600,
+    ) -> None:
+        """스트림 이벤트 큐를 초기화한다.
+
+        Args:
+            connection_provider (RedisConnectionProvider | None): Redis 연결 제공자.
+            key_prefix (str): 작업별 스트림 키 접두사.
+            maxlen (int): 작업별로 보관할 최대 이벤트 수(근사 트리밍).
+            ttl_seconds (int): 마지막 적재 후 스트림을 보관할 시간(초).
+        """
+        self._provider = connection_provider or RedisConnectionProvider()
+        self._key_prefix = key_prefix
+        self._maxlen = maxlen
+        self._ttl_seconds = ttl_seconds
 
-    def push_event(self, job_id: str, event: dict) -> int:
+    def push_event(self, job_id: str, event: dict) -> str:
         """스트림 이벤트를 적재한다.
 
         Args:
@@ -22,19 +51,100 @@ class RedisStreamEventQueue:
             event (dict): 이벤트 데이터.
 
         Returns:
-            int: 스트림 큐 길이.
+            str: 적재된 이벤트 ID. SSE id와 Last-Event-ID로 쓴다.
+        """
+        key = self._key(job_id)
+        pipeline = self._provider.get_client().pipeline(transaction=False)
+        pipeline.xadd(
+            key,
+            {"data": json.dumps(event, ensure_ascii=False)},
+            maxlen=self._maxlen,
+            approximate=True,
+        )
+        pipeline.expire(key, self._ttl_seconds)
+        event_id, _ = pipeline.execute()
+        return event_id
+
+    def read_events(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+        block_ms: int | None = None,
+        count: int = 100,
+    ) -> list[tuple[str, dict]]:
+        """last_event_id 다음 이벤트를 읽는다. 읽은 이벤트는 지우지 않는다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID. 없으면 처음부터 읽는다.
+            block_ms (int | None): 새 이벤트가 없을 때 기다릴 시간(ms). 없으면 바로 반환한다.
+            count (int): 한 번에 읽을 최대 이벤트 수.
+
+        Returns:
+            list[tuple[str, dict]]: (이벤트 ID, 이벤트 데이터) 목록.
         """
-        # TODO: Redis 리스트에 rpush로 이벤트를 적재한다.
-        raise NotImplementedError("TODO: 스트림 이벤트 적재 구현")
+        response = self._provider.get_client().xread(
+            {self._key(job_id): last_event_id or STREAM_START_ID},
+            count=count,
+            block=block_ms,
+        )
+        return self._parse_response(response)
 
-    def pop_event(self, job_id: str) -> dict | None:
-        """스트림 이벤트를 가져온다.
+    async def read_events_async(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+        block_ms: int | None = None,
+        count: int = 100,
+    ) -> list[tuple[str, dict]]:
+        """read_events의 asyncio 버전. 기다리는 동안 이벤트 루프를 막지 않는다.
 
         Args:
             job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID. 없으면 처음부터 읽는다.
+            block_ms (int | None): 새 이벤트가 없을 때 기다릴 시간(ms). 없으면 바로 반환한다.
+            count (int): 한 번에 읽을 최대 이벤트 수.
 
         Returns:
-            dict | None: 이벤트 데이터.
+            list[tuple[str, dict]]: (이벤트 ID, 이벤트 데이터) 목록.
         """
-        # TODO: Redis 리스트에서 lpop으로 이벤트를 꺼낸다.
-        raise NotImplementedError("TODO: 스트림 이벤트 조회 구현")
+        response = await self._provider.get_async_client().xread(
+            {self._key(job_id): last_event_id or STREAM_START_ID},
+            count=count,
+            block=block_ms,
+        )
+        return self._parse_response(response)
+
+    def pop_event(self, job_id: str, last_event_id: str | None = None) -> tuple[str, dict] | None:
+        """last_event_id 다음 이벤트 하나를 반환한다.
+
+        이름은 예전 리스트 기반 API를 따르지만 이벤트를 지우지 않는다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            last_event_id (str | None): 마지막으로 받은 이벤트 ID.
+
+        Returns:
+            tuple[str, dict] | None: (이벤트 ID, 이벤트 데이터). 없으면 None.
+        """
+        events = self.read_events(job_id, last_event_id, count=1)
+        return events[0] if events else None
+
+    def delete(self, job_id: str) -> None:
+        """작업의 스트림을 지운다.
+
+        Args:
+            job_id (str): 작업 식별자.
+        """
+        self._provider.get_client().delete(self._key(job_id))
+
+    def _parse_response(self, response: list | None) -> list[tuple[str, dict]]:
+        """XREAD 응답을 (이벤트 ID, 이벤트 데이터) 목록으로 바꾼다."""
+        if not response:
+            return []
+        _, entries = response[0]
+        return [(event_id, json.loads(fields["data"])) for event_id, fields in entries]
+
+    def _key(self, job_id: str) -> str:
+        """작업별 스트림 키를 만든다."""
+        return f"{self._key_prefix}:{job_id}"
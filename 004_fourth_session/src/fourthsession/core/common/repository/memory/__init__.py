@@ -0,0 +1 @@
+"""인메모리 레포지토리 패키지."""
@@ -0,0 +1,430 @@
+# 목적: 인메모리 컬럼형 주택 데이터 레포지토리를 정의한다.
+# 설명: houses 테이블을 컬럼별 NumPy 배열로 한 번 적재하고 벡터 연산으로 조회/통계를 수행한다.
+# 디자인 패턴: 리포지토리 패턴
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
+
+"""컬럼형 주택 데이터 레포지토리 모듈.
+
+NumPy는 선택 의존성이다. `uv sync --extra columnar`로 설치한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - 선택 의존성 안내
+    raise ImportError(
+        "ColumnarHousingRepository를 사용하려면 numpy가 필요합니다. "
+        "`uv sync --extra columnar`로 설치하세요."
+    ) from exc
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    HOUSING_COLUMNS,
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    HousingRepository,
+)
+
+_FLOAT_COLUMNS = ("price", "area")
+_INT_COLUMNS = ("bedrooms", "bathrooms", "stories", "parking")
+_CATEGORY_COLUMNS = (
+    "mainroad",
+    "guestroom",
+    "basement",
+    "hotwaterheating",
+    "airconditioning",
+    "prefarea",
+    "furnishingstatus",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnSnapshot:
+    """한 적재 버전의 읽기 전용 컬럼 배열 묶음.
+
+    다시 적재할 때는 새 스냅샷을 만들어 속성 하나로 교체하므로, 조회는 시작할 때
+    읽은 스냅샷 하나만 보고 서로 다른 버전의 배열을 섞지 않는다.
+    """
+
+    version: int | None
+    rowid: np.ndarray
+    price_key: np.ndarray
+    columns: dict[str, np.ndarray]
+    categories: dict[str, tuple[str | None, ...]]
+
+
+_EMPTY_SNAPSHOT = _ColumnSnapshot(
+    version=None,
+    rowid=np.empty(0, dtype=np.int64),
+    price_key=np.empty(0, dtype=np.float64),
+    columns={},
+    categories={},
+)
+
+
+class ColumnarHousingRepository(HousingRepository):
+    """NumPy 컬럼 배열 기반 주택 데이터 레포지토리.
+
+    SQLite를 원본으로 두고, 연결 제공자의 data_version이 바뀌면 배열을 다시 적재한다.
+    """
+
+    def __init__(self, connection_provider: SqliteConnectionProvider | None = None) -> None:
+        """레포지토리를 초기화한다.
+
+        Args:
+            connection_provider (SqliteConnectionProvider | None): 원본 데이터 연결 제공자.
+        """
+        super().__init__(connection_provider)
+        self._load_lock = threading.Lock()
+        self._snapshot = _EMPTY_SNAPSHOT
+
+    def refresh(self) -> None:
+        """SQLite에서 컬럼 배열을 다시 적재한다."""
+        with self._load_lock:
+            self._snapshot = self._load()
+
+    def list_houses(self, filters: dict) -> list[dict]:
+        """필터 조건에 맞는 주택 목록을 조회한다.
+
+        Args:
+            filters (dict): 조회 조건.
+
+        Returns:
+            list[dict]: 주택 목록.
+        """
+        page_size = self._page_size(filters)
+        snap = self._ensure_loaded()
+        positions = np.flatnonzero(self._mask(snap, filters))[:page_size]
+        return [self._position_to_house(snap, position) for position in positions]
+
+    def list_houses_page(self, filters: dict, cursor: str | None = None) -> dict:
+        """키셋(price, rowid) 기준으로 주택 목록 한 페이지를 조회한다.
+
+        커서 형식은 SQLite 레포지토리와 같으므로 두 백엔드 사이에서 호환된다.
+
+        Args:
+            filters (dict): 조회 조건. limit는 페이지 크기로 사용한다.
+            cursor (str | None): 직전 응답의 next_cursor.
+
+        Returns:
+            dict: items, count, next_cursor(마지막 페이지면 None).
+        """
+        return self._list_page(self._ensure_loaded(), filters, cursor)
+
+    def _list_page(self, snap: _ColumnSnapshot, filters: dict, cursor: str | None) -> dict:
+        """주어진 스냅샷에서 키셋 페이지 하나를 조회한다."""
+        filter_digest = self._filter_digest(filters)
+        page_size = self._page_size(filters)
+        mask = self._mask(snap, filters)
+        if cursor:
+            mask &= self._after_mask(snap, self._decode_cursor(cursor, filter_digest))
+        positions = np.flatnonzero(mask)[: page_size + 1]
+        has_more = len(positions) > page_size
+        positions = positions[:page_size]
+        next_cursor = None
+        if has_more:
+            last = positions[-1]
+            price = float(snap.columns["price"][last])
+            next_cursor = self._encode_cursor(
+                None if np.isnan(price) else price,
+                int(snap.rowid[last]),
+                filter_digest,
+            )
+        items = [self._position_to_house(snap, position) for position in positions]
+        return {"items": items, "count": len(items), "next_cursor": next_cursor}
+
+    def iter_houses(self, filters: dict, fetch_size: int = 500) -> Iterator[dict]:
+        """필터 조건에 맞는 주택을 하나씩 반환한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            fetch_size (int): SQLite 레포지토리와의 호환을 위한 인자(사용하지 않음).
+
+        Yields:
+            dict: 주택 정보.
+        """
+        snap = self._ensure_loaded()
+        positions = np.flatnonzero(self._mask(snap, filters))
+        if filters.get("limit") is not None:
+            positions = positions[: self._page_size(filters, maximum=None)]
+        for position in positions:
+            yield self._position_to_house(snap, position)
+
+    def get_price_stats(self, filters: dict) -> dict:
+        """가격 통계 정보를 벡터 연산으로 계산한다.
+
+        Args:
+            filters (dict): 통계 대상 조건.
+
+        Returns:
+            dict: 통계 결과.
+        """
+        return self._price_stats(self._ensure_loaded(), filters)
+
+    def _price_stats(self, snap: _ColumnSnapshot, filters: dict) -> dict:
+        """주어진 스냅샷에서 가격 통계를 계산한다."""
+        prices = snap.columns["price"][self._mask(snap, filters)]
+        prices = prices[~np.isnan(prices)]
+        if prices.size == 0:
+            return {
+                "count": 0,
+                "average": None,
+                "median": None,
+                "min": None,
+                "max": None,
+            }
+        return {
+            "count": int(prices.size),
+            "average": round(float(prices.mean()), 2),
+            "median": round(float(np.median(prices)), 2),
+            "min": round(float(prices.min()), 2),
+            "max": round(float(prices.max()), 2),
+        }
+
+    def get_price_aggregates(
+        self,
+        filters: dict,
+        group_by: str | None = None,
+        percentiles: list[float] | None = None,
+        histogram_bucket_size: float | None = None,
+        histogram_start: float = 0.0,
+    ) -> dict:
+        """그룹별 가격 집계를 np.percentile/구간 카운트로 계산한다.
+
+        Args:
+            filters (dict): 집계 대상 조건.
+            group_by (str | None): 그룹 기준 컬럼. None이면 전체를 하나의 그룹으로 본다.
+            percentiles (list[float] | None): 0~100 사이 백분위수 목록.
+            histogram_bucket_size (float | None): 히스토그램 구간 폭. None이면 생략한다.
+            histogram_start (float): 히스토그램 첫 구간의 시작 값.
+
+        Returns:
+            dict: group_by, total_count, groups.
+        """
+        spec = self._aggregate_spec(group_by, percentiles, histogram_bucket_size)
+        return self._price_aggregates(
+            self._ensure_loaded(), filters, group_by, spec, histogram_start
+        )
+
+    def _price_aggregates(
+        self,
+        snap: _ColumnSnapshot,
+        filters: dict,
+        group_by: str | None,
+        spec: dict,
+        histogram_start: float,
+    ) -> dict:
+        """주어진 스냅샷에서 그룹별 가격 집계를 계산한다."""
+        price = snap.columns["price"]
+        mask = self._mask(snap, filters) & ~np.isnan(price)
+        if group_by is None:
+            partitions = [(None, mask)]
+        else:
+            values = snap.columns[group_by][mask]
+            partitions = [
+                (
+                    self._group_label(snap, group_by, code),
+                    mask & self._group_mask(snap, group_by, code),
+                )
+                for code in self._ordered_group_codes(values)
+            ]
+
+        groups = []
+        for key, group_mask in partitions:
+            prices = price[group_mask]
+            if prices.size == 0:
+                continue
+            summary = {
+                "key": key,
+                "count": int(prices.size),
+                "average": round(float(prices.mean()), 2),
+                "min": round(float(prices.min()), 2),
+                "max": round(float(prices.max()), 2),
+                "percentiles": dict(
+                    zip(
+                        (self._percentile_label(value) for value in spec["percentiles"]),
+                        (round(float(value), 2) for value in np.percentile(prices, spec["percentiles"])),
+                    )
+                ),
+            }
+            bucket_size = spec["bucket_size"]
+            if bucket_size is not None:
+                indexes, counts = np.unique(
+                    np.floor_divide(prices - histogram_start, bucket_size).astype(np.int64),
+                    return_counts=True,
+                )
+                summary["histogram"] = self._histogram_items(
+                    dict(zip(indexes.tolist(), counts.tolist())),
+                    bucket_size,
+                    histogram_start,
+                )
+            groups.append(summary)
+        return {
+            "group_by": group_by,
+            "total_count": sum(group["count"] for group in groups),
+            "groups": groups,
+        }
+
+    def execute_batch(self, specs: list[dict]) -> dict:
+        """여러 조회/통계/집계 요청을 같은 배열 스냅샷에서 실행한다.
+
+        Args:
+            specs (list[dict]): 요청 목록. 형식은 HousingRepository.execute_batch와 같다.
+
+        Returns:
+            dict: 요청 id별 결과. id가 없거나 겹치는 요청은 실행하지 않고 오류로 반환한다.
+        """
+        specs, id_errors = self._split_batch_specs(specs)
+        snap = self._ensure_loaded()
+        results: dict[Any, dict] = {}
+        for spec in specs:
+            filters = spec.get("filters") or {}
+            kind = spec.get("kind")
+            try:
+                if kind == "list":
+                    result = self._list_page(snap, filters, spec.get("cursor"))
+                elif kind == "stats":
+                    result = self._price_stats(snap, filters)
+                elif kind == "aggregate":
+                    group_by = spec.get("group_by")
+                    result = self._price_aggregates(
+                        snap,
+                        filters,
+                        group_by,
+                        self._aggregate_spec(
+                            group_by,
+                            spec.get("percentiles"),
+                            spec.get("histogram_bucket_size"),
+                        ),
+                        float(spec.get("histogram_start") or 0.0),
+                    )
+                else:
+                    raise ValueError(f"지원하지 않는 요청 종류입니다: {kind}")
+            except ValueError as exc:
+                result = {"error": str(exc)}
+            results[spec["id"]] = result
+        return {**results, **id_errors}
+
+    def _ordered_group_codes(self, values: np.ndarray) -> list:
+        """그룹 값을 SQLite 정렬 순서(NULL 먼저, 오름차순)로 반환한다."""
+        codes = np.unique(values)
+        if codes.dtype.kind == "f" and np.isnan(codes).any():
+            return [np.nan, *codes[~np.isnan(codes)].tolist()]
+        return codes.tolist()
+
+    def _group_mask(self, snap: _ColumnSnapshot, column: str, code: Any) -> np.ndarray:
+        """그룹 코드 값과 일치하는 행 마스크를 만든다(NaN 그룹 포함)."""
+        values = snap.columns[column]
+        if column not in _CATEGORY_COLUMNS and np.isnan(code):
+            return np.isnan(values)
+        return values == code
+
+    def _group_label(self, snap: _ColumnSnapshot, column: str, code: Any) -> Any:
+        """그룹 코드 값을 결과에 표시할 원래 값으로 바꾼다."""
+        if column in _CATEGORY_COLUMNS:
+            return snap.categories[column][code]
+        if np.isnan(code):
+            return None
+        return int(code)
+
+    def _ensure_loaded(self) -> _ColumnSnapshot:
+        """현재 적재 버전의 스냅샷을 반환한다. 버전이 바뀌었으면 다시 적재한다.
+
+        Returns:
+            _ColumnSnapshot: 조회 하나가 끝까지 사용할 스냅샷.
+        """
+        snap = self._snapshot
+        if snap.version == self._connection_provider.data_version:
+            return snap
+        with self._load_lock:
+            snap = self._snapshot
+            if snap.version != self._connection_provider.data_version:
+                snap = self._snapshot = self._load()
+        return snap
+
+    def _load(self) -> _ColumnSnapshot:
+        """houses 테이블을 (price, rowid) 순서로 정렬된 컬럼 배열 스냅샷으로 적재한다."""
+        version = self._connection_provider.data_version
+        query = f"SELECT rowid, {', '.join(HOUSING_COLUMNS)} FROM houses"
+        with self._connection_provider.connection() as connection:
+            rows = connection.execute(query).fetchall()
+
+        rowid = np.fromiter((row["rowid"] for row in rows), dtype=np.int64, count=len(rows))
+        columns: dict[str, np.ndarray] = {}
+        for column in (*_FLOAT_COLUMNS, *_INT_COLUMNS):
+            columns[column] = np.array(
+                [np.nan if row[column] is None else row[column] for row in rows],
+                dtype=np.float64,
+            )
+        categories: dict[str, tuple[str | None, ...]] = {}
+        for column in _CATEGORY_COLUMNS:
+            labels, codes = np.unique(
+                np.array([row[column] or "" for row in rows], dtype=object),
+                return_inverse=True,
+            )
+            categories[column] = tuple(label or None for label in labels)
+            columns[column] = codes.astype(np.int16)
+
+        # SQLite의 ORDER BY price, rowid와 같은 순서(NULL 가격이 먼저)로 정렬해 둔다.
+        price_key = np.where(np.isnan(columns["price"]), -np.inf, columns["price"])
+        order = np.lexsort((rowid, price_key))
+        snapshot = _ColumnSnapshot(
+            version=version,
+            rowid=rowid[order],
+            price_key=price_key[order],
+            columns={column: values[order] for column, values in columns.items()},
+            categories=categories,
+        )
+        # 여러 조회 스레드가 공유하므로 배열을 읽기 전용으로 잠근다.
+        for array in (snapshot.rowid, snapshot.price_key, *snapshot.columns.values()):
+            array.setflags(write=False)
+        return snapshot
+
+    def _mask(self, snap: _ColumnSnapshot, filters: dict) -> np.ndarray:
+        """필터 조건을 불리언 마스크로 만든다. NaN 비교는 False라 SQL NULL 규칙과 같다."""
+        price = snap.columns["price"]
+        area = snap.columns["area"]
+        mask = np.ones(price.shape, dtype=bool)
+        if filters.get("min_price") is not None:
+            mask &= price >= float(filters["min_price"])
+        if filters.get("max_price") is not None:
+            mask &= price <= float(filters["max_price"])
+        if filters.get("min_area") is not None:
+            mask &= area >= float(filters["min_area"])
+        if filters.get("max_area") is not None:
+            mask &= area <= float(filters["max_area"])
+        if filters.get("bedrooms") is not None:
+            mask &= snap.columns["bedrooms"] == float(filters["bedrooms"])
+        return mask
+
+    def _after_mask(self, snap: _ColumnSnapshot, after: tuple[float | None, int]) -> np.ndarray:
+        """정렬 순서상 (price, rowid) 이후 위치만 True인 마스크를 만든다."""
+        price, rowid = after
+        # NULL 가격은 정렬 키에서 -inf로 두었다.
+        price = -np.inf if price is None else price
+        start = np.searchsorted(snap.price_key, price, side="left")
+        end = np.searchsorted(snap.price_key, price, side="right")
+        start += np.searchsorted(snap.rowid[start:end], rowid, side="right")
+        mask = np.zeros(snap.rowid.shape, dtype=bool)
+        mask[start:] = True
+        return mask
+
+    def _position_to_house(self, snap: _ColumnSnapshot, position: int) -> dict:
+        """배열 위치의 값을 SQLite 조회 결과와 같은 형태의 딕셔너리로 만든다."""
+        house: dict[str, Any] = {}
+        for column in HOUSING_COLUMNS:
+            value = snap.columns[column][position]
+            if column in _CATEGORY_COLUMNS:
+                house[column] = snap.categories[column][value]
+            elif np.isnan(value):
+                house[column] = None
+            elif column in _INT_COLUMNS:
+                house[column] = int(value)
+            else:
+                house[column] = float(value)
+        return house
@@ -0,0 +1,158 @@
+# 목적: 비동기 주택 데이터 레포지토리를 정의한다.
+# 설명: HousingRepository와 같은 메서드를 async로 제공하고 SQLite 호출은 전용 스레드 풀에서 실행한다.
+# 디자인 패턴: 어댑터 패턴
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
+
+"""비동기 주택 데이터 레포지토리 모듈."""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import AsyncIterator, Iterator
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    HousingRepository,
+)
+from fourthsession.core.common.repository.sqlite.sqlite_executor import SqliteExecutor
+
+
+class AsyncHousingRepository:
+    """비동기 주택 데이터 레포지토리."""
+
+    def __init__(
+        self,
+        connection_provider: SqliteConnectionProvider | None = None,
+        executor: SqliteExecutor | None = None,
+    ) -> None:
+        """레포지토리를 초기화한다.
+
+        Args:
+            connection_provider (SqliteConnectionProvider | None): 연결 제공자.
+            executor (SqliteExecutor | None): SQLite 전용 실행기. 없으면 연결 풀 크기만큼의
+                스레드를 가진 실행기를 만든다.
+        """
+        provider = connection_provider or SqliteConnectionProvider()
+        self._repository = HousingRepository(provider)
+        self._executor = executor or SqliteExecutor(max_workers=provider.pool_size)
+
+    async def list_houses(self, filters: dict) -> list[dict]:
+        """필터 조건에 맞는 주택 목록을 조회한다.
+
+        Args:
+            filters (dict): 조회 조건.
+
+        Returns:
+            list[dict]: 주택 목록.
+        """
+        return await self._executor.run(self._repository.list_houses, filters)
+
+    async def list_houses_page(self, filters: dict, cursor: str | None = None) -> dict:
+        """키셋 기준으로 주택 목록 한 페이지를 조회한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            cursor (str | None): 직전 응답의 next_cursor.
+
+        Returns:
+            dict: items, count, next_cursor.
+        """
+        return await self._executor.run(self._repository.list_houses_page, filters, cursor)
+
+    async def iter_houses(self, filters: dict, fetch_size: int = 500) -> AsyncIterator[dict]:
+        """필터 조건에 맞는 주택을 fetch_size 단위로 읽으며 하나씩 반환한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            fetch_size (int): 스레드 풀 왕복 한 번에 읽을 행 수.
+
+        Yields:
+            dict: 주택 정보.
+        """
+        rows = self._repository.iter_houses(filters, fetch_size=fetch_size)
+        try:
+            while True:
+                batch = await self._executor.run(self._take, rows, fetch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield row
+        finally:
+            await self._executor.run(rows.close)
+
+    async def get_price_stats(self, filters: dict) -> dict:
+        """가격 통계 정보를 조회한다.
+
+        Args:
+            filters (dict): 통계 대상 조건.
+
+        Returns:
+            dict: 통계 결과.
+        """
+        return await self._executor.run(self._repository.get_price_stats, filters)
+
+    async def get_price_aggregates(
+        self,
+        filters: dict,
+        group_by: str | None = None,
+        percentiles: list[float] | None = None,
+        histogram_bucket_size: float | None = None,
+        histogram_start: float = 0.0,
+    ) -> dict:
+        """그룹별 가격 집계를 계산한다.
+
+        Args:
+            filters (dict): 집계 대상 조건.
+            group_by (str | None): 그룹 기준 컬럼.
+            percentiles (list[float] | None): 0~100 사이 백분위수 목록.
+            histogram_bucket_size (float | None): 히스토그램 구간 폭.
+            histogram_start (float): 히스토그램 첫 구간의 시작 값.
+
+        Returns:
+            dict: group_by, total_count, groups.
+        """
+        return await self._executor.run(
+            self._repository.get_price_aggregates,
+            filters,
+            group_by,
+            percentiles,
+            histogram_bucket_size,
+            histogram_start,
+        )
+
+    async def execute_batch(self, specs: list[dict]) -> dict:
+        """여러 조회/통계/집계 요청을 연결 하나로 실행한다.
+
+        Args:
+            specs (list[dict]): 요청 목록.
+
+        Returns:
+            dict: 요청 id별 결과.
+        """
+        return await self._executor.run(self._repository.execute_batch, specs)
+
+    async def explain_query_plan(self, filters: dict, kind: str = "list") -> dict:
+        """필터 조건으로 생성되는 쿼리의 실행 계획을 진단한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            kind (str): 진단 대상 쿼리 종류("list" 또는 "stats").
+
+        Returns:
+            dict: 실행 계획 진단 결과.
+        """
+        return await self._executor.run(self._repository.explain_query_plan, filters, kind)
+
+    async def check_query_plans(self) -> dict:
+        """대표 필터 조합의 실행 계획을 점검한다.
+
+        Returns:
+            dict: 점검 통과 여부와 조합별 진단 결과.
+        """
+        return await self._executor.run(self._repository.check_query_plans)
+
+    def _take(self, rows: Iterator[dict], size: int) -> list[dict]:
+        """제너레이터에서 최대 size개 행을 꺼낸다."""
+        return list(islice(rows, size))
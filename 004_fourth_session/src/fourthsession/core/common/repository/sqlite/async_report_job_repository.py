@@ -0,0 +1,101 @@
+# 목적: 비동기 리포트 작업 레포지토리를 정의한다.
+# 설명: ReportJobRepository와 같은 메서드를 async로 제공하고 SQLite 호출은 전용 스레드 풀에서 실행한다.
+# 디자인 패턴: 어댑터 패턴
+# 참조: fourthsession/core/common/repository/sqlite/report_job_repository.py
+
+"""비동기 리포트 작업 레포지토리 모듈."""
+
+from __future__ import annotations
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.report_job_repository import (
+    ReportJobRepository,
+)
+from fourthsession.core.common.repository.sqlite.sqlite_executor import SqliteExecutor
+
+
+class AsyncReportJobRepository:
+    """비동기 리포트 작업 레포지토리."""
+
+    def __init__(
+        self,
+        connection_provider: SqliteConnectionProvider | None = None,
+        executor: SqliteExecutor | None = None,
+    ) -> None:
+        """레포지토리를 초기화한다.
+
+        Args:
+            connection_provider (SqliteConnectionProvider | None): 연결 제공자.
+            executor (SqliteExecutor | None): SQLite 전용 실행기. 없으면 연결 풀 크기만큼의
+                스레드를 가진 실행기를 만든다. 넘겨받은 실행기는 close()에서 종료하지 않는다.
+        """
+        provider = connection_provider or SqliteConnectionProvider()
+        self._repository = ReportJobRepository(provider)
+        self._executor = executor or SqliteExecutor(max_workers=provider.pool_size)
+        self._owns_executor = executor is None
+
+    async def create_job(self, payload: dict) -> dict:
+        """리포트 작업을 생성한다.
+
+        Args:
+            payload (dict): 작업 생성 입력.
+
+        Returns:
+            dict: 생성된 작업 정보.
+        """
+        return await self._executor.run(self._repository.create_job, payload)
+
+    async def get_job_status(self, job_id: str) -> dict:
+        """작업 상태를 조회한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+
+        Returns:
+            dict: 작업 상태 정보.
+        """
+        return await self._executor.run(self._repository.get_job_status, job_id)
+
+    async def update_job_status(self, job_id: str, status: str) -> None:
+        """작업 상태를 갱신한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+            status (str): 변경할 상태.
+        """
+        await self._executor.run(self._repository.update_job_status, job_id, status)
+
+    async def get_status_history(self, job_id: str) -> list[dict]:
+        """작업의 상태 변경 이력을 오래된 순서로 조회한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+
+        Returns:
+            list[dict]: status, changed_at을 담은 이력 목록.
+        """
+        return await self._executor.run(self._repository.get_status_history, job_id)
+
+    async def flush(self) -> None:
+        """버퍼에 쌓인 상태 갱신과 이력을 기록한다."""
+        await self._executor.run(self._repository.flush)
+
+    def metrics(self) -> dict:
+        """쓰기 버퍼 지표를 반환한다.
+
+        메모리 값만 읽으므로 실행기를 거치지 않는다.
+
+        Returns:
+            dict: 버퍼 건수, 누적 갱신/병합/flush 건수, 마지막 flush 시간(ms).
+        """
+        return self._repository.metrics()
+
+    async def close(self) -> None:
+        """남은 버퍼를 기록하고 기록 스레드와 실행기를 정리한다."""
+        try:
+            await self._executor.run(self._repository.close)
+        finally:
+            if self._owns_executor:
+                self._executor.shutdown()
@@ -0,0 +1,132 @@
+# 목적: SQLite 연결 풀을 정의한다.
+# 설명: 미리 열어 둔 연결을 제한된 큐로 재사용하고 대여 지표를 기록한다.
+# 디자인 패턴: 오브젝트 풀 패턴
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
+
+"""SQLite 연결 풀 모듈."""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable
+
+
+class SqliteConnectionPool:
+    """제한된 크기의 SQLite 연결 풀."""
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        pool_size: int = 8,
+        timeout: float = 10.0,
+    ) -> None:
+        """연결 풀을 초기화한다.
+
+        Args:
+            factory (Callable[[], sqlite3.Connection]): 새 연결을 만드는 함수.
+            pool_size (int): 최대 연결 수.
+            timeout (float): 연결 대여 대기 한도(초).
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size는 1 이상이어야 합니다.")
+        self._factory = factory
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=pool_size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        """풀에서 연결을 대여한다.
+
+        Returns:
+            sqlite3.Connection: 대여한 연결.
+
+        Raises:
+            TimeoutError: 대기 한도 안에 연결을 얻지 못한 경우.
+        """
+        started = time.perf_counter()
+        connection = self._take_idle_or_create()
+        if connection is None:
+            try:
+                connection = self._idle.get(timeout=self._timeout)
+            except queue.Empty as exc:
+                raise TimeoutError("SQLite 연결 풀 대여 시간이 초과되었습니다.") from exc
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return connection
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        """대여한 연결을 풀에 반납한다.
+
+        Args:
+            connection (sqlite3.Connection): 반납할 연결.
+        """
+        if connection.in_transaction:
+            connection.rollback()
+        with self._lock:
+            self._in_use -= 1
+            closed = self._closed
+        if closed:
+            connection.close()
+            return
+        self._idle.put_nowait(connection)
+
+    def close(self) -> None:
+        """유휴 연결을 모두 닫고 풀을 종료한다."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def metrics(self) -> dict:
+        """풀 크기와 대여 지연 지표를 반환한다.
+
+        Returns:
+            dict: 풀 지표.
+        """
+        with self._lock:
+            average = self._wait_total / self._checkouts if self._checkouts else 0.0
+            return {
+                "pool_size": self._pool_size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "checkout_wait_avg_ms": round(average * 1000, 3),
+                "checkout_wait_max_ms": round(self._wait_max * 1000, 3),
+            }
+
+    def _take_idle_or_create(self) -> sqlite3.Connection | None:
+        """유휴 연결을 꺼내거나 여유가 있으면 새 연결을 만든다."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("이미 종료된 SQLite 연결 풀입니다.")
+            if self._created >= self._pool_size:
+                return None
+            self._created += 1
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
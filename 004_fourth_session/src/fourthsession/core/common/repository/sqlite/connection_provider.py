@@ -1,40 +1,256 @@
 # 목적: SQLite 연결 제공자를 정의한다.
 # 설명: DB 연결 생성과 관리 책임을 캡슐화한다.
 # 디자인 패턴: 팩토리 메서드 패턴
-# 참조: fourthsession/core/repository/sqlite/housing_repository.py
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
 
 """SQLite 연결 제공자 모듈."""
 
 import csv
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
+
+from fourthsession.core.common.repository.sqlite.connection_pool import (
+    SqliteConnectionPool,
+)
+from fourthsession.core.common.repository.sqlite.query_deadline import (
+    PROGRESS_HANDLER_INTERVAL,
+    deadline_exceeded,
+)
+
+# 연결마다 적용하는 PRAGMA 목록이다. journal_mode=WAL은 DB 파일에 유지된다.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 134217728",
+    "PRAGMA busy_timeout = 5000",
+)
+
+HOUSING_COLUMNS = (
+    "price",
+    "area",
+    "bedrooms",
+    "bathrooms",
+    "stories",
+    "mainroad",
+    "guestroom",
+    "basement",
+    "hotwaterheating",
+    "airconditioning",
+    "parking",
+    "prefarea",
+    "furnishingstatus",
+)
+
+
+def build_insert_query(table: str = "houses") -> str:
+    """HOUSING_COLUMNS 순서로 행을 넣는 INSERT 문을 만든다.
+
+    Args:
+        table (str): 대상 테이블 이름.
+
+    Returns:
+        str: INSERT 문.
+    """
+    return (
+        f"INSERT INTO {table} ({','.join(HOUSING_COLUMNS)}) "
+        f"VALUES ({','.join(['?'] * len(HOUSING_COLUMNS))})"
+    )
+
+
+INSERT_HOUSE_QUERY = build_insert_query()
+
+# 적재 버전을 프로세스 사이에서 공유하는 메타 테이블의 키다.
+DATA_VERSION_KEY = "data_version"
+
+# houses 조회 패턴(가격 정렬, 침실 동등 조건, 면적 범위)에 맞춘 인덱스 정의다.
+HOUSING_INDEXES = (
+    ("idx_houses_price", ("price",)),
+    ("idx_houses_bedrooms_price", ("bedrooms", "price")),
+    ("idx_houses_area_price", ("area", "price")),
+)
 
 
 class SqliteConnectionProvider:
     """SQLite 연결 제공자."""
 
-    def __init__(self, db_path: str | None = None, csv_path: str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: str | None = None,
+        csv_path: str | None = None,
+        pool_size: int = 8,
+        pool_timeout: float = 10.0,
+    ) -> None:
         """연결 제공자 설정을 초기화한다.
 
         Args:
             db_path (str | None): DB 파일 경로.
             csv_path (str | None): CSV 파일 경로.
+            pool_size (int): 연결 풀 최대 크기.
+            pool_timeout (float): 연결 대여 대기 한도(초).
         """
         self._db_path = Path(db_path) if db_path else self._resolve_db_path()
         self._csv_path = Path(csv_path) if csv_path else self._resolve_csv_path()
+        self._bootstrap_lock = threading.Lock()
+        self._bootstrapped = False
+        self._version_lock = threading.Lock()
+        self._version_connection: sqlite3.Connection | None = None
+        self._change_counter: int | None = None
+        self._data_version = 0
+        self._pool_size = pool_size
+        self._pool = SqliteConnectionPool(
+            self._open_connection,
+            pool_size=pool_size,
+            timeout=pool_timeout,
+        )
+
+    def get_connection(self, bootstrap: bool = True) -> sqlite3.Connection:
+        """풀과 무관한 새 SQLite 연결을 반환한다.
 
-    def get_connection(self) -> sqlite3.Connection:
-        """SQLite 연결을 반환한다.
+        스키마/CSV 초기화는 최초 1회만 수행한다. 반복 호출 경로에서는
+        `connection()`으로 풀 연결을 대여하는 편이 좋다.
+
+        Args:
+            bootstrap (bool): 스키마/CSV 초기화 수행 여부. 대량 적재처럼
+                호출 측이 스키마를 직접 관리할 때만 False로 둔다.
 
         Returns:
             sqlite3.Connection: 데이터베이스 연결 객체.
         """
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        connection = sqlite3.connect(self._db_path.as_posix())
+        if bootstrap:
+            self._ensure_bootstrapped()
+        else:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        return self._open_connection()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """풀에서 연결을 대여하고 블록이 끝나면 반납한다.
+
+        블록이 정상 종료되면 커밋하고, 예외가 나면 롤백한다.
+
+        Yields:
+            sqlite3.Connection: 대여한 연결.
+        """
+        self._ensure_bootstrapped()
+        connection = self._pool.acquire()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._pool.release(connection)
+
+    @property
+    def db_path(self) -> Path:
+        """DB 파일 경로를 반환한다."""
+        return self._db_path
+
+    @property
+    def csv_path(self) -> Path:
+        """기본 CSV 파일 경로를 반환한다."""
+        return self._csv_path
+
+    @property
+    def pool_size(self) -> int:
+        """연결 풀 최대 크기를 반환한다."""
+        return self._pool_size
+
+    @property
+    def data_version(self) -> int:
+        """houses 테이블 적재 버전을 반환한다.
+
+        CSV를 다시 적재할 때마다 증가하므로 조회 결과 캐시의 무효화 기준으로 쓴다.
+        버전은 DB의 housing_meta 테이블에 있어 CLI 적재기처럼 다른 프로세스가 올린
+        값도 보인다. 매번 읽지 않고 PRAGMA data_version으로 다른 연결의 커밋이
+        있었을 때만 다시 읽는다.
+        """
+        self._ensure_bootstrapped()
+        with self._version_lock:
+            if self._version_connection is None:
+                self._version_connection = self._open_connection()
+            change_counter = self._version_connection.execute("PRAGMA data_version").fetchone()[0]
+            if change_counter != self._change_counter:
+                row = self._version_connection.execute(
+                    "SELECT value FROM housing_meta WHERE key = ?",
+                    (DATA_VERSION_KEY,),
+                ).fetchone()
+                self._data_version = row["value"] if row else 0
+                self._change_counter = change_counter
+            return self._data_version
+
+    def bump_data_version(self, connection: sqlite3.Connection) -> None:
+        """호출 측 트랜잭션 안에서 공유 적재 버전을 올린다.
+
+        데이터 변경과 같은 트랜잭션에서 호출해야 다른 프로세스가 새 데이터와
+        새 버전을 함께 본다. 커밋은 호출 측이 한다.
+
+        Args:
+            connection (sqlite3.Connection): 데이터를 바꾸는 중인 연결.
+        """
+        connection.execute(
+            "UPDATE housing_meta SET value = value + 1 WHERE key = ?",
+            (DATA_VERSION_KEY,),
+        )
+
+    def reload_housing_data(self) -> None:
+        """houses 테이블을 비우고 CSV를 다시 적재한다."""
+        self._ensure_bootstrapped()
+        with self._bootstrap_lock:
+            with self.connection() as connection:
+                connection.execute("DELETE FROM houses")
+                self._load_csv(connection)
+                connection.execute("ANALYZE houses")
+                self.bump_data_version(connection)
+
+    def pool_metrics(self) -> dict:
+        """연결 풀 지표를 반환한다.
+
+        Returns:
+            dict: 풀 크기, 사용 중/유휴 연결 수, 대여 지연 지표.
+        """
+        return self._pool.metrics()
+
+    def close(self) -> None:
+        """풀에 보관된 연결과 버전 확인용 연결을 닫는다."""
+        self._pool.close()
+        with self._version_lock:
+            if self._version_connection is not None:
+                self._version_connection.close()
+                self._version_connection = None
+                self._change_counter = None
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """PRAGMA가 적용된 새 연결을 연다."""
+        connection = sqlite3.connect(
+            self._db_path.as_posix(),
+            check_same_thread=False,
+        )
         connection.row_factory = sqlite3.Row
-        self._initialize_housing_table(connection)
+        for pragma in _CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        # query_deadline 블록 안의 질의가 마감을 넘기면 중단한다.
+        connection.set_progress_handler(deadline_exceeded, PROGRESS_HANDLER_INTERVAL)
         return connection
 
+    def _ensure_bootstrapped(self) -> None:
+        """스키마 생성과 CSV 적재를 프로세스당 한 번만 수행한다."""
+        if self._bootstrapped:
+            return
+        with self._bootstrap_lock:
+            if self._bootstrapped:
+                return
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._open_connection()
+            try:
+                self._initialize_housing_table(connection)
+            finally:
+                connection.close()
+            self._bootstrapped = True
+
     def _resolve_db_path(self) -> Path:
         """프로젝트 루트의 기본 DB 경로를 계산한다."""
         project_root = self._find_project_root()
@@ -53,12 +269,35 @@ class SqliteConnectionProvider:
                 return parent.parent
         return current.parent
 
-    def _initialize_housing_table(self, connection: sqlite3.Connection) -> None:
-        """주택 테이블을 초기화하고 데이터가 없으면 CSV를 적재한다."""
-        cursor = connection.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS houses (
+    def ensure_housing_schema(self, connection: sqlite3.Connection) -> None:
+        """houses 테이블, HOUSING_INDEXES 인덱스, 적재 버전 메타 테이블이 없으면 생성한다.
+
+        Args:
+            connection (sqlite3.Connection): 대상 연결.
+        """
+        self.create_houses_table(connection)
+        for index_name, columns in HOUSING_INDEXES:
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON houses ({', '.join(columns)})"
+            )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS housing_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        connection.execute(
+            "INSERT OR IGNORE INTO housing_meta (key, value) VALUES (?, 0)",
+            (DATA_VERSION_KEY,),
+        )
+
+    def create_houses_table(self, connection: sqlite3.Connection, table: str = "houses") -> None:
+        """houses와 같은 컬럼 구성의 테이블을 인덱스 없이 만든다.
+
+        Args:
+            connection (sqlite3.Connection): 대상 연결.
+            table (str): 만들 테이블 이름. 적재용 스테이징 테이블에도 쓴다.
+        """
+        connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
                 price REAL,
                 area REAL,
                 bedrooms INTEGER,
@@ -75,25 +314,45 @@ class SqliteConnectionProvider:
             )
             """
         )
+
+    def _initialize_housing_table(self, connection: sqlite3.Connection) -> None:
+        """주택 테이블을 초기화하고 데이터가 없으면 CSV를 적재한다."""
+        self.ensure_housing_schema(connection)
+        cursor = connection.cursor()
         cursor.execute("SELECT COUNT(*) AS count FROM houses")
         count = cursor.fetchone()["count"]
         if count == 0:
             self._load_csv(connection)
+            cursor.execute("ANALYZE houses")
         connection.commit()
 
+    def iter_csv_rows(self, csv_path: Path | None = None) -> Iterator[tuple]:
+        """CSV 행을 HOUSING_COLUMNS 순서의 튜플로 하나씩 읽어 반환한다.
+
+        Args:
+            csv_path (Path | None): CSV 파일 경로. 없으면 기본 CSV를 사용한다.
+
+        Yields:
+            tuple: houses 테이블 적재용 행.
+        """
+        path = csv_path or self._csv_path
+        with path.open("r", encoding="utf-8", newline="") as csv_file:
+            for row in csv.DictReader(csv_file):
+                yield tuple(self._normalize_row(row).values())
+
+    def notify_data_changed(self) -> None:
+        """외부 적재로 houses 테이블이 바뀌었음을 알리고 공유 적재 버전을 올린다.
+
+        데이터를 바꾸는 트랜잭션에 묶을 수 있으면 bump_data_version을 쓴다.
+        """
+        with self.connection() as connection:
+            self.bump_data_version(connection)
+
     def _load_csv(self, connection: sqlite3.Connection) -> None:
         """CSV 데이터를 houses 테이블로 적재한다."""
         if not self._csv_path.exists():
             return
-        with self._csv_path.open("r", encoding="utf-8") as csv_file:
-            reader = csv.DictReader(csv_file)
-            rows = [self._normalize_row(row) for row in reader]
-        if not rows:
-            return
-        placeholders = ",".join(["?"] * len(rows[0]))
-        columns = ",".join(rows[0].keys())
-        query = f"INSERT INTO houses ({columns}) VALUES ({placeholders})"
-        connection.executemany(query, [tuple(row.values()) for row in rows])
+        connection.executemany(INSERT_HOUSE_QUERY, self.iter_csv_rows())
 
     def _normalize_row(self, row: dict) -> dict:
         """CSV 행을 SQLite 적재 형식으로 변환한다."""
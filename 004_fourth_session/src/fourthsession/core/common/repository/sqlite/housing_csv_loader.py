@@ -0,0 +1,240 @@
+# 목적: 주택 CSV 대량 적재기를 정의한다.
+# 설명: 대용량 CSV를 스테이징 테이블에 배치 적재하고 한 트랜잭션으로 교체하며, 체크포인트로 재개를 지원한다.
+# 디자인 패턴: 파이프라인 패턴
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
+
+"""주택 CSV 스트리밍 적재 모듈."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sqlite3
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+    build_insert_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# 적재 중인 행을 담는 테이블. 서버는 교체가 끝날 때까지 기존 houses를 읽는다.
+STAGING_TABLE = "houses_staging"
+
+
+class HousingCsvLoader:
+    """주택 CSV 스트리밍 적재기."""
+
+    def __init__(
+        self,
+        connection_provider: SqliteConnectionProvider | None = None,
+        batch_size: int = 5000,
+        batches_per_commit: int = 20,
+        checkpoint_path: str | None = None,
+        progress_callback: Callable[[dict], None] | None = None,
+    ) -> None:
+        """적재기를 초기화한다.
+
+        Args:
+            connection_provider (SqliteConnectionProvider | None): 연결 제공자.
+            batch_size (int): executemany 한 번에 넣을 행 수.
+            batches_per_commit (int): 한 트랜잭션(체크포인트 구간)에 담을 배치 수.
+            checkpoint_path (str | None): 체크포인트 파일 경로.
+            progress_callback (Callable[[dict], None] | None): 커밋마다 호출할 진행 콜백.
+        """
+        if batch_size < 1 or batches_per_commit < 1:
+            raise ValueError("batch_size와 batches_per_commit은 1 이상이어야 합니다.")
+        self._connection_provider = connection_provider or SqliteConnectionProvider()
+        self._batch_size = batch_size
+        self._batches_per_commit = batches_per_commit
+        self._checkpoint_path = (
+            Path(checkpoint_path)
+            if checkpoint_path
+            else self._connection_provider.db_path.with_suffix(".load.json")
+        )
+        self._progress_callback = progress_callback or self._log_progress
+        self._insert_query = build_insert_query(STAGING_TABLE)
+
+    def load(self, csv_path: str | None = None, resume: bool = True) -> dict:
+        """CSV를 houses 테이블로 적재한다.
+
+        행은 인덱스 없는 스테이징 테이블에 넣고, 다 넣은 뒤 한 트랜잭션에서
+        houses를 스테이징 테이블로 바꾸고 인덱스/통계/적재 버전을 갱신한다.
+        실행 중인 서버는 교체가 커밋될 때까지 기존 houses를 그대로 읽는다.
+        같은 CSV에 대한 체크포인트가 있고 resume이 True면 스테이징 테이블의
+        마지막 커밋 지점부터 이어서 적재한다.
+
+        Args:
+            csv_path (str | None): CSV 파일 경로. 없으면 기본 CSV를 사용한다.
+            resume (bool): 체크포인트 재개 여부.
+
+        Returns:
+            dict: 적재 결과 요약.
+        """
+        source = Path(csv_path) if csv_path else self._connection_provider.csv_path
+        if not source.exists():
+            raise FileNotFoundError(f"CSV 파일이 없습니다: {source}")
+        fingerprint = self._fingerprint(source)
+        checkpoint = self._read_checkpoint() if resume else None
+        skip = 0
+        if checkpoint and checkpoint.get("fingerprint") == fingerprint:
+            skip = int(checkpoint.get("rows_committed", 0))
+
+        started = time.perf_counter()
+        connection = self._connection_provider.get_connection(bootstrap=False)
+        try:
+            self._connection_provider.ensure_housing_schema(connection)
+            if skip and self._staged_rows(connection) != skip:
+                # 스테이징 테이블이 체크포인트와 맞지 않으면 처음부터 적재한다.
+                skip = 0
+            if skip == 0:
+                connection.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+                self._connection_provider.create_houses_table(connection, STAGING_TABLE)
+            connection.commit()
+            # 적재 구간에서만 내구성을 낮춰 fsync 비용을 줄인다.
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute("PRAGMA cache_size = -262144")
+
+            rows_committed = skip
+            rows = islice(self._connection_provider.iter_csv_rows(source), skip, None)
+            for segment_rows in self._segments(rows, connection):
+                rows_committed += segment_rows
+                connection.commit()
+                self._write_checkpoint(fingerprint, rows_committed)
+                self._progress_callback(
+                    {
+                        "rows_committed": rows_committed,
+                        "elapsed_seconds": round(time.perf_counter() - started, 3),
+                    }
+                )
+
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self._swap_in_staging(connection)
+        finally:
+            connection.close()
+
+        self._checkpoint_path.unlink(missing_ok=True)
+        return {
+            "csv_path": source.as_posix(),
+            "db_path": self._connection_provider.db_path.as_posix(),
+            "rows_skipped": skip,
+            "rows_loaded": rows_committed - skip,
+            "rows_total": rows_committed,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def _segments(
+        self,
+        rows: Iterator[tuple],
+        connection: sqlite3.Connection,
+    ) -> Iterator[int]:
+        """배치 단위로 INSERT하고 커밋 구간마다 적재 행 수를 반환한다."""
+        segment_rows = 0
+        batches = 0
+        while True:
+            batch = list(islice(rows, self._batch_size))
+            if not batch:
+                break
+            connection.executemany(self._insert_query, batch)
+            segment_rows += len(batch)
+            batches += 1
+            if batches == self._batches_per_commit:
+                yield segment_rows
+                segment_rows = 0
+                batches = 0
+        if segment_rows:
+            yield segment_rows
+
+    def _staged_rows(self, connection: sqlite3.Connection) -> int | None:
+        """스테이징 테이블의 행 수를 반환한다. 테이블이 없으면 None."""
+        exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (STAGING_TABLE,),
+        ).fetchone()
+        if exists is None:
+            return None
+        return connection.execute(f"SELECT COUNT(*) FROM {STAGING_TABLE}").fetchone()[0]
+
+    def _swap_in_staging(self, connection: sqlite3.Connection) -> None:
+        """한 트랜잭션에서 houses를 스테이징 테이블로 바꾼다.
+
+        인덱스 생성, 통계 갱신, 적재 버전 증가도 같은 트랜잭션에 담아 다른
+        프로세스는 교체 전 상태나 인덱스까지 갖춘 교체 후 상태만 본다.
+        """
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DROP TABLE houses")
+            connection.execute(f"ALTER TABLE {STAGING_TABLE} RENAME TO houses")
+            self._connection_provider.ensure_housing_schema(connection)
+            connection.execute("ANALYZE houses")
+            self._connection_provider.bump_data_version(connection)
+        except Exception:
+            connection.rollback()
+            raise
+        connection.commit()
+
+    def _fingerprint(self, source: Path) -> dict:
+        """CSV 파일 변경 여부를 판단할 식별 정보를 만든다."""
+        stat = source.stat()
+        return {
+            "path": source.resolve().as_posix(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def _read_checkpoint(self) -> dict | None:
+        """체크포인트 파일을 읽는다."""
+        if not self._checkpoint_path.exists():
+            return None
+        try:
+            return json.loads(self._checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_checkpoint(self, fingerprint: dict, rows_committed: int) -> None:
+        """커밋된 행 수를 체크포인트 파일에 기록한다."""
+        temp_path = self._checkpoint_path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps({"fingerprint": fingerprint, "rows_committed": rows_committed}),
+            encoding="utf-8",
+        )
+        temp_path.replace(self._checkpoint_path)
+
+    def _log_progress(self, progress: dict) -> None:
+        """기본 진행 콜백으로 적재 진행 상황을 로그에 남긴다."""
+        logger.info(
+            "housing csv load: %s rows committed (%.1fs)",
+            progress["rows_committed"],
+            progress["elapsed_seconds"],
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CSV 대량 적재 CLI 진입점."""
+    parser = argparse.ArgumentParser(description="주택 CSV를 SQLite로 스트리밍 적재한다.")
+    parser.add_argument("--csv", dest="csv_path", default=None, help="CSV 파일 경로")
+    parser.add_argument("--db", dest="db_path", default=None, help="SQLite DB 파일 경로")
+    parser.add_argument("--batch-size", type=int, default=5000, help="배치당 행 수")
+    parser.add_argument("--batches-per-commit", type=int, default=20, help="커밋당 배치 수")
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 파일 경로")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트를 무시하고 처음부터 적재")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    loader = HousingCsvLoader(
+        SqliteConnectionProvider(db_path=args.db_path, csv_path=args.csv_path),
+        batch_size=args.batch_size,
+        batches_per_commit=args.batches_per_commit,
+        checkpoint_path=args.checkpoint,
+    )
+    summary = loader.load(resume=not args.no_resume)
+    logger.info(json.dumps(summary, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,72 @@
 # 목적: 주택 데이터 조회/통계 레포지토리를 정의한다.
 # 설명: SQLite 기반의 주택 데이터 접근을 책임진다.
 # 디자인 패턴: 리포지토리 패턴
-# 참조: fourthsession/core/repository/sqlite/connection_provider.py
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
 
 """주택 데이터 레포지토리 모듈."""
 
 from __future__ import annotations
 
-from statistics import mean, median
-from typing import Any
+import base64
+import binascii
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator
 
-from fourthsession.core.repository.sqlite.connection_provider import (
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    HOUSING_COLUMNS,
     SqliteConnectionProvider,
 )
 
 
+_FILTER_KEYS = ("min_price", "max_price", "min_area", "max_area", "bedrooms")
+
+# 집계 group_by로 허용하는 컬럼(범주형/소수 정수형)이다.
+GROUPABLE_COLUMNS = (
+    "bedrooms",
+    "bathrooms",
+    "stories",
+    "parking",
+    "mainroad",
+    "guestroom",
+    "basement",
+    "hotwaterheating",
+    "airconditioning",
+    "prefarea",
+    "furnishingstatus",
+)
+DEFAULT_PERCENTILES = (25.0, 50.0, 75.0)
+# 목록 조회 limit 허용 범위다. housing_list_tool 입력 스키마와 같다.
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+
+
 class HousingRepository:
     """주택 데이터 레포지토리."""
 
-    def __init__(self, connection_provider: SqliteConnectionProvider | None = None) -> None:
+    def __init__(
+        self,
+        connection_provider: SqliteConnectionProvider | None = None,
+        stats_cache_size: int = 256,
+    ) -> None:
         """레포지토리를 초기화한다.
 
         Args:
             connection_provider (SqliteConnectionProvider | None): 연결 제공자.
+            stats_cache_size (int): 가격 통계 캐시 최대 항목 수.
         """
         self._connection_provider = connection_provider or SqliteConnectionProvider()
+        self._stats_cache: OrderedDict[tuple, tuple[int, dict]] = OrderedDict()
+        self._stats_cache_size = stats_cache_size
+        self._stats_cache_lock = threading.Lock()
+
+    @property
+    def data_version(self) -> int:
+        """주택 데이터 버전을 반환한다. 재적재될 때마다 증가한다."""
+        return self._connection_provider.data_version
 
     def list_houses(self, filters: dict) -> list[dict]:
         """필터 조건에 맞는 주택 목록을 조회한다.
@@ -34,11 +76,152 @@ class HousingRepository:
 
         Returns:
             list[dict]: 주택 목록.
+
+        Raises:
+            ValueError: limit가 1~MAX_PAGE_SIZE 사이 정수가 아닌 경우.
+        """
+        query, params = self._build_list_query({**filters, "limit": self._page_size(filters)})
+        with self._connection_provider.connection() as connection:
+            cursor = connection.execute(query, params)
+            rows = cursor.fetchall()
+        return [self._row_to_house(row) for row in rows]
+
+    def list_houses_page(self, filters: dict, cursor: str | None = None) -> dict:
+        """키셋(price, rowid) 기준으로 주택 목록 한 페이지를 조회한다.
+
+        OFFSET 없이 직전 페이지의 마지막 (price, rowid) 다음부터 읽으므로
+        페이지가 깊어져도 조회 비용이 일정하다.
+
+        Args:
+            filters (dict): 조회 조건. limit는 페이지 크기로 사용한다.
+            cursor (str | None): 직전 응답의 next_cursor.
+
+        Returns:
+            dict: items, count, next_cursor(마지막 페이지면 None).
+
+        Raises:
+            ValueError: 커서가 손상되었거나 다른 필터 조건으로 발급된 경우,
+                limit가 1~MAX_PAGE_SIZE 사이 정수가 아닌 경우.
+        """
+        with self._connection_provider.connection() as connection:
+            return self._fetch_page(connection, filters, cursor)
+
+    def iter_houses(self, filters: dict, fetch_size: int = 500) -> Iterator[dict]:
+        """필터 조건에 맞는 주택을 fetchmany로 나눠 읽으며 하나씩 반환한다.
+
+        제너레이터가 끝나거나 닫힐 때까지 풀 연결 하나를 점유한다.
+        filters의 limit가 없으면 조건에 맞는 전체 행을 순회한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            fetch_size (int): fetchmany 한 번에 읽을 행 수.
+
+        Yields:
+            dict: 주택 정보.
+
+        Raises:
+            ValueError: limit가 1 이상 정수가 아닌 경우.
+        """
+        if filters.get("limit") is not None:
+            filters = {**filters, "limit": self._page_size(filters, maximum=None)}
+        query, params = self._build_list_query(filters, paginate=filters.get("limit") is not None)
+        with self._connection_provider.connection() as connection:
+            cursor = connection.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_house(row)
+
+    def explain_query_plan(self, filters: dict, kind: str = "list") -> dict:
+        """필터 조건으로 생성되는 쿼리의 실행 계획을 진단한다.
+
+        Args:
+            filters (dict): 조회 조건.
+            kind (str): 진단 대상 쿼리 종류("list" 또는 "stats").
+
+        Returns:
+            dict: 실행 계획 상세와 인덱스 사용/전체 스캔/임시 정렬 여부.
+        """
+        if kind == "list":
+            query, params = self._build_list_query(filters)
+        elif kind == "stats":
+            where_clause, params = self._build_filters(filters)
+            query = f"SELECT COUNT(price), AVG(price) FROM houses {where_clause}"
+        else:
+            raise ValueError(f"지원하지 않는 쿼리 종류입니다: {kind}")
+        with self._connection_provider.connection() as connection:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        details = [row["detail"] for row in rows]
+        full_scan = any(
+            detail.startswith("SCAN") and "USING" not in detail for detail in details
+        )
+        return {
+            "kind": kind,
+            "filters": self._normalize_filter_key(filters),
+            "details": details,
+            "uses_index": any("USING" in detail and "INDEX" in detail for detail in details),
+            "full_scan": full_scan,
+            "temp_sort": any("USE TEMP B-TREE" in detail for detail in details),
+        }
+
+    def check_query_plans(self) -> dict:
+        """대표 필터 조합의 실행 계획을 점검한다.
+
+        목록 조회가 인덱스 없이 전체 스캔으로 떨어지지 않는지 확인하는
+        자가 진단용 메서드다. 면적 범위 조건처럼 가격 정렬용 임시 정렬이
+        불가피한 경우는 temp_sort로만 보고한다.
+
+        Returns:
+            dict: 점검 통과 여부와 조합별 진단 결과.
+        """
+        samples = [
+            {},
+            {"max_price": 5000000},
+            {"min_price": 3000000, "max_price": 6000000},
+            {"bedrooms": 3},
+            {"bedrooms": 3, "max_price": 5000000},
+            {"min_area": 4000, "max_area": 8000},
+        ]
+        reports = []
+        for sample in samples:
+            report = self.explain_query_plan(sample)
+            report["ok"] = report["uses_index"] and not report["full_scan"]
+            reports.append(report)
+        return {
+            "ok": all(report["ok"] for report in reports),
+            "reports": reports,
+        }
+
+    def _build_list_query(
+        self,
+        filters: dict,
+        after: tuple[float | None, int] | None = None,
+        paginate: bool = True,
+    ) -> tuple[str, list[Any]]:
+        """목록 조회 SQL과 파라미터를 생성한다.
+
+        after가 있으면 해당 (price, rowid) 이후 행만 조회하는 키셋 조건을 붙인다.
+        NULL 가격은 정렬상 맨 앞이므로 after의 가격이 None이면 남은 NULL 가격 행과
+        가격이 있는 모든 행이 이후 행이다.
         """
         where_clause, params = self._build_filters(filters)
-        limit = int(filters.get("limit", 10))
+        if after is not None:
+            price, rowid = after
+            if price is None:
+                keyset_clause = "((price IS NULL AND rowid > ?) OR price IS NOT NULL)"
+                keyset_params = [rowid]
+            else:
+                keyset_clause = "price IS NOT NULL AND (price, rowid) > (?, ?)"
+                keyset_params = [price, rowid]
+            where_clause = (
+                f"{where_clause} AND {keyset_clause}" if where_clause else f"WHERE {keyset_clause}"
+            )
+            params.extend(keyset_params)
         query = f"""
             SELECT
+                rowid,
                 price,
                 area,
                 bedrooms,
@@ -54,30 +237,358 @@ class HousingRepository:
                 furnishingstatus
             FROM houses
             {where_clause}
-            ORDER BY price ASC
-            LIMIT ?
+            ORDER BY price ASC, rowid ASC
         """
-        params.append(limit)
-        with self._connection_provider.get_connection() as connection:
-            cursor = connection.execute(query, params)
-            rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        if paginate:
+            query += "LIMIT ?"
+            params.append(int(filters.get("limit", 10)))
+        return query, params
+
+    def _split_batch_specs(self, specs: list[dict]) -> tuple[list[dict], dict[Any, dict]]:
+        """execute_batch 요청을 id가 올바른 요청과 id별 오류로 나눈다.
+
+        결과를 id로 묶어 반환하므로 id가 없거나 겹치면 다른 요청의 결과를 덮어쓴다.
+        그런 요청은 실행하지 않는다. 겹친 id는 그 id의 오류로, id가 없거나 문자열/정수가
+        아닌 요청은 None 키의 오류 하나로 모은다.
+
+        Args:
+            specs (list[dict]): 요청 목록.
+
+        Returns:
+            tuple[list[dict], dict[Any, dict]]: 실행할 요청 목록, id별 오류 결과.
+        """
+        counts: dict[Any, int] = {}
+        identified: list[dict] = []
+        invalid = 0
+        for spec in specs:
+            spec_id = spec.get("id")
+            if isinstance(spec_id, bool) or not isinstance(spec_id, (str, int)):
+                invalid += 1
+                continue
+            counts[spec_id] = counts.get(spec_id, 0) + 1
+            identified.append(spec)
+        errors: dict[Any, dict] = {
+            spec_id: {"error": f"요청 id가 {count}번 겹칩니다: {spec_id}"}
+            for spec_id, count in counts.items()
+            if count > 1
+        }
+        if invalid:
+            errors[None] = {"error": f"id가 없거나 문자열/정수가 아닌 요청 {invalid}건은 실행하지 않았습니다."}
+        return [spec for spec in identified if counts[spec["id"]] == 1], errors
+
+    def _page_size(self, filters: dict, maximum: int | None = MAX_PAGE_SIZE) -> int:
+        """filters의 limit를 검사해 돌려줄 행 수로 반환한다.
+
+        SQLite는 음수 LIMIT을 제한 없음으로 보므로 Tool 스키마를 거치지 않는
+        호출도 여기서 막는다.
+
+        Args:
+            filters (dict): 조회 조건. limit가 없으면 DEFAULT_PAGE_SIZE를 쓴다.
+            maximum (int | None): 허용하는 최대 행 수. None이면 상한을 두지 않는다.
+
+        Returns:
+            int: 행 수.
+
+        Raises:
+            ValueError: limit가 허용 범위의 정수가 아닌 경우.
+        """
+        limit = filters.get("limit", DEFAULT_PAGE_SIZE)
+        if (
+            isinstance(limit, bool)
+            or not isinstance(limit, int)
+            or limit < 1
+            or (maximum is not None and limit > maximum)
+        ):
+            allowed = f"1~{maximum} 사이 정수" if maximum is not None else "1 이상 정수"
+            raise ValueError(f"limit는 {allowed}여야 합니다: {limit!r}")
+        return limit
+
+    def _row_to_house(self, row: Any) -> dict:
+        """조회 행에서 내부 rowid를 제외한 주택 정보를 만든다."""
+        return {column: row[column] for column in HOUSING_COLUMNS}
+
+    def _filter_digest(self, filters: dict) -> str:
+        """커서를 발급한 필터 조건을 식별하는 짧은 해시를 만든다."""
+        return hashlib.sha1(repr(self._normalize_filter_key(filters)).encode()).hexdigest()[:12]
+
+    def _encode_cursor(self, price: float | None, rowid: int, filter_digest: str) -> str:
+        """키셋 위치를 불투명한 커서 문자열로 인코딩한다. NULL 가격은 JSON null로 남긴다."""
+        raw = json.dumps({"p": price, "r": rowid, "f": filter_digest}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def _decode_cursor(self, cursor: str, filter_digest: str) -> tuple[float | None, int]:
+        """커서 문자열을 키셋 위치로 디코딩한다. 가격이 null이면 None으로 돌려준다."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            price = None if data["p"] is None else float(data["p"])
+            position = (price, int(data["r"]))
+        except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+            raise ValueError("유효하지 않은 커서입니다.") from exc
+        if data.get("f") != filter_digest:
+            raise ValueError("커서가 현재 필터 조건과 일치하지 않습니다.")
+        return position
 
     def get_price_stats(self, filters: dict) -> dict:
         """가격 통계 정보를 조회한다.
 
+        집계는 SQL에서 수행하고, 결과는 정규화한 필터 키 단위로 캐시한다.
+        캐시는 테이블이 다시 적재되면(data_version 변경) 무효화된다.
+
         Args:
             filters (dict): 통계 대상 조건.
 
         Returns:
             dict: 통계 결과.
         """
-        where_clause, params = self._build_filters(filters)
-        query = f"SELECT price FROM houses {where_clause}"
-        with self._connection_provider.get_connection() as connection:
-            cursor = connection.execute(query, params)
-            prices = [row["price"] for row in cursor.fetchall() if row["price"] is not None]
-        if not prices:
+        cache_key = self._normalize_filter_key(filters)
+        data_version = self._connection_provider.data_version
+        cached = self._get_cached_stats(cache_key, data_version)
+        if cached is not None:
+            return cached
+        with self._connection_provider.connection() as connection:
+            stats = self._query_price_stats(connection, [filters])[0]
+        self._put_cached_stats(cache_key, data_version, stats)
+        return dict(stats)
+
+    def execute_batch(self, specs: list[dict]) -> dict:
+        """여러 조회/통계/집계 요청을 연결 하나, 읽기 트랜잭션 하나로 실행한다.
+
+        모든 요청은 같은 스냅샷을 보며, 통계 요청의 count/평균/최소/최대는
+        UNION ALL 단일 문장으로 한 번에 계산한다. 요청별 검증 오류는 전체를
+        실패시키지 않고 해당 결과의 error로 반환한다.
+
+        Args:
+            specs (list[dict]): 요청 목록. 각 요청은 id, kind("list"/"stats"/"aggregate"),
+                filters를 가지며 list는 cursor, aggregate는 group_by/percentiles/
+                histogram_bucket_size/histogram_start를 추가로 가질 수 있다.
+                id는 요청마다 다른 문자열이나 정수여야 한다.
+
+        Returns:
+            dict: 요청 id별 결과. id가 없거나 겹치는 요청은 실행하지 않고 오류로 반환한다.
+        """
+        specs, id_errors = self._split_batch_specs(specs)
+        results: dict[Any, dict] = {}
+        data_version = self._connection_provider.data_version
+        pending_stats: list[tuple[Any, tuple, dict]] = []
+        with self._connection_provider.connection() as connection:
+            connection.execute("BEGIN")
+            for spec in specs:
+                spec_id = spec.get("id")
+                filters = spec.get("filters") or {}
+                kind = spec.get("kind")
+                try:
+                    if kind == "list":
+                        results[spec_id] = self._fetch_page(connection, filters, spec.get("cursor"))
+                    elif kind == "aggregate":
+                        results[spec_id] = self._aggregate_on(connection, filters, spec)
+                    elif kind == "stats":
+                        cache_key = self._normalize_filter_key(filters)
+                        cached = self._get_cached_stats(cache_key, data_version)
+                        if cached is not None:
+                            results[spec_id] = cached
+                        else:
+                            pending_stats.append((spec_id, cache_key, filters))
+                    else:
+                        raise ValueError(f"지원하지 않는 요청 종류입니다: {kind}")
+                except ValueError as exc:
+                    results[spec_id] = {"error": str(exc)}
+            if pending_stats:
+                computed = self._query_price_stats(
+                    connection,
+                    [filters for _, _, filters in pending_stats],
+                )
+                for (spec_id, cache_key, _), stats in zip(pending_stats, computed):
+                    self._put_cached_stats(cache_key, data_version, stats)
+                    results[spec_id] = dict(stats)
+        return {**{spec["id"]: results[spec["id"]] for spec in specs}, **id_errors}
+
+    def get_price_aggregates(
+        self,
+        filters: dict,
+        group_by: str | None = None,
+        percentiles: list[float] | None = None,
+        histogram_bucket_size: float | None = None,
+        histogram_start: float = 0.0,
+    ) -> dict:
+        """그룹별 가격 집계(요약 통계, 백분위수, 고정 구간 히스토그램)를 계산한다.
+
+        (그룹, 가격) 순으로 정렬된 단일 쿼리를 한 번 순회하며 모든 그룹을 계산하고,
+        메모리에는 현재 그룹의 가격만 유지한다.
+
+        Args:
+            filters (dict): 집계 대상 조건.
+            group_by (str | None): 그룹 기준 컬럼. None이면 전체를 하나의 그룹으로 본다.
+            percentiles (list[float] | None): 0~100 사이 백분위수 목록.
+            histogram_bucket_size (float | None): 히스토그램 구간 폭. None이면 생략한다.
+            histogram_start (float): 히스토그램 첫 구간의 시작 값.
+
+        Returns:
+            dict: group_by, total_count, groups.
+        """
+        with self._connection_provider.connection() as connection:
+            return self._aggregate_on(
+                connection,
+                filters,
+                {
+                    "group_by": group_by,
+                    "percentiles": percentiles,
+                    "histogram_bucket_size": histogram_bucket_size,
+                    "histogram_start": histogram_start,
+                },
+            )
+
+    def _aggregate_on(self, connection: sqlite3.Connection, filters: dict, options: dict) -> dict:
+        """주어진 연결에서 그룹별 가격 집계를 계산한다."""
+        group_by = options.get("group_by")
+        histogram_start = float(options.get("histogram_start") or 0.0)
+        spec = self._aggregate_spec(
+            group_by,
+            options.get("percentiles"),
+            options.get("histogram_bucket_size"),
+        )
+        where_clause, params = self._build_price_filters(filters)
+        group_expr = group_by or "NULL"
+        query = f"""
+            SELECT {group_expr} AS group_key, price
+            FROM houses
+            {where_clause}
+            ORDER BY group_key ASC, price ASC
+        """
+        groups: list[dict] = []
+        current_key: Any = None
+        prices: list[float] = []
+        cursor = connection.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for row in rows:
+                if prices and row["group_key"] != current_key:
+                    groups.append(
+                        self._summarize_group(current_key, prices, spec, histogram_start)
+                    )
+                    prices = []
+                current_key = row["group_key"]
+                prices.append(row["price"])
+        if prices:
+            groups.append(self._summarize_group(current_key, prices, spec, histogram_start))
+        return {
+            "group_by": group_by,
+            "total_count": sum(group["count"] for group in groups),
+            "groups": groups,
+        }
+
+    def _aggregate_spec(
+        self,
+        group_by: str | None,
+        percentiles: list[float] | None,
+        histogram_bucket_size: float | None,
+    ) -> dict:
+        """집계 옵션을 검증하고 정규화한다."""
+        if group_by is not None and group_by not in GROUPABLE_COLUMNS:
+            raise ValueError(f"group_by로 사용할 수 없는 컬럼입니다: {group_by}")
+        values = [float(value) for value in (percentiles or DEFAULT_PERCENTILES)]
+        if any(value < 0 or value > 100 for value in values):
+            raise ValueError("percentiles는 0~100 사이여야 합니다.")
+        if histogram_bucket_size is not None and histogram_bucket_size <= 0:
+            raise ValueError("histogram_bucket_size는 0보다 커야 합니다.")
+        return {"percentiles": values, "bucket_size": histogram_bucket_size}
+
+    def _summarize_group(
+        self,
+        key: Any,
+        prices: list[float],
+        spec: dict,
+        histogram_start: float,
+    ) -> dict:
+        """정렬된 그룹 가격 목록으로 요약 통계를 만든다."""
+        count = len(prices)
+        summary = {
+            "key": key,
+            "count": count,
+            "average": round(sum(prices) / count, 2),
+            "min": round(prices[0], 2),
+            "max": round(prices[-1], 2),
+            "percentiles": {
+                self._percentile_label(value): round(self._interpolate(prices, value), 2)
+                for value in spec["percentiles"]
+            },
+        }
+        bucket_size = spec["bucket_size"]
+        if bucket_size is not None:
+            buckets: dict[int, int] = {}
+            for price in prices:
+                index = int((price - histogram_start) // bucket_size)
+                buckets[index] = buckets.get(index, 0) + 1
+            summary["histogram"] = self._histogram_items(buckets, bucket_size, histogram_start)
+        return summary
+
+    def _interpolate(self, sorted_values: list[float], percentile: float) -> float:
+        """선형 보간으로 백분위수를 계산한다(numpy 기본 방식과 동일)."""
+        position = (len(sorted_values) - 1) * percentile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        fraction = position - lower
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+    def _percentile_label(self, percentile: float) -> str:
+        """백분위수 값을 결과 키(p25, p99.5 등)로 바꾼다."""
+        return f"p{percentile:g}"
+
+    def _histogram_items(
+        self,
+        buckets: dict[int, int],
+        bucket_size: float,
+        histogram_start: float,
+    ) -> list[dict]:
+        """구간 번호별 개수를 하한/상한이 있는 히스토그램 항목으로 바꾼다."""
+        return [
+            {
+                "lower": round(histogram_start + index * bucket_size, 2),
+                "upper": round(histogram_start + (index + 1) * bucket_size, 2),
+                "count": buckets[index],
+            }
+            for index in sorted(buckets)
+        ]
+
+    def _query_price_stats(
+        self,
+        connection: sqlite3.Connection,
+        filters_list: list[dict],
+    ) -> list[dict]:
+        """SQL 집계로 count/평균/최소/최대를 구하고 정렬 조회로 중앙값을 구한다.
+
+        여러 필터의 집계는 UNION ALL 한 문장으로 계산한다.
+        """
+        selects: list[str] = []
+        params: list[Any] = []
+        for index, filters in enumerate(filters_list):
+            where_clause, where_params = self._build_price_filters(filters)
+            selects.append(
+                f"""
+                SELECT
+                    {index} AS spec_index,
+                    COUNT(price) AS count,
+                    AVG(price) AS average,
+                    MIN(price) AS min,
+                    MAX(price) AS max
+                FROM houses
+                {where_clause}
+                """
+            )
+            params.extend(where_params)
+        rows = connection.execute(" UNION ALL ".join(selects), params).fetchall()
+        by_index = {row["spec_index"]: row for row in rows}
+        return [
+            self._stats_from_row(connection, filters, by_index[index])
+            for index, filters in enumerate(filters_list)
+        ]
+
+    def _stats_from_row(self, connection: sqlite3.Connection, filters: dict, row: Any) -> dict:
+        """집계 행과 중앙값 조회로 통계 결과를 만든다."""
+        count = row["count"]
+        if not count:
             return {
                 "count": 0,
                 "average": None,
@@ -85,14 +596,85 @@ class HousingRepository:
                 "min": None,
                 "max": None,
             }
+        # 가운데 1개(홀수) 또는 2개(짝수)만 정렬 순서로 읽어 중앙값을 구한다.
+        where_clause, params = self._build_price_filters(filters)
+        median_query = f"""
+            SELECT price
+            FROM houses
+            {where_clause}
+            ORDER BY price ASC
+            LIMIT ? OFFSET ?
+        """
+        middle = connection.execute(
+            median_query,
+            [*params, 2 - count % 2, (count - 1) // 2],
+        ).fetchall()
+        median = sum(item["price"] for item in middle) / len(middle)
         return {
-            "count": len(prices),
-            "average": round(mean(prices), 2),
-            "median": round(median(prices), 2),
-            "min": round(min(prices), 2),
-            "max": round(max(prices), 2),
+            "count": count,
+            "average": round(row["average"], 2),
+            "median": round(median, 2),
+            "min": round(row["min"], 2),
+            "max": round(row["max"], 2),
         }
 
+    def _fetch_page(
+        self,
+        connection: sqlite3.Connection,
+        filters: dict,
+        cursor: str | None,
+    ) -> dict:
+        """주어진 연결에서 키셋 페이지 하나를 조회한다."""
+        filter_digest = self._filter_digest(filters)
+        after = self._decode_cursor(cursor, filter_digest) if cursor else None
+        page_size = self._page_size(filters)
+        query, params = self._build_list_query(
+            {**filters, "limit": page_size + 1},
+            after=after,
+        )
+        rows = connection.execute(query, params).fetchall()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = self._encode_cursor(last["price"], last["rowid"], filter_digest)
+        items = [self._row_to_house(row) for row in rows]
+        return {"items": items, "count": len(items), "next_cursor": next_cursor}
+
+    def _get_cached_stats(self, cache_key: tuple, data_version: int) -> dict | None:
+        """현재 적재 버전의 캐시된 통계를 반환한다."""
+        with self._stats_cache_lock:
+            cached = self._stats_cache.get(cache_key)
+            if cached is None or cached[0] != data_version:
+                return None
+            self._stats_cache.move_to_end(cache_key)
+            return dict(cached[1])
+
+    def _put_cached_stats(self, cache_key: tuple, data_version: int, stats: dict) -> None:
+        """통계를 캐시에 저장하고 최대 크기를 넘으면 오래된 항목을 제거한다."""
+        with self._stats_cache_lock:
+            self._stats_cache[cache_key] = (data_version, stats)
+            self._stats_cache.move_to_end(cache_key)
+            while len(self._stats_cache) > self._stats_cache_size:
+                self._stats_cache.popitem(last=False)
+
+    def _build_price_filters(self, filters: dict) -> tuple[str, list[Any]]:
+        """가격이 NULL인 행을 제외하는 조건을 포함해 WHERE 절을 생성한다."""
+        where_clause, params = self._build_filters(filters)
+        price_clause = "price IS NOT NULL"
+        if where_clause:
+            return f"{where_clause} AND {price_clause}", params
+        return f"WHERE {price_clause}", params
+
+    def _normalize_filter_key(self, filters: dict) -> tuple:
+        """캐시 키로 쓸 수 있도록 필터 조건을 정규화한다."""
+        return tuple(
+            (key, float(filters[key]))
+            for key in _FILTER_KEYS
+            if filters.get(key) is not None
+        )
+
     def _build_filters(self, filters: dict) -> tuple[str, list[Any]]:
         """필터 조건에 맞는 WHERE 절을 생성한다."""
         clauses: list[str] = []
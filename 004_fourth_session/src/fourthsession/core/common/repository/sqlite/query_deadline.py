@@ -0,0 +1,46 @@
+# 목적: SQLite 질의 제한 시간을 정의한다.
+# 설명: 스레드별 마감 시각을 두고 진행 핸들러가 마감을 넘긴 질의를 중단시킨다.
+# 디자인 패턴: 컨텍스트 매니저
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py, fourthsession/core/housing_agent/nodes/execute_node.py
+
+"""SQLite 질의 제한 시간 모듈."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# 진행 핸들러를 호출하는 SQLite VM 명령 간격. 작을수록 빨리 멈추지만 부담이 커진다.
+PROGRESS_HANDLER_INTERVAL = 10_000
+
+_local = threading.local()
+
+
+@contextmanager
+def query_deadline(seconds: float | None) -> Iterator[None]:
+    """블록 안에서 현재 스레드가 실행하는 SQLite 질의에 제한 시간을 건다.
+
+    제한 시간을 넘긴 질의는 sqlite3.OperationalError("interrupted")로 끝난다.
+    중첩되면 더 이른 마감을 따른다.
+
+    Args:
+        seconds (float | None): 제한 시간(초). None이면 제한하지 않는다.
+    """
+    previous = getattr(_local, "deadline", None)
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    _local.deadline = deadline if previous is None else min(previous, deadline)
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def deadline_exceeded() -> int:
+    """현재 스레드의 마감을 넘겼으면 1을 반환한다. SQLite 진행 핸들러로 등록한다."""
+    deadline = getattr(_local, "deadline", None)
+    return 1 if deadline is not None and time.monotonic() > deadline else 0
@@ -1,31 +1,77 @@
 # 목적: 리포트 작업 레포지토리를 정의한다.
-# 설명: 비동기 리포트 작업 생성/조회/갱신을 담당한다.
+# 설명: 비동기 리포트 작업 생성/조회/갱신을 담당한다. 상태 갱신은 모아서 한 트랜잭션으로 기록한다.
 # 디자인 패턴: 리포지토리 패턴
-# 참조: fourthsession/core/repository/sqlite/connection_provider.py
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
 
 """리포트 작업 레포지토리 모듈."""
 
 from __future__ import annotations
 
 import json
+import logging
+import threading
+import time
 from datetime import datetime
 from uuid import uuid4
 
-from fourthsession.core.repository.sqlite.connection_provider import (
+from fourthsession.core.common.job_status import TERMINAL_JOB_STATUSES
+from fourthsession.core.common.repository.sqlite.connection_provider import (
     SqliteConnectionProvider,
 )
 
+logger = logging.getLogger(__name__)
+
+_UPDATE_STATUS_QUERY = "UPDATE report_jobs SET status = ?, updated_at = ? WHERE job_id = ?"
+_INSERT_HISTORY_QUERY = (
+    "INSERT INTO report_job_status_history (job_id, status, changed_at) VALUES (?, ?, ?)"
+)
+
 
 class ReportJobRepository:
-    """리포트 작업 레포지토리."""
+    """리포트 작업 레포지토리.
 
-    def __init__(self, connection_provider: SqliteConnectionProvider | None = None) -> None:
+    update_job_status는 바로 커밋하지 않고 버퍼에 쌓는다. 같은 작업의 상태는
+    마지막 값 하나로 합치고, 변경 이력은 모두 남긴다. 백그라운드 스레드가
+    flush_interval_ms마다 또는 flush_max_updates건이 쌓이면 버퍼를 한
+    트랜잭션으로 기록하며, 종료 상태는 호출한 스레드에서 바로 기록한다.
+    """
+
+    def __init__(
+        self,
+        connection_provider: SqliteConnectionProvider | None = None,
+        flush_interval_ms: int = 100,
+        flush_max_updates: int = 200,
+    ) -> None:
         """레포지토리를 초기화한다.
 
         Args:
             connection_provider (SqliteConnectionProvider | None): 연결 제공자.
+            flush_interval_ms (int): 첫 갱신이 버퍼에 들어온 뒤 기록까지 기다리는 최대 시간(ms).
+            flush_max_updates (int): 이만큼 갱신이 쌓이면 시간과 관계없이 기록한다.
         """
         self._connection_provider = connection_provider or SqliteConnectionProvider()
+        self._flush_interval = flush_interval_ms / 1000
+        self._flush_max_updates = flush_max_updates
+
+        self._condition = threading.Condition()
+        # job_id -> (status, updated_at). 같은 작업의 갱신은 마지막 값만 남는다.
+        self._pending: dict[str, tuple[str, str]] = {}
+        # 기록 중인 배치. 커밋 전에도 get_job_status가 최신 상태를 보게 한다.
+        self._flushing: dict[str, tuple[str, str]] = {}
+        self._history: list[tuple[str, str, str]] = []
+        self._first_pending_at: float | None = None
+        # 배치를 꺼낸 순서대로 기록되도록 flush를 직렬화한다.
+        self._flush_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+        self._counters = {
+            "updates": 0,
+            "coalesced": 0,
+            "flushes": 0,
+            "flushed_rows": 0,
+            "flush_errors": 0,
+        }
+        self._last_flush_ms = 0.0
         self._initialize_table()
 
     def create_job(self, payload: dict) -> dict:
@@ -39,7 +85,7 @@ class ReportJobRepository:
         """
         job_id = f"job-{uuid4()}"
         now = datetime.utcnow().isoformat()
-        with self._connection_provider.get_connection() as connection:
+        with self._connection_provider.connection() as connection:
             connection.execute(
                 """
                 INSERT INTO report_jobs (job_id, status, payload, created_at, updated_at)
@@ -47,6 +93,7 @@ class ReportJobRepository:
                 """,
                 (job_id, "CREATED", json.dumps(payload, ensure_ascii=False), now, now),
             )
+            connection.execute(_INSERT_HISTORY_QUERY, (job_id, "CREATED", now))
             connection.commit()
         return {"job_id": job_id, "status": "CREATED"}
 
@@ -59,7 +106,10 @@ class ReportJobRepository:
         Returns:
             dict: 작업 상태 정보.
         """
-        with self._connection_provider.get_connection() as connection:
+        # 버퍼를 먼저 본다. DB를 먼저 읽으면 그사이 커밋된 배치를 놓칠 수 있다.
+        with self._condition:
+            buffered = self._pending.get(job_id) or self._flushing.get(job_id)
+        with self._connection_provider.connection() as connection:
             cursor = connection.execute(
                 "SELECT job_id, status, payload, created_at, updated_at FROM report_jobs WHERE job_id = ?",
                 (job_id,),
@@ -67,32 +117,152 @@ class ReportJobRepository:
             row = cursor.fetchone()
         if row is None:
             return {"job_id": job_id, "status": "NOT_FOUND"}
+        status, updated_at = buffered or (row["status"], row["updated_at"])
         return {
             "job_id": row["job_id"],
-            "status": row["status"],
+            "status": status,
             "payload": json.loads(row["payload"]),
             "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
+            "updated_at": updated_at,
         }
 
     def update_job_status(self, job_id: str, status: str) -> None:
-        """작업 상태를 갱신한다.
+        """작업 상태 갱신을 버퍼에 넣는다. 종료 상태면 바로 기록한다.
 
         Args:
             job_id (str): 작업 식별자.
             status (str): 변경할 상태.
         """
         now = datetime.utcnow().isoformat()
-        with self._connection_provider.get_connection() as connection:
-            connection.execute(
-                "UPDATE report_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
-                (status, now, job_id),
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("이미 닫힌 레포지토리입니다.")
+            self._counters["updates"] += 1
+            if job_id in self._pending:
+                self._counters["coalesced"] += 1
+            self._pending[job_id] = (status, now)
+            self._history.append((job_id, status, now))
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            self._ensure_flusher()
+            if len(self._history) >= self._flush_max_updates:
+                self._condition.notify()
+        # 종료 상태는 버퍼를 기다리지 않고 바로 기록한다.
+        if status in TERMINAL_JOB_STATUSES:
+            self.flush()
+
+    def get_status_history(self, job_id: str) -> list[dict]:
+        """작업의 상태 변경 이력을 오래된 순서로 조회한다.
+
+        Args:
+            job_id (str): 작업 식별자.
+
+        Returns:
+            list[dict]: status, changed_at을 담은 이력 목록.
+        """
+        self.flush()
+        with self._connection_provider.connection() as connection:
+            rows = connection.execute(
+                """
+                SELECT status, changed_at FROM report_job_status_history
+                WHERE job_id = ? ORDER BY id
+                """,
+                (job_id,),
+            ).fetchall()
+        return [{"status": row["status"], "changed_at": row["changed_at"]} for row in rows]
+
+    def flush(self) -> None:
+        """버퍼에 쌓인 상태 갱신과 이력을 한 트랜잭션으로 기록한다."""
+        with self._flush_lock:
+            with self._condition:
+                if not self._history:
+                    return
+                batch, self._pending = self._pending, {}
+                history, self._history = self._history, []
+                self._first_pending_at = None
+                self._flushing = batch
+            started = time.perf_counter()
+            try:
+                with self._connection_provider.connection() as connection:
+                    connection.executemany(
+                        _UPDATE_STATUS_QUERY,
+                        [(status, updated_at, job_id) for job_id, (status, updated_at) in batch.items()],
+                    )
+                    connection.executemany(_INSERT_HISTORY_QUERY, history)
+            except Exception:
+                with self._condition:
+                    self._counters["flush_errors"] += 1
+                    # 실패한 배치를 버퍼 앞쪽으로 되돌린다. 그사이 들어온 갱신이 더 최신이다.
+                    self._pending = {**batch, **self._pending}
+                    self._history = history + self._history
+                    if self._first_pending_at is None:
+                        self._first_pending_at = time.monotonic()
+                raise
+            finally:
+                with self._condition:
+                    self._flushing = {}
+            with self._condition:
+                self._counters["flushes"] += 1
+                self._counters["flushed_rows"] += len(batch) + len(history)
+                self._last_flush_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    def metrics(self) -> dict:
+        """쓰기 버퍼 지표를 반환한다.
+
+        Returns:
+            dict: 버퍼 건수, 누적 갱신/병합/flush 건수, 마지막 flush 시간(ms).
+        """
+        with self._condition:
+            return {
+                "pending_jobs": len(self._pending),
+                "pending_history": len(self._history),
+                **self._counters,
+                "last_flush_ms": self._last_flush_ms,
+            }
+
+    def close(self) -> None:
+        """백그라운드 기록 스레드를 멈추고 남은 버퍼를 기록한다."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join()
+        self.flush()
+
+    def _ensure_flusher(self) -> None:
+        """기록 스레드가 없으면 띄운다. condition 안에서 호출한다."""
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._run_flusher,
+                name="report-job-flusher",
+                daemon=True,
             )
-            connection.commit()
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        """주기/건수 조건이 되면 버퍼를 기록한다. close()가 호출되면 끝낸다."""
+        while True:
+            with self._condition:
+                while not self._closed and len(self._history) < self._flush_max_updates:
+                    if self._first_pending_at is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._first_pending_at + self._flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001 - 실패한 배치는 버퍼에 남아 다음 주기에 다시 기록한다.
+                logger.exception("리포트 작업 상태 기록 중 오류가 발생했습니다.")
+                time.sleep(self._flush_interval)
 
     def _initialize_table(self) -> None:
         """리포트 작업 테이블을 생성한다."""
-        with self._connection_provider.get_connection() as connection:
+        with self._connection_provider.connection() as connection:
             connection.execute(
                 """
                 CREATE TABLE IF NOT EXISTS report_jobs (
@@ -104,4 +274,20 @@ class ReportJobRepository:
                 )
                 """
             )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS report_job_status_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT,
+                    status TEXT,
+                    changed_at TEXT
+                )
+                """
+            )
+            connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_report_job_status_history_job_id
+                ON report_job_status_history (job_id)
+                """
+            )
             connection.commit()
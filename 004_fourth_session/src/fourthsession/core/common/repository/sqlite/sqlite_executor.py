@@ -0,0 +1,53 @@
+# 목적: SQLite 작업 전용 실행기를 정의한다.
+# 설명: 블로킹 SQLite 호출을 제한된 스레드 풀로 넘겨 이벤트 루프를 막지 않게 한다.
+# 디자인 패턴: 어댑터 패턴
+# 참조: fourthsession/core/common/repository/sqlite/async_housing_repository.py
+
+"""SQLite 전용 스레드 풀 실행기 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SqliteExecutor:
+    """SQLite 호출 전용 스레드 풀 실행기."""
+
+    def __init__(self, max_workers: int = 8) -> None:
+        """실행기를 초기화한다.
+
+        Args:
+            max_workers (int): 동시에 SQLite를 호출할 최대 스레드 수.
+                연결 풀 크기와 맞추면 스레드가 연결을 기다리며 놀지 않는다.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="sqlite-repo",
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """블로킹 함수를 전용 스레드 풀에서 실행하고 결과를 기다린다.
+
+        Args:
+            func (Callable[..., T]): 실행할 동기 함수.
+            *args (Any): 위치 인자.
+            **kwargs (Any): 키워드 인자.
+
+        Returns:
+            T: 함수 실행 결과.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """스레드 풀을 종료한다.
+
+        Args:
+            wait (bool): 실행 중인 작업 완료를 기다릴지 여부.
+        """
+        self._executor.shutdown(wait=wait)
@@ -7,10 +7,16 @@
 
 from abc import ABC, abstractmethod
 
+from fourthsession.core.common.tools.tool_result_cache import ToolResultCache
+
 
 class BaseTool(ABC):
     """모든 Tool이 따라야 하는 기본 인터페이스."""
 
+    # 같은 입력에 항상 같은 결과를 내는 읽기 전용 Tool만 True로 둔다.
+    cacheable: bool = False
+    _result_cache: ToolResultCache | None = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -29,6 +35,21 @@ class BaseTool(ABC):
         """입력 스키마를 반환한다."""
         raise NotImplementedError("입력 스키마 구현이 필요합니다.")
 
+    @property
+    def hints(self) -> dict:
+        """필드별 입력 힌트를 반환한다."""
+        return {}
+
+    @property
+    def example_request(self) -> dict:
+        """예시 요청을 반환한다."""
+        return {}
+
+    @property
+    def example_response(self) -> dict:
+        """예시 응답을 반환한다."""
+        return {}
+
     @abstractmethod
     def execute(self, payload: dict) -> dict:
         """Tool을 실행한다.
@@ -40,3 +61,38 @@ class BaseTool(ABC):
             dict: 실행 결과.
         """
         raise NotImplementedError("Tool 실행 구현이 필요합니다.")
+
+    def bind_result_cache(self, cache: ToolResultCache | None) -> None:
+        """결과 캐시를 연결한다.
+
+        Args:
+            cache (ToolResultCache | None): 결과 캐시. None이면 캐시를 해제한다.
+        """
+        self._result_cache = cache
+
+    def run(self, payload: dict) -> dict:
+        """결과 캐시를 거쳐 Tool을 실행한다.
+
+        cacheable Tool에 캐시가 연결되어 있으면 정규화한 입력으로 캐시를 먼저
+        조회하고, 없을 때만 execute를 호출해 결과를 저장한다. error 키가 있는
+        결과나 실행 중에 데이터 버전이 바뀐 결과는 저장하지 않는다.
+
+        Args:
+            payload (dict): 입력 데이터.
+
+        Returns:
+            dict: 실행 결과.
+        """
+        cache = self._result_cache
+        if cache is None or not self.cacheable:
+            return self.execute(payload)
+        key = cache.make_key(self.name, payload)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        # 실행 전에 버전을 읽어야 실행 중 재적재된 결과를 새 버전으로 저장하지 않는다.
+        version = cache.current_version()
+        result = self.execute(payload)
+        if "error" not in result:
+            cache.put(key, result, version)
+        return result
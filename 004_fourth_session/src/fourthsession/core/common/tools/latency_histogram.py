@@ -0,0 +1,87 @@
+# 목적: Tool 지연 시간 히스토그램을 정의한다.
+# 설명: 고정 버킷에 호출 지연 시간과 결과 상태를 누적하고 분위수를 어림한다.
+# 디자인 패턴: 누적기(Accumulator)
+# 참조: fourthsession/mcp/mcp_server.py
+
+"""지연 시간 히스토그램 모듈."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+
+# 버킷 상한(ms). 마지막 버킷은 상한이 없다.
+DEFAULT_BUCKETS_MS: tuple[float, ...] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class LatencyHistogram:
+    """호출 지연 시간 히스토그램."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS) -> None:
+        """히스토그램을 초기화한다.
+
+        Args:
+            buckets_ms (tuple[float, ...]): 오름차순 버킷 상한(ms).
+        """
+        self._bounds = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._statuses: dict[str, int] = {}
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, status: str = "ok") -> None:
+        """호출 한 건을 기록한다.
+
+        Args:
+            elapsed_ms (float): 지연 시간(ms).
+            status (str): 결과 상태(ok/error/timeout/rejected 등).
+        """
+        index = bisect.bisect_left(self._bounds, elapsed_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+    def snapshot(self) -> dict:
+        """현재 누적값을 반환한다.
+
+        분위수는 해당 분위가 속한 버킷의 상한으로 어림한다.
+
+        Returns:
+            dict: count, 상태별 건수, 평균/최대, p50/p95/p99(ms), 버킷별 건수.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            statuses = dict(self._statuses)
+            total_ms = self._total_ms
+            max_ms = self._max_ms
+        count = sum(counts)
+        labels = [f"le_{bound:g}" for bound in self._bounds] + ["le_inf"]
+        return {
+            "count": count,
+            "statuses": statuses,
+            "avg_ms": round(total_ms / count, 3) if count else 0.0,
+            "max_ms": round(max_ms, 3),
+            "p50_ms": self._quantile(counts, count, 0.50, max_ms),
+            "p95_ms": self._quantile(counts, count, 0.95, max_ms),
+            "p99_ms": self._quantile(counts, count, 0.99, max_ms),
+            "buckets": dict(zip(labels, counts)),
+        }
+
+    def _quantile(self, counts: list[int], count: int, quantile: float, max_ms: float) -> float:
+        """분위수가 속한 버킷의 상한을 반환한다. 최댓값보다 크게 어림하지 않는다."""
+        if not count:
+            return 0.0
+        target = quantile * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= target and index < len(self._bounds):
+                return min(float(self._bounds[index]), round(max_ms, 3))
+            if seen >= target:
+                break
+        return round(max_ms, 3)
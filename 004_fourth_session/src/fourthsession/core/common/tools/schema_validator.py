@@ -0,0 +1,110 @@
+# 목적: Tool 입력 스키마 검증기를 정의한다.
+# 설명: Tool input_schema가 쓰는 JSON Schema 부분 집합으로 입력을 검사한다.
+# 디자인 패턴: 밸리데이터 패턴
+# 참조: fourthsession/core/common/tools/base_tool.py
+
+"""Tool 입력 스키마 검증 모듈."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+_TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+}
+
+
+SchemaValidator = Callable[[object, str], list[str]]
+
+# (키워드, 위반 판정, 오류 메시지 형식)
+_NUMERIC_BOUNDS = (
+    ("minimum", lambda value, limit: value < limit, "{} 이상이어야 합니다."),
+    ("maximum", lambda value, limit: value > limit, "{} 이하여야 합니다."),
+    ("exclusiveMinimum", lambda value, limit: value <= limit, "{}보다 커야 합니다."),
+    ("exclusiveMaximum", lambda value, limit: value >= limit, "{}보다 작아야 합니다."),
+)
+
+
+def compile_schema(schema: dict) -> SchemaValidator:
+    """스키마를 한 번 해석해 검사 함수로 만든다.
+
+    type, properties, required, additionalProperties, enum, minimum/maximum,
+    exclusiveMinimum/exclusiveMaximum, items, maxItems 키워드만 해석한다.
+    같은 스키마로 여러 번 검사할 때는 만든 함수를 재사용한다.
+
+    Args:
+        schema (dict): JSON Schema.
+
+    Returns:
+        SchemaValidator: (값, 경로)를 받아 오류 메시지 목록을 반환하는 함수.
+    """
+    expected = schema.get("type")
+    type_check = _TYPE_CHECKS.get(expected)
+    allowed = schema["enum"] if "enum" in schema else None
+    bounds = tuple(
+        (schema[keyword], violates, message)
+        for keyword, violates, message in _NUMERIC_BOUNDS
+        if keyword in schema
+    )
+    max_items = schema.get("maxItems")
+    item_validator = compile_schema(schema["items"]) if schema.get("items") else None
+    property_validators = {
+        key: compile_schema(spec) for key, spec in (schema.get("properties") or {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    closed = schema.get("additionalProperties") is False
+
+    def validate(payload: object, path: str = "input") -> list[str]:
+        if type_check is not None and not type_check(payload):
+            return [f"{path}: {expected} 타입이어야 합니다."]
+
+        errors: list[str] = []
+        if allowed is not None and payload not in allowed:
+            errors.append(f"{path}: {allowed} 중 하나여야 합니다.")
+
+        if bounds and isinstance(payload, (int, float)) and not isinstance(payload, bool):
+            for limit, violates, message in bounds:
+                if violates(payload, limit):
+                    errors.append(f"{path}: {message.format(limit)}")
+
+        if isinstance(payload, list):
+            if max_items is not None and len(payload) > max_items:
+                errors.append(f"{path}: 항목은 최대 {max_items}개입니다.")
+            if item_validator is not None:
+                for index, item in enumerate(payload):
+                    errors.extend(item_validator(item, f"{path}[{index}]"))
+
+        if isinstance(payload, dict):
+            for key in required:
+                if key not in payload:
+                    errors.append(f"{path}.{key}: 필수 필드입니다.")
+            for key, value in payload.items():
+                validator = property_validators.get(key)
+                if validator is not None:
+                    errors.extend(validator(value, f"{path}.{key}"))
+                elif closed:
+                    errors.append(f"{path}.{key}: 허용되지 않은 필드입니다.")
+        return errors
+
+    return validate
+
+
+def validate_payload(schema: dict, payload: object, path: str = "input") -> list[str]:
+    """입력이 스키마를 만족하는지 검사한다.
+
+    한 번만 검사할 때 쓴다. 반복 검사는 compile_schema로 만든 함수를 재사용한다.
+
+    Args:
+        schema (dict): JSON Schema.
+        payload (object): 검사할 값.
+        path (str): 오류 메시지에 쓸 값의 경로.
+
+    Returns:
+        list[str]: 오류 메시지 목록. 비어 있으면 유효하다.
+    """
+    return compile_schema(schema)(payload, path)
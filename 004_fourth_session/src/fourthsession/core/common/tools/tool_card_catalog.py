@@ -0,0 +1,151 @@
+# 목적: 미리 직렬화한 도구 카드 카탈로그를 정의한다.
+# 설명: 카드 목록, 내용 해시, 프롬프트 텍스트와 토큰 예산별 축약본을 한 번만 만들어 둔다.
+# 디자인 패턴: 불변 값 객체 + 사전 계산(Precompute)
+# 참조: fourthsession/mcp/tool_registry.py, fourthsession/core/common/tools/tool_card_store.py
+
+"""도구 카드 카탈로그 모듈."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Callable
+
+
+def tool_card_version(cards: list[dict] | tuple) -> str:
+    """도구 카드 목록의 내용 해시 버전을 만든다.
+
+    Args:
+        cards (list[dict] | tuple): 도구 카드 목록.
+
+    Returns:
+        str: 16자리 16진수 버전 문자열.
+    """
+    encoded = json.dumps(list(cards), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 어림한다.
+
+    토크나이저 없이 UTF-8 바이트 수로 계산한다. 영문/JSON은 4바이트,
+    한글은 대략 글자당 1토큰에 가깝게 나온다.
+
+    Args:
+        text (str): 대상 텍스트.
+
+    Returns:
+        int: 어림한 토큰 수.
+    """
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def _full(card: dict) -> dict:
+    """카드 전체를 그대로 쓴다."""
+    return card
+
+
+def _without_response(card: dict) -> dict:
+    """응답 예시를 뺀다."""
+    return {key: value for key, value in card.items() if key != "example_response"}
+
+
+def _schema_only(card: dict) -> dict:
+    """이름, 설명, 입력 스키마만 남긴다."""
+    return {
+        "name": card.get("name"),
+        "description": card.get("description"),
+        "input_schema": card.get("input_schema"),
+    }
+
+
+def _params_only(card: dict) -> dict:
+    """입력 스키마를 필드명: 타입(허용값) 형태로 줄인다."""
+    properties = (card.get("input_schema") or {}).get("properties") or {}
+    params = {}
+    for key, spec in properties.items():
+        kind = spec.get("type", "any")
+        params[key] = f"{kind}({'|'.join(map(str, spec['enum']))})" if "enum" in spec else kind
+    return {"name": card.get("name"), "description": card.get("description"), "params": params}
+
+
+def _name_only(card: dict) -> dict:
+    """이름과 설명만 남긴다."""
+    return {"name": card.get("name"), "description": card.get("description")}
+
+
+# 정보가 많은 순서. 토큰 예산에 맞는 첫 단계를 쓴다.
+_COMPACT_LEVELS: tuple[Callable[[dict], dict], ...] = (
+    _full,
+    _without_response,
+    _schema_only,
+    _params_only,
+    _name_only,
+)
+
+
+class ToolCardCatalog:
+    """등록 시점에 한 번 만든 도구 카드 카탈로그.
+
+    카드와 직렬화 결과는 모든 요청이 공유하므로 만든 뒤에는 바꾸지 않는다.
+    """
+
+    __slots__ = ("_cards", "_by_name", "_version", "_texts", "_token_counts")
+
+    def __init__(self, cards: list[dict] | tuple, version: str | None = None) -> None:
+        """카탈로그를 만들고 단계별 프롬프트 텍스트를 미리 직렬화한다.
+
+        Args:
+            cards (list[dict] | tuple): 도구 카드 목록.
+            version (str | None): 미리 계산한 버전. 없으면 내용 해시로 계산한다.
+        """
+        self._cards = tuple(dict(card) for card in cards)
+        self._by_name = {card.get("name"): card for card in self._cards}
+        self._version = version or tool_card_version(self._cards)
+        # 전체 단계는 기존 프롬프트와 같은 형식, 축약 단계는 공백 없는 JSON으로 만든다.
+        self._texts = tuple(
+            json.dumps(
+                [level(card) for card in self._cards],
+                ensure_ascii=False,
+                default=str,
+                separators=None if level is _full else (",", ":"),
+            )
+            for level in _COMPACT_LEVELS
+        )
+        self._token_counts = tuple(estimate_tokens(text) for text in self._texts)
+
+    @property
+    def cards(self) -> tuple:
+        """도구 카드 목록을 반환한다."""
+        return self._cards
+
+    @property
+    def version(self) -> str:
+        """카드 내용 해시 버전을 반환한다."""
+        return self._version
+
+    @property
+    def token_counts(self) -> tuple[int, ...]:
+        """축약 단계별 어림 토큰 수를 반환한다(0단계가 전체 카드)."""
+        return self._token_counts
+
+    def get(self, name: str) -> dict | None:
+        """이름으로 도구 카드를 조회한다."""
+        return self._by_name.get(name)
+
+    def prompt_text(self, token_budget: int | None = None) -> str:
+        """프롬프트에 넣을 카드 텍스트를 반환한다.
+
+        Args:
+            token_budget (int | None): 허용 토큰 수. 없으면 전체 카드를 반환한다.
+
+        Returns:
+            str: 예산 안에 들어가는 가장 자세한 단계의 텍스트.
+                모든 단계가 예산을 넘으면 가장 짧은 단계를 반환한다.
+        """
+        if token_budget is None:
+            return self._texts[0]
+        for text, tokens in zip(self._texts, self._token_counts):
+            if tokens <= token_budget:
+                return text
+        return self._texts[-1]
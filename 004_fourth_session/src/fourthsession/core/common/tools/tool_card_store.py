@@ -0,0 +1,72 @@
+# 목적: 버전별 도구 카드 저장소를 정의한다.
+# 설명: 도구 카드 카탈로그를 내용 해시 버전으로 한 번만 보관하고 상태에는 버전만 싣는다.
+# 디자인 패턴: 플라이웨이트 패턴
+# 참조: fourthsession/mcp/tool_registry.py, fourthsession/core/housing_agent/state/agent_state.py
+
+"""도구 카드 저장소 모듈."""
+
+from __future__ import annotations
+
+import threading
+
+from fourthsession.core.common.tools.tool_card_catalog import ToolCardCatalog
+
+_lock = threading.Lock()
+_catalogs_by_version: dict[str, ToolCardCatalog] = {}
+
+
+def publish_tool_card_catalog(catalog: ToolCardCatalog) -> str:
+    """카탈로그를 저장하고 버전을 반환한다.
+
+    내용이 같으면 같은 버전이 나오므로 여러 번 등록해도 처음 것 하나만 보관한다.
+
+    Args:
+        catalog (ToolCardCatalog): 도구 카드 카탈로그.
+
+    Returns:
+        str: 카드 버전.
+    """
+    with _lock:
+        _catalogs_by_version.setdefault(catalog.version, catalog)
+    return catalog.version
+
+
+def publish_tool_cards(cards: list[dict], version: str | None = None) -> str:
+    """도구 카드 목록으로 카탈로그를 만들어 저장하고 버전을 반환한다.
+
+    Args:
+        cards (list[dict]): 도구 카드 목록.
+        version (str | None): 미리 계산한 버전. 없으면 내용 해시로 계산한다.
+
+    Returns:
+        str: 카드 버전.
+    """
+    return publish_tool_card_catalog(ToolCardCatalog(cards, version))
+
+
+def resolve_tool_card_catalog(version: str | None) -> ToolCardCatalog | None:
+    """버전에 해당하는 카탈로그를 반환한다.
+
+    Args:
+        version (str | None): 카드 버전.
+
+    Returns:
+        ToolCardCatalog | None: 카탈로그. 버전이 없거나 모르면 None.
+    """
+    if version is None:
+        return None
+    with _lock:
+        return _catalogs_by_version.get(version)
+
+
+def resolve_tool_cards(version: str | None) -> tuple:
+    """버전에 해당하는 도구 카드 목록을 반환한다.
+
+    Args:
+        version (str | None): publish_tool_cards가 반환한 버전.
+
+    Returns:
+        tuple: 공유 도구 카드 목록. 버전이 없거나 모르면 빈 튜플.
+    """
+    catalog = resolve_tool_card_catalog(version)
+    return catalog.cards if catalog is not None else ()
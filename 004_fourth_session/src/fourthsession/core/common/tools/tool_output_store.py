@@ -0,0 +1,62 @@
+# 목적: 단계별 Tool 출력 저장소를 정의한다.
+# 설명: 큰 Tool 출력은 상태 밖에 보관하고 상태의 tool_results에는 참조 키와 상태만 싣는다.
+# 디자인 패턴: 플라이웨이트 패턴
+# 참조: fourthsession/core/housing_agent/nodes/execute_node.py,
+#       fourthsession/core/housing_agent/nodes/merge_node.py
+
+"""Tool 출력 저장소 모듈."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+from uuid import uuid4
+
+# 보관할 최대 출력 수. 넘으면 가장 오래 읽지 않은 출력부터 지운다.
+MAX_TOOL_OUTPUTS = 4096
+
+_lock = threading.Lock()
+_outputs: OrderedDict[str, Any] = OrderedDict()
+
+
+def publish_tool_output(step_id: str, output: Any) -> str | None:
+    """단계 출력을 저장하고 참조 키를 반환한다.
+
+    같은 단계 id가 여러 요청에서 쓰이므로 키는 "단계 id:임의값"으로 만든다.
+
+    Args:
+        step_id (str): 단계 식별자.
+        output (Any): Tool 출력.
+
+    Returns:
+        str | None: 참조 키. 출력이 None이면 저장하지 않고 None.
+    """
+    if output is None:
+        return None
+    ref = f"{step_id}:{uuid4().hex}"
+    with _lock:
+        _outputs[ref] = output
+        while len(_outputs) > MAX_TOOL_OUTPUTS:
+            _outputs.popitem(last=False)
+    return ref
+
+
+def resolve_tool_output(ref: str | None) -> Any:
+    """참조 키에 해당하는 출력을 반환한다.
+
+    재계획 후 재사용하는 출력이 밀려나지 않도록 읽은 항목은 최근으로 옮긴다.
+
+    Args:
+        ref (str | None): publish_tool_output이 반환한 키.
+
+    Returns:
+        Any: 출력. 키가 없거나 이미 밀려났으면 None.
+    """
+    if ref is None:
+        return None
+    with _lock:
+        output = _outputs.get(ref)
+        if output is not None:
+            _outputs.move_to_end(ref)
+        return output
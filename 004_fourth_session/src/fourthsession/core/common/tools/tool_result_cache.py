@@ -0,0 +1,163 @@
+# 목적: Tool 실행 결과 캐시를 정의한다.
+# 설명: 정규화한 입력을 키로 Tool 결과를 LRU+TTL 방식으로 보관한다.
+# 디자인 패턴: 캐시 어사이드 패턴
+# 참조: fourthsession/core/common/tools/base_tool.py
+
+"""Tool 결과 캐시 모듈."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class ToolResultCache:
+    """바이트 크기 제한이 있는 LRU+TTL Tool 결과 캐시."""
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        version_source: Callable[[], int] | None = None,
+    ) -> None:
+        """캐시를 초기화한다.
+
+        Args:
+            max_bytes (int): 저장할 결과 JSON의 총 바이트 한도.
+            ttl_seconds (float): 항목 유효 시간(초).
+            version_source (Callable[[], int] | None): 데이터 버전을 반환하는 함수.
+                버전이 바뀌면 이전 버전에서 저장한 항목은 모두 무효가 된다.
+        """
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._version_source = version_source or (lambda: 0)
+        self._entries: OrderedDict[tuple[str, str], tuple[int, float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._stale_puts = 0
+
+    def current_version(self) -> int:
+        """현재 데이터 버전을 반환한다. Tool을 실행하기 전에 읽어 put에 넘긴다.
+
+        Returns:
+            int: 데이터 버전.
+        """
+        return self._version_source()
+
+    def make_key(self, tool_name: str, payload: dict) -> tuple[str, str]:
+        """Tool 이름과 정규화한 JSON 입력으로 캐시 키를 만든다.
+
+        Args:
+            tool_name (str): Tool 이름.
+            payload (dict): Tool 입력.
+
+        Returns:
+            tuple[str, str]: 캐시 키.
+        """
+        canonical = json.dumps(
+            payload,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return tool_name, canonical
+
+    def get(self, key: tuple[str, str]) -> dict | None:
+        """유효한 캐시 결과를 반환한다.
+
+        Args:
+            key (tuple[str, str]): make_key로 만든 키.
+
+        Returns:
+            dict | None: 캐시된 결과의 복사본. 없거나 만료되면 None.
+        """
+        version = self._version_source()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            entry_version, expires_at, data = entry
+            if entry_version != version or expires_at <= now:
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return json.loads(data)
+
+    def put(self, key: tuple[str, str], result: dict, version: int | None = None) -> None:
+        """결과를 캐시에 저장한다.
+
+        실행 중에 데이터가 다시 적재되었으면 결과가 이전 데이터로 계산되었을 수
+        있으므로 저장하지 않는다.
+
+        Args:
+            key (tuple[str, str]): make_key로 만든 키.
+            result (dict): Tool 실행 결과.
+            version (int | None): 실행 전에 current_version()으로 읽은 데이터 버전.
+                None이면 현재 버전으로 저장한다.
+        """
+        current = self._version_source()
+        if version is not None and version != current:
+            with self._lock:
+                self._stale_puts += 1
+            return
+        data = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+        if len(data) > self._max_bytes:
+            return
+        entry = (current, time.monotonic() + self._ttl_seconds, data)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += len(data)
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """캐시 항목을 비운다.
+
+        Args:
+            tool_name (str | None): 지정하면 해당 Tool의 항목만 비운다.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if tool_name in (None, key[0])]:
+                self._remove(key)
+
+    def metrics(self) -> dict:
+        """캐시 적중/크기 지표를 반환한다.
+
+        Returns:
+            dict: 캐시 지표.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "stale_puts": self._stale_puts,
+            }
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """잠금을 잡은 상태에서 항목을 제거하고 바이트 수를 갱신한다."""
+        _, _, data = self._entries.pop(key)
+        self._bytes -= len(data)
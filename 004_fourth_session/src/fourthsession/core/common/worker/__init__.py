@@ -1,5 +1,7 @@
 """공통 워커 패키지."""
 
+from fourthsession.core.common.worker.concurrent_queue_worker import ConcurrentQueueWorker
+from fourthsession.core.common.worker.queue_worker import QueueWorker
 from fourthsession.core.common.worker.worker_base import WorkerBase
 
-__all__ = ["WorkerBase"]
+__all__ = ["ConcurrentQueueWorker", "QueueWorker", "WorkerBase"]
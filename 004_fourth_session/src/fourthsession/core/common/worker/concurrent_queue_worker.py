@@ -0,0 +1,197 @@
+# 목적: 여러 작업을 동시에 처리하는 큐 워커를 정의한다.
+# 설명: 하나의 dequeue 루프가 선반입 버퍼를 채우고 N개 처리 스레드가 나눠 처리한다.
+# 디자인 패턴: 생산자-소비자 패턴
+# 참조: fourthsession/core/common/worker/queue_worker.py
+
+"""동시 처리 큐 워커 모듈."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from typing import Any, Callable
+
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.worker.queue_worker import QueueWorker
+
+logger = logging.getLogger(__name__)
+
+# 처리 스레드에 종료를 알리는 표식. 버퍼에 남은 작업 뒤에 넣으므로 먼저 들어온 작업은 모두 처리된다.
+_STOP = object()
+
+
+class ConcurrentQueueWorker(QueueWorker):
+    """동시 처리 큐 워커.
+
+    run()을 호출한 스레드가 dequeue 루프를 돌며 선반입 버퍼를 채우고, 처리
+    스레드 concurrency개가 버퍼에서 꺼내 handle()을 호출한다. stop()을 호출하면
+    더 이상 꺼내지 않고 버퍼와 처리 중인 작업을 모두 끝낸 뒤 run()이 반환된다.
+    """
+
+    def __init__(
+        self,
+        queue: RedisJobQueue,
+        concurrency: int = 4,
+        prefetch: int | None = None,
+        poll_interval: float = 1.0,
+        block_timeout: float | None = 1.0,
+        reliable: bool = False,
+        process_workers: int | None = None,
+        throughput_window: float = 60.0,
+    ) -> None:
+        """워커를 초기화한다.
+
+        Args:
+            queue (RedisJobQueue): 작업 큐.
+            concurrency (int): 처리 스레드 수.
+            prefetch (int | None): 선반입 버퍼 크기. 없으면 concurrency의 2배.
+                비신뢰 모드에서 버퍼에 든 작업은 프로세스가 죽으면 잃으므로
+                유실이 문제면 reliable=True로 쓴다.
+            poll_interval (float): 폴링 모드의 대기 간격(초).
+            block_timeout (float | None): BLPOP/BLMOVE 대기 시간(초).
+            reliable (bool): 신뢰 모드 사용 여부.
+            process_workers (int | None): run_cpu_bound가 쓸 프로세스 수. 없으면 CPU 수.
+            throughput_window (float): 처리량을 계산할 최근 구간(초).
+        """
+        super().__init__(
+            queue,
+            poll_interval=poll_interval,
+            block_timeout=block_timeout,
+            reliable=reliable,
+        )
+        self._concurrency = concurrency
+        self._buffer: Queue = Queue(maxsize=prefetch or concurrency * 2)
+        self._threads: list[threading.Thread] = []
+        self._process_workers = process_workers or os.cpu_count() or 1
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self._throughput_window = throughput_window
+        self._completed_at: deque[float] = deque()
+        self._fetched = 0
+        self._processed = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._handle_seconds = 0.0
+        self._started_at: float | None = None
+
+    def on_start(self) -> None:
+        """신뢰 모드 복구 후 처리 스레드를 띄운다."""
+        super().on_start()
+        self._started_at = time.monotonic()
+        self._threads = [
+            threading.Thread(target=self._consume, name=f"queue-worker-{index}", daemon=True)
+            for index in range(self._concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def run_once(self) -> bool:
+        """작업을 하나 꺼내 선반입 버퍼에 넣는다. 버퍼가 가득 차면 빌 때까지 기다린다.
+
+        Returns:
+            bool: 작업을 꺼냈으면 True.
+        """
+        job = self._fetch()
+        if job is None:
+            return False
+        self._buffer.put(job)
+        with self._metrics_lock:
+            self._fetched += 1
+        return True
+
+    def on_stop(self) -> None:
+        """버퍼와 처리 중인 작업을 모두 끝내고 처리 스레드와 프로세스 풀을 정리한다."""
+        for _ in self._threads:
+            self._buffer.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=True)
+                self._process_pool = None
+        super().on_stop()
+
+    def run_cpu_bound(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """CPU를 많이 쓰는 단계를 프로세스 풀에서 실행하고 결과를 기다린다.
+
+        처리 스레드는 GIL을 나눠 쓰므로 계산 위주 단계는 handle()에서 이 메서드로
+        넘긴다. fn과 인자는 pickle할 수 있어야 한다(모듈 최상위 함수).
+
+        Args:
+            fn (Callable[..., Any]): 실행할 함수.
+            *args (Any): 함수 인자.
+
+        Returns:
+            Any: 함수 반환값.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._process_workers)
+            pool = self._process_pool
+        return pool.submit(fn, *args).result()
+
+    def metrics(self) -> dict:
+        """처리량과 큐 깊이 지표를 반환한다.
+
+        Returns:
+            dict: 누적 건수, 처리 중/버퍼 건수, Redis 큐 깊이, 최근 처리량(건/초),
+                평균 처리 시간(ms).
+        """
+        now = time.monotonic()
+        with self._metrics_lock:
+            self._trim_completed(now)
+            recent = len(self._completed_at)
+            window = min(self._throughput_window, now - self._started_at) if self._started_at else 0.0
+            finished = self._processed + self._failed
+            snapshot = {
+                "concurrency": self._concurrency,
+                "fetched": self._fetched,
+                "processed": self._processed,
+                "failed": self._failed,
+                "in_flight": self._in_flight,
+                "avg_handle_ms": round(self._handle_seconds / finished * 1000, 3) if finished else 0.0,
+            }
+        snapshot["buffered"] = self._buffer.qsize()
+        snapshot["prefetch"] = self._buffer.maxsize
+        snapshot["queue_depth"] = self._queue.size()
+        snapshot["throughput_per_sec"] = round(recent / window, 3) if window > 0 else 0.0
+        return snapshot
+
+    def _consume(self) -> None:
+        """버퍼에서 작업을 꺼내 처리한다. 종료 표식을 받으면 끝낸다."""
+        while True:
+            job = self._buffer.get()
+            if job is _STOP:
+                return
+            with self._metrics_lock:
+                self._in_flight += 1
+            started = time.monotonic()
+            failed = False
+            try:
+                self._process(*job)
+            except Exception:  # noqa: BLE001 - 작업 하나의 실패로 처리 스레드를 멈추지 않는다.
+                failed = True
+                logger.exception("워커 작업 처리 중 오류가 발생했습니다.")
+            finished = time.monotonic()
+            with self._metrics_lock:
+                self._in_flight -= 1
+                self._handle_seconds += finished - started
+                if failed:
+                    self._failed += 1
+                else:
+                    self._processed += 1
+                self._completed_at.append(finished)
+                self._trim_completed(finished)
+
+    def _trim_completed(self, now: float) -> None:
+        """처리량 구간을 벗어난 완료 시각을 지운다. metrics_lock 안에서 호출한다."""
+        while self._completed_at and now - self._completed_at[0] > self._throughput_window:
+            self._completed_at.popleft()
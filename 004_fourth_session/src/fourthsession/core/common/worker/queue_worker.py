@@ -0,0 +1,120 @@
+# 목적: Redis 작업 큐를 소비하는 워커를 정의한다.
+# 설명: 폴링/블로킹/신뢰 모드로 작업을 꺼내 handle()에 넘긴다.
+# 디자인 패턴: 템플릿 메서드 패턴
+# 참조: fourthsession/core/common/worker/worker_base.py, fourthsession/core/common/queue/job_queue.py
+
+"""작업 큐 워커 모듈."""
+
+import logging
+import threading
+from abc import abstractmethod
+
+from fourthsession.core.common.queue.job_queue import JobLease, RedisJobQueue
+from fourthsession.core.common.worker.worker_base import WorkerBase
+
+logger = logging.getLogger(__name__)
+
+
+class QueueWorker(WorkerBase):
+    """작업 큐 소비 워커."""
+
+    def __init__(
+        self,
+        queue: RedisJobQueue,
+        poll_interval: float = 1.0,
+        block_timeout: float | None = 5.0,
+        reliable: bool = False,
+    ) -> None:
+        """워커를 초기화한다.
+
+        Args:
+            queue (RedisJobQueue): 작업 큐.
+            poll_interval (float): 폴링 모드(block_timeout=None)의 대기 간격(초).
+            block_timeout (float | None): BLPOP/BLMOVE 대기 시간(초).
+            reliable (bool): True면 BLMOVE로 처리 중 리스트에 옮긴 뒤 처리하고 ack한다.
+                실행하는 동안 소비자 lease를 갱신하고, 시작할 때 자기 리스트와
+                lease가 만료된 워커의 리스트에 남은 작업을 큐로 되돌린다.
+        """
+        if reliable and block_timeout is None:
+            raise ValueError("신뢰 모드는 block_timeout이 필요합니다.")
+        super().__init__(poll_interval=poll_interval, block_timeout=block_timeout)
+        self._queue = queue
+        self._reliable = reliable
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def on_start(self) -> None:
+        """신뢰 모드면 lease 갱신을 시작하고 죽은 워커가 남긴 처리 중 작업을 되돌린다."""
+        if not self._reliable:
+            return
+        # 자기 lease를 먼저 잡아야 다른 워커의 recover가 이 리스트를 건드리지 않는다.
+        self._queue.heartbeat()
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._run_heartbeat,
+            name="queue-worker-heartbeat",
+            daemon=True,
+        )
+        self._heartbeat_thread.start()
+        recovered = self._queue.recover()
+        if recovered:
+            logger.warning("처리 중 리스트에서 작업 %d건을 큐로 되돌렸습니다.", recovered)
+
+    def on_stop(self) -> None:
+        """신뢰 모드면 lease 갱신을 멈추고 lease를 반납한다."""
+        if self._heartbeat_thread is None:
+            return
+        self._heartbeat_stop.set()
+        self._heartbeat_thread.join()
+        self._heartbeat_thread = None
+        self._queue.release()
+
+    def run_once(self) -> bool:
+        """작업을 하나 꺼내 처리한다.
+
+        Returns:
+            bool: 작업을 처리했으면 True.
+        """
+        job = self._fetch()
+        if job is None:
+            return False
+        self._process(*job)
+        return True
+
+    def _fetch(self) -> tuple[dict, JobLease | None] | None:
+        """모드에 맞게 작업을 하나 꺼낸다. 신뢰 모드면 lease도 함께 반환한다."""
+        if self._reliable:
+            lease = self._queue.reserve(self.block_timeout)
+            return (lease.payload, lease) if lease is not None else None
+        payload = self._queue.dequeue(self.block_timeout)
+        return (payload, None) if payload is not None else None
+
+    def _process(self, payload: dict, lease: JobLease | None) -> None:
+        """작업을 처리하고 신뢰 모드면 ack한다.
+
+        handle이 예외로 끝나도 ack한다. 같은 작업이 무한히 재처리되지 않도록
+        실패 기록은 handle 쪽 책임으로 둔다.
+        """
+        try:
+            self.handle(payload)
+        finally:
+            if lease is not None:
+                self._queue.ack(lease)
+
+    def _run_heartbeat(self) -> None:
+        """lease가 만료되기 전에 주기적으로 갱신한다. 처리 시간이 길어도 계속 갱신한다."""
+        interval = max(self._queue.lease_seconds / 3, 0.1)
+        while not self._heartbeat_stop.wait(interval):
+            try:
+                self._queue.heartbeat()
+            except Exception:  # noqa: BLE001 - 일시적인 연결 오류로 갱신 스레드를 멈추지 않는다.
+                logger.exception("소비자 lease 갱신 중 오류가 발생했습니다.")
+
+    @abstractmethod
+    def handle(self, payload: dict) -> None:
+        """작업 하나를 처리한다.
+
+        Args:
+            payload (dict): 작업 페이로드.
+        """
+        raise NotImplementedError("작업 처리 구현이 필요합니다.")
@@ -5,33 +5,68 @@
 
 """워커 베이스 모듈."""
 
+import logging
+import threading
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 
 class WorkerBase(ABC):
     """워커 실행 베이스 클래스."""
 
-    def __init__(self, poll_interval: float = 1.0) -> None:
+    def __init__(self, poll_interval: float = 1.0, block_timeout: float | None = None) -> None:
         """워커 설정을 초기화한다.
 
         Args:
-            poll_interval (float): 폴링 간격(초).
+            poll_interval (float): 폴링 간격(초). 폴링 모드에서만 쓴다.
+            block_timeout (float | None): 블로킹 모드의 큐 대기 시간(초). 설정하면
+                run_once가 큐에서 직접 기다리므로 빈 큐에서 sleep하지 않는다.
+                중지 요청은 최대 이 시간 안에 반영된다.
         """
         self._poll_interval = poll_interval
+        self._block_timeout = block_timeout
+        self._stop_event = threading.Event()
+
+    @property
+    def block_timeout(self) -> float | None:
+        """블로킹 모드의 큐 대기 시간(초)을 반환한다. 폴링 모드면 None."""
+        return self._block_timeout
+
+    @property
+    def stopped(self) -> bool:
+        """중지 요청 여부를 반환한다."""
+        return self._stop_event.is_set()
 
     def run(self) -> None:
         """워커 루프를 실행한다.
 
-        TODO:
-        - run_once()를 반복 호출하는 루프를 구현한다.
-        - 처리할 작업이 없으면 poll_interval만큼 대기한다.
+        stop()이 호출될 때까지 run_once()를 반복한다. 폴링 모드에서 처리할 작업이
+        없으면 poll_interval만큼 기다리고, 블로킹 모드에서는 바로 다시 호출한다.
         """
-        raise NotImplementedError("TODO: 워커 실행 루프 구현")
+        self._stop_event.clear()
+        self.on_start()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    processed = self.run_once()
+                except Exception:  # noqa: BLE001 - 작업 하나의 실패로 루프를 멈추지 않는다.
+                    logger.exception("워커 작업 처리 중 오류가 발생했습니다.")
+                    processed = False
+                if not processed and self._block_timeout is None:
+                    self._stop_event.wait(self._poll_interval)
+        finally:
+            self.on_stop()
 
     def stop(self) -> None:
         """워커를 중지한다."""
-        # TODO: 워커 중지 플래그를 구현한다.
-        raise NotImplementedError("TODO: 워커 중지 구현")
+        self._stop_event.set()
+
+    def on_start(self) -> None:
+        """루프 시작 전에 호출된다. 하위 클래스가 필요하면 재정의한다."""
+
+    def on_stop(self) -> None:
+        """루프 종료 후에 호출된다. 하위 클래스가 필요하면 재정의한다."""
 
     @abstractmethod
     def run_once(self) -> bool:
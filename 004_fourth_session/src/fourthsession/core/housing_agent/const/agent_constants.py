@@ -11,9 +11,18 @@ class HousingAgentConstants:
 
     def __init__(self) -> None:
         """상수 값을 초기화한다."""
-        # TODO: 아래 상수를 정책에 맞게 정의한다.
-        # - default_max_retries
-        # - default_list_limit
-        # - plan_action_name
-        # - plan_version
-        raise NotImplementedError("TODO: 상수 정의 구현")
+        self.default_max_retries = 2
+        self.default_list_limit = 10
+        self.plan_action_name = "tool_call"
+        # 계획 프롬프트나 계획 스키마가 바뀌면 올려서 캐시된 계획을 무효화한다.
+        self.plan_version = "v1"
+        self.plan_model = "gpt-4o-mini"
+        self.plan_temperature = 0.0
+        self.plan_cache_size = 512
+        self.plan_cache_ttl_seconds = 3600.0
+        # 계획 프롬프트에 넣을 도구 카드의 토큰 예산. 넘으면 축약 카드를 쓴다.
+        self.plan_tool_card_token_budget = 2000
+        # 재계획을 포함한 요청 하나의 전체 시간 예산(초).
+        self.default_time_budget_seconds = 30.0
+        # 계획의 policy.timeout_ms/step.timeout_ms로 줄 수 있는 최대 단계 제한 시간(ms).
+        self.max_step_timeout_ms = 60_000
@@ -5,20 +5,107 @@
 
 """주택 에이전트 그래프 빌더 모듈."""
 
-from langgraph.graph import StateGraph
+from __future__ import annotations
 
+import inspect
+from typing import Callable
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START, StateGraph
+
+from fourthsession.core.common.queue.job_cancellation import get_cancel_token
+
+from fourthsession.core.housing_agent.nodes.execute_node import ExecuteNode
+from fourthsession.core.housing_agent.nodes.feedback_node import FeedbackLoopNode
+from fourthsession.core.housing_agent.nodes.merge_node import MergeResultNode
+from fourthsession.core.housing_agent.nodes.plan_node import PlanNode
+from fourthsession.core.housing_agent.nodes.validate_plan_node import ValidatePlanNode
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
 
 
 class HousingAgentGraphBuilder:
     """주택 에이전트 그래프 빌더."""
 
+    def __init__(
+        self,
+        plan_node: PlanNode | None = None,
+        validate_node: ValidatePlanNode | None = None,
+        execute_node: ExecuteNode | None = None,
+        merge_node: MergeResultNode | None = None,
+        feedback_node: FeedbackLoopNode | None = None,
+    ) -> None:
+        """그래프에 넣을 노드를 초기화한다.
+
+        Args:
+            plan_node (PlanNode | None): 계획 생성 노드.
+            validate_node (ValidatePlanNode | None): 계획 검증 노드.
+            execute_node (ExecuteNode | None): 도구 실행 노드.
+            merge_node (MergeResultNode | None): 결과 합성 노드.
+            feedback_node (FeedbackLoopNode | None): 관찰/피드백 노드.
+        """
+        self._feedback_node = feedback_node or FeedbackLoopNode()
+        self._plan_node = plan_node or PlanNode()
+        self._validate_node = validate_node or ValidatePlanNode(feedback_node=self._feedback_node)
+        self._execute_node = execute_node or ExecuteNode()
+        self._merge_node = merge_node or MergeResultNode()
+
     def build(self) -> StateGraph:
         """그래프를 구성해 반환한다.
 
+        Plan → Validate → Execute → Merge → Feedback 순서로 흐르고, 검증 실패나
+        피드백 실패 시 재시도/시간 예산이 남아 있으면 Plan으로 돌아간다.
+        재계획 후 Execute는 바뀐 단계만 실행한다.
+
         Returns:
             StateGraph: 구성된 LangGraph 그래프.
         """
-        # TODO: 노드 추가, 엣지 연결, 시작/종료 노드 구성을 구현한다.
-        # - Plan → Validate → Execute → Merge → Feedback → End
-        raise NotImplementedError("TODO: 그래프 빌더 구현")
+        graph = StateGraph(HousingAgentState)
+        graph.add_node("plan", self._cancellable(self._plan_node))
+        graph.add_node("validate", self._cancellable(self._validate_node))
+        graph.add_node("execute", self._cancellable(self._execute_node))
+        graph.add_node("merge", self._cancellable(self._merge_node))
+        graph.add_node("feedback", self._cancellable(self._feedback_node))
+
+        graph.add_edge(START, "plan")
+        graph.add_edge("plan", "validate")
+        graph.add_conditional_edges(
+            "validate",
+            self._route_after_validate,
+            {"execute": "execute", "plan": "plan", "merge": "merge"},
+        )
+        graph.add_edge("execute", "merge")
+        graph.add_edge("merge", "feedback")
+        graph.add_conditional_edges(
+            "feedback",
+            self._route_after_feedback,
+            {"plan": "plan", "end": END},
+        )
+        return graph
+
+    def _cancellable(self, node: Callable) -> Callable:
+        """노드 실행 전에 취소 여부를 확인하는 래퍼를 만든다.
+
+        invoke config의 configurable.cancel_token이 취소되었으면 다음 노드로
+        넘어가지 않고 JobCancelledError를 발생시킨다. config를 받는 노드에는
+        그대로 넘겨 노드 안에서도 취소를 확인하게 한다.
+        """
+        accepts_config = "config" in inspect.signature(node).parameters
+
+        def run(state: HousingAgentState, config: RunnableConfig) -> dict:
+            token = get_cancel_token(config)
+            if token is not None:
+                token.raise_if_cancelled()
+            return node(state, config) if accepts_config else node(state)
+
+        return run
+
+    def _route_after_validate(self, state: HousingAgentState) -> str:
+        """검증 결과에 따라 다음 노드를 정한다."""
+        if state.plan_valid:
+            return "execute"
+        # 재계획 여부는 ValidatePlanNode가 재시도 횟수를 올리기 전에 이미 정했다.
+        return "merge" if state.finalized else "plan"
+
+    def _route_after_feedback(self, state: HousingAgentState) -> str:
+        """피드백 결과에 따라 재계획 여부를 정한다."""
+        return "end" if state.finalized else "plan"
@@ -5,22 +5,435 @@
 
 """도구 실행 노드 모듈."""
 
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from langchain_core.runnables import RunnableConfig
+
+from fourthsession.core.common.queue.job_cancellation import (
+    CancellationToken,
+    JobCancelledError,
+    get_cancel_token,
+)
+from fourthsession.core.common.repository.sqlite.query_deadline import query_deadline
+from fourthsession.core.common.tools.tool_output_store import (
+    publish_tool_output,
+    resolve_tool_output,
+)
+from fourthsession.core.housing_agent.const.agent_constants import HousingAgentConstants
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
+from fourthsession.mcp.mcp_session_pool import McpSessionPool
+from fourthsession.mcp.tool_registry import HousingToolRegistry
+
+logger = logging.getLogger(__name__)
+
+# 풀에서 아직 시작하지 않은 단계가 있을 때 시작 여부를 다시 확인하는 간격(초).
+_START_POLL_INTERVAL = 0.05
+
+
+def build_step_graph(steps: list[dict]) -> dict[str, set[str]]:
+    """계획 단계의 의존성 그래프를 만든다.
+
+    id가 없는 단계는 1부터 시작하는 순번을 id로 쓴다. 중복 id, 존재하지 않는
+    단계에 대한 의존, 순환 의존이 있으면 실행 전에 ValueError를 발생시킨다.
+
+    Args:
+        steps (list[dict]): 계획 단계 목록.
+
+    Returns:
+        dict[str, set[str]]: 단계 id → 선행 단계 id 집합.
+    """
+    graph: dict[str, set[str]] = {}
+    for index, step in enumerate(steps, start=1):
+        step_id = _step_id(step, index)
+        if step_id in graph:
+            raise ValueError(f"중복된 단계 id입니다: {step_id}")
+        graph[step_id] = {str(dep) for dep in step.get("depends_on") or []}
+
+    for step_id, deps in graph.items():
+        unknown = deps - graph.keys()
+        if unknown:
+            raise ValueError(f"단계 {step_id}의 depends_on에 없는 단계가 있습니다: {sorted(unknown)}")
+
+    # 위상 정렬이 끝나지 않으면 순환 의존이다.
+    resolved: set[str] = set()
+    remaining = dict(graph)
+    while remaining:
+        ready = [step_id for step_id, deps in remaining.items() if deps <= resolved]
+        if not ready:
+            raise ValueError(f"순환 의존성이 있습니다: {sorted(remaining)}")
+        for step_id in ready:
+            resolved.add(step_id)
+            del remaining[step_id]
+    return graph
+
+
+def build_step_signatures(steps: list[dict], graph: dict[str, set[str]]) -> dict[str, str]:
+    """단계별 실행 서명을 만든다.
+
+    서명은 Tool 이름, 정규화한 input, 선행 단계 서명으로 정해지므로 재계획으로
+    id가 바뀌어도 같은 호출이면 같은 서명이 나온다.
+
+    Args:
+        steps (list[dict]): 계획 단계 목록.
+        graph (dict[str, set[str]]): build_step_graph로 만든 의존성 그래프.
+
+    Returns:
+        dict[str, str]: 단계 id → 서명.
+    """
+    by_id = {_step_id(step, index): step for index, step in enumerate(steps, start=1)}
+    signatures: dict[str, str] = {}
+
+    def _sign(step_id: str) -> str:
+        if step_id not in signatures:
+            step = by_id[step_id]
+            encoded = json.dumps(
+                [
+                    step.get("tool"),
+                    step.get("input") or {},
+                    sorted(_sign(dep) for dep in graph[step_id]),
+                ],
+                sort_keys=True,
+                ensure_ascii=False,
+                default=str,
+            )
+            signatures[step_id] = hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+        return signatures[step_id]
+
+    for step_id in graph:
+        _sign(step_id)
+    return signatures
+
+
+def _step_id(step: dict, index: int) -> str:
+    """단계 id를 문자열로 정규화한다."""
+    return str(step.get("id", index))
 
 
 class ExecuteNode:
     """도구 실행 노드."""
 
-    def __call__(self, state: HousingAgentState) -> dict:
+    def __init__(
+        self,
+        registry: HousingToolRegistry | None = None,
+        max_workers: int = 4,
+        step_timeout: float = 10.0,
+        session_pool: McpSessionPool | None = None,
+        queue_timeout: float = 30.0,
+        max_step_timeout: float | None = None,
+    ) -> None:
+        """실행 노드를 초기화한다.
+
+        Args:
+            registry (HousingToolRegistry | None): Tool 레지스트리.
+            max_workers (int): 동시에 실행할 최대 단계 수.
+            step_timeout (float): 단계별 기본 제한 시간(초). plan.policy.timeout_ms나
+                step.timeout_ms가 있으면 그 값을 우선한다.
+            session_pool (McpSessionPool | None): MCP 세션 풀. 있으면 레지스트리 대신
+                HousingMcpServer에 Tool 호출을 보낸다.
+            queue_timeout (float): 단계가 풀에서 시작을 기다릴 수 있는 최대 시간(초).
+                단계 제한 시간은 실제로 시작한 시점부터 센다.
+            max_step_timeout (float | None): timeout_ms로 줄 수 있는 최대 제한 시간(초).
+                없으면 HousingAgentConstants.max_step_timeout_ms를 쓴다.
+        """
+        if registry is None and session_pool is None:
+            registry = HousingToolRegistry()
+            registry.register_tools()
+        self._registry = registry
+        self._session_pool = session_pool
+        self._step_timeout = step_timeout
+        self._queue_timeout = queue_timeout
+        if max_step_timeout is None:
+            max_step_timeout = HousingAgentConstants().max_step_timeout_ms / 1000
+        self._max_step_timeout = max_step_timeout
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="housing-step",
+        )
+        self._abandoned_lock = threading.Lock()
+        self._abandoned_running = 0
+        self._abandoned_total = 0
+
+    def __call__(self, state: HousingAgentState, config: RunnableConfig | None = None) -> dict:
         """도구 실행 결과를 상태 업데이트로 반환한다.
 
+        의존성이 모두 끝난 단계부터 풀에 제출하므로 서로 독립인 단계는 동시에
+        실행된다. 선행 단계가 실패하면 뒤 단계는 skipped로 기록한다. 재계획 후에는
+        이전 tool_results 중 서명이 같은 성공 결과를 재사용하고 바뀐 단계만 실행한다.
+        config의 취소 토큰이 취소되면 남은 단계를 제출하지 않고 바로
+        JobCancelledError를 발생시킨다.
+
         Args:
             state (HousingAgentState): 현재 상태.
+            config (RunnableConfig | None): 그래프 실행 설정.
 
         Returns:
             dict: 상태 업데이트 딕셔너리.
+
+        Raises:
+            JobCancelledError: 실행 중에 작업이 취소된 경우.
+        """
+        token = get_cancel_token(config)
+        plan = state.plan or {}
+        steps = plan.get("steps") or []
+        try:
+            graph = build_step_graph(steps)
+        except ValueError as error:
+            return {"tool_results": [], "errors": [str(error)]}
+
+        default_timeout = self._resolve_timeout(plan.get("policy") or {}, self._step_timeout)
+        by_id = {_step_id(step, index): step for index, step in enumerate(steps, start=1)}
+        signatures = build_step_signatures(steps, graph)
+        results: dict[str, dict] = {}
+        # Future -> (단계 id, 제출 시각, 제한 시간). 시작 시각은 _run_step이 starts에 기록한다.
+        running: dict[Future, tuple[str, float, float]] = {}
+        starts: dict[str, float] = {}
+        pending = dict(graph)
+
+        # 출력이 저장소에서 밀려난 결과는 재사용하지 않고 다시 실행한다.
+        reusable = {
+            result["signature"]: result
+            for result in state.tool_results
+            if result.get("status") == "ok"
+            and result.get("signature")
+            and (result.get("output_ref") is None or resolve_tool_output(result["output_ref"]) is not None)
+        }
+        for step_id, signature in signatures.items():
+            if signature in reusable:
+                step = by_id[step_id]
+                reused = {key: value for key, value in reusable[signature].items() if key != "output_key"}
+                reused.update(id=step.get("id", step_id), reused=True)
+                if step.get("output_key"):
+                    reused["output_key"] = step["output_key"]
+                results[step_id] = reused
+                del pending[step_id]
+
+        # 취소되면 완료되는 표식. 단계를 기다리는 중에도 바로 깨어나도록 함께 기다린다.
+        cancelled: Future = Future()
+        remove_callback = token.add_callback(lambda: cancelled.set_result(None)) if token else None
+        try:
+            while pending or running:
+                if token is not None and token.cancelled:
+                    # 이미 실행 중인 스레드는 중단할 수 없으므로 결과를 기다리지 않는다.
+                    for future in running:
+                        future.cancel()
+                    raise JobCancelledError(token.job_id)
+                self._submit_ready(pending, results, running, starts, by_id, default_timeout, token)
+                if not running:
+                    break
+                now = time.perf_counter()
+                wait_timeout = min(self._deadline(entry, starts) for entry in running.values()) - now
+                if any(step_id not in starts for step_id, _, _ in running.values()):
+                    # 시작한 단계는 마감이 앞당겨지므로 짧게 깨어나 다시 계산한다.
+                    wait_timeout = min(wait_timeout, _START_POLL_INTERVAL)
+                done, _ = wait(
+                    [*running, cancelled],
+                    timeout=max(wait_timeout, 0.0),
+                    return_when=FIRST_COMPLETED,
+                )
+                now = time.perf_counter()
+                for future in list(running):
+                    step_id, submitted, timeout = running[future]
+                    started = starts.get(step_id)
+                    if future in done:
+                        results[step_id] = self._step_result(
+                            by_id[step_id], step_id, started or submitted, now, future=future
+                        )
+                        results[step_id]["signature"] = signatures[step_id]
+                    elif now < self._deadline(running[future], starts):
+                        continue
+                    elif started is None and future.cancel():
+                        results[step_id] = self._step_result(
+                            by_id[step_id], step_id, now, now, status="timeout",
+                            error=f"실행 대기 시간 {self._queue_timeout:g}s를 넘겨 시작하지 못했습니다.",
+                        )
+                    else:
+                        self._abandon(future, by_id[step_id])
+                        results[step_id] = self._step_result(
+                            by_id[step_id], step_id, started or submitted, now, status="timeout",
+                            error=f"제한 시간 {timeout:.3f}s를 초과했습니다.",
+                        )
+                    del running[future]
+        finally:
+            if remove_callback is not None:
+                remove_callback()
+
+        tool_results = [results[step_id] for step_id in by_id if step_id in results]
+        errors = [
+            f"[{result['id']}] {result['tool']}: {result['error']}"
+            for result in tool_results
+            if result["status"] != "ok"
+        ]
+        return {"tool_results": tool_results, "errors": errors}
+
+    def metrics(self) -> dict:
+        """실행 풀 지표를 반환한다.
+
+        Returns:
+            dict: 풀 크기, 제한 시간을 넘겨 버렸지만 아직 실행 중인 단계 수와 누적 수.
+        """
+        with self._abandoned_lock:
+            return {
+                "max_workers": self._max_workers,
+                "abandoned_running": self._abandoned_running,
+                "abandoned_total": self._abandoned_total,
+            }
+
+    def close(self) -> None:
+        """실행 풀을 종료한다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _deadline(self, entry: tuple[str, float, float], starts: dict[str, float]) -> float:
+        """단계의 마감 시각을 반환한다. 시작 전이면 풀 대기 마감을 쓴다."""
+        step_id, submitted, timeout = entry
+        started = starts.get(step_id)
+        if started is None:
+            return submitted + self._queue_timeout
+        return started + timeout
+
+    def _abandon(self, future: Future, step: dict) -> None:
+        """제한 시간을 넘긴 채 실행 중인 단계를 기록한다.
+
+        스레드는 멈출 수 없으므로 끝날 때까지 풀 슬롯을 차지한다. 이런 단계가
+        쌓이면 뒤 단계가 시작하지 못하므로 경고를 남기고 수를 센다.
+        """
+        with self._abandoned_lock:
+            self._abandoned_running += 1
+            self._abandoned_total += 1
+            running = self._abandoned_running
+        logger.warning(
+            "제한 시간을 넘긴 단계를 버렸습니다: tool=%s, 실행 중인 버린 단계 %d/%d",
+            step.get("tool"),
+            running,
+            self._max_workers,
+        )
+        future.add_done_callback(self._on_abandoned_done)
+
+    def _on_abandoned_done(self, future: Future) -> None:
+        """버린 단계의 스레드가 끝나면 수를 줄인다."""
+        with self._abandoned_lock:
+            self._abandoned_running -= 1
+
+    def _submit_ready(
+        self,
+        pending: dict[str, set[str]],
+        results: dict[str, dict],
+        running: dict[Future, tuple[str, float, float]],
+        starts: dict[str, float],
+        by_id: dict[str, dict],
+        default_timeout: float,
+        token: CancellationToken | None = None,
+    ) -> None:
+        """선행 단계가 모두 끝난 단계를 제출하고 실패한 선행 단계가 있으면 건너뛴다."""
+        for step_id, deps in list(pending.items()):
+            if not deps <= results.keys():
+                continue
+            del pending[step_id]
+            step = by_id[step_id]
+            failed = sorted(dep for dep in deps if results[dep]["status"] != "ok")
+            if failed:
+                now = time.perf_counter()
+                results[step_id] = self._step_result(
+                    step, step_id, now, now, status="skipped",
+                    error=f"선행 단계 {failed}가 실패해 실행하지 않았습니다.",
+                )
+                continue
+            timeout = self._resolve_timeout(step, default_timeout)
+            future = self._executor.submit(self._run_step, step, timeout, token, step_id, starts)
+            running[future] = (step_id, time.perf_counter(), timeout)
+
+    def _run_step(
+        self,
+        step: dict,
+        timeout: float,
+        token: CancellationToken | None = None,
+        step_id: str | None = None,
+        starts: dict[str, float] | None = None,
+    ) -> tuple[dict, float]:
+        """단계 하나를 실행하고 결과와 실제 실행 시간(초)을 반환한다.
+
+        시작 시각을 starts에 기록해 풀에서 기다린 시간이 제한 시간에 들어가지
+        않게 한다. 레지스트리 Tool의 SQLite 질의는 제한 시간을 넘기면 중단된다.
+        """
+        started = time.perf_counter()
+        if starts is not None:
+            starts[step_id] = started
+        # 풀에서 기다리는 동안 취소되었으면 Tool을 호출하지 않는다.
+        if token is not None:
+            token.raise_if_cancelled()
+        if step.get("action", "tool_call") != "tool_call":
+            raise ValueError(f"지원하지 않는 action입니다: {step.get('action')}")
+        tool_name = step.get("tool", "")
+        if self._session_pool is not None:
+            # list_tools는 풀에 캐시되어 있어 Tool 호출 RPC 한 번만 든다.
+            if tool_name not in {tool["name"] for tool in self._session_pool.list_tools()}:
+                raise ValueError(f"등록되지 않은 Tool입니다: {tool_name}")
+            output = self._session_pool.call_tool(tool_name, step.get("input") or {}, timeout)
+            return output, time.perf_counter() - started
+        tool = self._registry.get_tool(tool_name)
+        if tool is None:
+            raise ValueError(f"등록되지 않은 Tool입니다: {tool_name}")
+        with query_deadline(timeout):
+            output = tool.run(step.get("input") or {})
+        return output, time.perf_counter() - started
+
+    def _step_result(
+        self,
+        step: dict,
+        step_id: str,
+        started: float,
+        finished: float,
+        future: Future | None = None,
+        status: str = "ok",
+        error: str | None = None,
+    ) -> dict:
+        """단계 실행 결과를 tool_results 항목으로 만든다.
+
+        출력은 tool_output_store에 두고 항목에는 참조 키(output_ref)만 싣는다.
+        """
+        output = None
+        elapsed = finished - started
+        if future is not None:
+            try:
+                output, elapsed = future.result()
+            except Exception as exc:  # noqa: BLE001 - 단계 실패는 결과로 기록한다.
+                status, error = "error", str(exc) or exc.__class__.__name__
+            else:
+                if isinstance(output, dict) and "error" in output:
+                    status, error = "error", str(output["error"])
+        result = {
+            "id": step.get("id", step_id),
+            "tool": step.get("tool"),
+            "input": step.get("input") or {},
+            "status": status,
+            "output_ref": publish_tool_output(step_id, output),
+            "error": error,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "reused": False,
+        }
+        if step.get("output_key"):
+            result["output_key"] = step["output_key"]
+        return result
+
+    def _resolve_timeout(self, source: dict, default: float) -> float:
+        """timeout_ms 설정을 초 단위 제한 시간으로 바꾼다.
+
+        수가 아니거나 유한하지 않은 값은 무시하고 기본값을 쓴다. 검증 노드를 거치지 않은
+        계획도 있으므로 1ms~max_step_timeout 범위로 다시 자른다.
         """
-        # TODO: 계획에 포함된 도구를 순차/병렬로 실행한다.
-        # - ToolRegistry에서 Tool을 조회
-        # - 실패 시 errors 누적
-        raise NotImplementedError("TODO: 실행 노드 구현")
+        timeout_ms = source.get("timeout_ms")
+        if (
+            isinstance(timeout_ms, bool)
+            or not isinstance(timeout_ms, (int, float))
+            or not math.isfinite(timeout_ms)
+        ):
+            return default
+        return min(max(timeout_ms, 1.0) / 1000, self._max_step_timeout)
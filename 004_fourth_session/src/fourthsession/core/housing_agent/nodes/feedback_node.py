@@ -5,20 +5,70 @@
 
 """관찰/피드백 노드 모듈."""
 
+from __future__ import annotations
+
+import time
+from typing import Callable
+
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
 
 
 class FeedbackLoopNode:
     """관찰/피드백 루프 노드."""
 
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """노드를 초기화한다.
+
+        Args:
+            clock (Callable[[], float]): 현재 시각(epoch 초)을 반환하는 함수.
+        """
+        self._clock = clock
+
     def __call__(self, state: HousingAgentState) -> dict:
         """품질 검증 결과를 상태 업데이트로 반환한다.
 
+        모든 단계가 성공하면 바로 종료한다. 실패한 단계가 있으면 재시도 횟수와
+        시간 예산이 남아 있을 때만 재계획으로 돌려보낸다.
+
         Args:
             state (HousingAgentState): 현재 상태.
 
         Returns:
             dict: 상태 업데이트 딕셔너리.
         """
-        # TODO: 답변 품질을 검증하고 재계획 여부를 판단한다.
-        raise NotImplementedError("TODO: 피드백 노드 구현")
+        if state.finalized:
+            # 검증 단계에서 이미 재계획을 중단했다.
+            return {}
+        failed = [result for result in state.tool_results if result.get("status") != "ok"]
+        if state.plan_valid and state.tool_results and not failed:
+            return {"finalized": True}
+
+        reason = self.stop_reason(state)
+        if reason is not None:
+            return {"finalized": True, "errors": [reason]}
+        return {"finalized": False, "retry_count": state.retry_count + 1}
+
+    def stop_reason(self, state: HousingAgentState) -> str | None:
+        """재계획을 더 하면 안 되는 이유를 반환한다.
+
+        지금까지 반복 한 번에 든 평균 시간만큼 한 번 더 돌았을 때 시간 예산을
+        넘기면 재계획하지 않는다.
+
+        Args:
+            state (HousingAgentState): 현재 상태.
+
+        Returns:
+            str | None: 중단 사유. 재계획할 수 있으면 None.
+        """
+        if state.retry_count >= state.max_retries:
+            return f"재시도 한도({state.max_retries}회)에 도달해 재계획을 중단합니다."
+        if state.started_at is None:
+            return None
+        elapsed = self._clock() - state.started_at
+        per_iteration = elapsed / (state.retry_count + 1)
+        if elapsed + per_iteration > state.time_budget_seconds:
+            return (
+                f"시간 예산({state.time_budget_seconds:g}s) 안에 재계획을 마칠 수 없어 "
+                f"중단합니다(경과 {elapsed:.1f}s)."
+            )
+        return None
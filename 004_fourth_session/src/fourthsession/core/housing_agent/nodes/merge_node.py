@@ -5,6 +5,9 @@
 
 """결과 합성 노드 모듈."""
 
+from __future__ import annotations
+
+from fourthsession.core.common.tools.tool_output_store import resolve_tool_output
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
 
 
@@ -14,11 +17,63 @@ class MergeResultNode:
     def __call__(self, state: HousingAgentState) -> dict:
         """합성 결과를 상태 업데이트로 반환한다.
 
+        성공한 단계 결과만 요약하고 실패한 단계는 따로 표시한다(partial_ok).
+        출력은 output_ref로 tool_output_store에서 읽는다.
+
         Args:
             state (HousingAgentState): 현재 상태.
 
         Returns:
             dict: 상태 업데이트 딕셔너리.
         """
-        # TODO: 도구 결과를 합성하고 답변 생성에 필요한 구조를 만든다.
-        raise NotImplementedError("TODO: 합성 노드 구현")
+        lines: list[str] = []
+        failed: list[str] = []
+        for result in state.tool_results:
+            if result.get("status") != "ok":
+                failed.append(f"[{result.get('id')}] {result.get('tool')}: {result.get('error')}")
+                continue
+            output = resolve_tool_output(result.get("output_ref"))
+            if output is None and result.get("output_ref") is not None:
+                failed.append(f"[{result.get('id')}] {result.get('tool')}: 출력이 저장소에서 만료되었습니다.")
+                continue
+            lines.append(self._summarize(result.get("tool"), output or {}))
+
+        if not lines:
+            reason = failed or state.errors[-3:] or ["실행된 도구가 없습니다."]
+            return {"answer": "요청을 처리하지 못했습니다. " + " / ".join(reason)}
+        if failed:
+            lines.append("일부 단계가 실패했습니다: " + " / ".join(failed))
+        return {"answer": "\n".join(lines)}
+
+    def _summarize(self, tool: str | None, output: dict) -> str:
+        """Tool 결과 하나를 한 줄 요약으로 만든다."""
+        if tool == "housing_price_stats_tool":
+            if not output.get("count"):
+                return "조건에 맞는 주택이 없습니다."
+            return (
+                f"가격 통계: 표본 {output['count']}건, 평균 {output['average']:,.0f}, "
+                f"중앙값 {output['median']:,.0f}, 최소 {output['min']:,.0f}, 최대 {output['max']:,.0f}"
+            )
+        if tool == "housing_list_tool":
+            items = output.get("items") or []
+            if not items:
+                return "조건에 맞는 주택이 없습니다."
+            houses = "; ".join(
+                f"가격 {self._number(item.get('price'))} / 면적 {self._number(item.get('area'))}"
+                f" / 침실 {self._number(item.get('bedrooms'))}"
+                for item in items
+            )
+            more = " (다음 페이지 있음)" if output.get("next_cursor") else ""
+            return f"주택 {output.get('count', len(items))}건(가격 오름차순): {houses}{more}"
+        if tool == "housing_price_aggregate_tool":
+            groups = ", ".join(
+                f"{group['key']}: {group['count']}건 평균 {group['average']:,.0f}"
+                for group in output.get("groups") or []
+                if group.get("count")
+            )
+            return f"{output.get('group_by') or '전체'}별 가격 집계: {groups or '결과 없음'}"
+        return f"{tool}: {output}"
+
+    def _number(self, value: float | None) -> str:
+        """숫자를 천 단위로 구분해 표시한다. NULL 값은 "-"로 표시한다."""
+        return "-" if value is None else f"{value:,.0f}"
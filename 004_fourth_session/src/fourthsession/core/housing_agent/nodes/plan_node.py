@@ -5,22 +5,260 @@
 
 """계획 생성 노드 모듈."""
 
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import json_repair
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from fourthsession.core.common.queue.job_cancellation import (
+    CancellationToken,
+    JobCancelledError,
+    get_cancel_token,
+)
+from fourthsession.core.common.tools.tool_card_store import resolve_tool_card_catalog
+from fourthsession.core.housing_agent.const.agent_constants import HousingAgentConstants
+from fourthsession.core.housing_agent.planning.fast_planner import FastPathPlanner
+from fourthsession.core.housing_agent.planning.plan_cache import (
+    PlanCache,
+    plan_cache_version,
+)
+from fourthsession.core.housing_agent.prompts.agent_prompts import HousingAgentPrompts
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
 
 
 class PlanNode:
     """계획 생성 노드."""
 
-    def __call__(self, state: HousingAgentState) -> dict:
+    def __init__(
+        self,
+        chat_model: BaseChatModel | None = None,
+        plan_cache: PlanCache | None = None,
+        template_mode: bool = False,
+        fast_planner: FastPathPlanner | None = None,
+        enable_fast_path: bool = True,
+        constants: HousingAgentConstants | None = None,
+        prompts: HousingAgentPrompts | None = None,
+    ) -> None:
+        """노드 의존성을 초기화한다.
+
+        Args:
+            chat_model (BaseChatModel | None): 계획 생성 모델. 없으면 처음 필요할 때 만든다.
+            plan_cache (PlanCache | None): 계획 캐시. 없으면 상수 기준으로 만든다.
+            template_mode (bool): 기본 캐시를 만들 때 템플릿 모드를 켤지 여부.
+            fast_planner (FastPathPlanner | None): 규칙 기반 빠른 계획기.
+            enable_fast_path (bool): 빠른 계획기 사용 여부.
+            constants (HousingAgentConstants | None): 에이전트 상수.
+            prompts (HousingAgentPrompts | None): 프롬프트 모음.
+        """
+        self._constants = constants or HousingAgentConstants()
+        self._prompts = prompts or HousingAgentPrompts()
+        self._chat_model = chat_model
+        self._plan_cache = plan_cache or PlanCache(
+            max_entries=self._constants.plan_cache_size,
+            ttl_seconds=self._constants.plan_cache_ttl_seconds,
+            template_mode=template_mode,
+        )
+        self._fast_planner = None
+        if enable_fast_path:
+            self._fast_planner = fast_planner or FastPathPlanner(constants=self._constants)
+        self._llm_loop: asyncio.AbstractEventLoop | None = None
+        self._llm_loop_lock = threading.Lock()
+
+    @property
+    def plan_cache(self) -> PlanCache:
+        """계획 캐시를 반환한다."""
+        return self._plan_cache
+
+    @property
+    def fast_planner(self) -> FastPathPlanner | None:
+        """빠른 계획기를 반환한다."""
+        return self._fast_planner
+
+    def __call__(self, state: HousingAgentState, config: RunnableConfig | None = None) -> dict:
         """계획을 생성하고 상태 업데이트를 반환한다.
 
+        단순한 질문은 빠른 계획기가 규칙으로 바로 계획을 만들고, 같은 질문
+        (템플릿 모드면 숫자만 다른 질문)의 계획이 캐시에 있으면 LLM을 호출하지 않는다.
+        피드백 루프로 다시 들어온 경우에는 이전 계획과 실패 내용을 LLM에 넘겨
+        실패한 단계만 고치게 한다. config에 취소 토큰이 있으면 취소되는 즉시
+        진행 중인 LLM 호출을 끊는다.
+
         Args:
             state (HousingAgentState): 현재 상태.
+            config (RunnableConfig | None): 그래프 실행 설정.
 
         Returns:
             dict: 상태 업데이트 딕셔너리.
         """
-        # TODO: LLM을 호출해 계획 JSON을 생성한다.
-        # - 도구 카드 기반으로 steps 구성
-        # - JSON만 출력하도록 강제
-        raise NotImplementedError("TODO: 계획 노드 구현")
+        update = self._plan(state, get_cancel_token(config))
+        if state.started_at is None:
+            update["started_at"] = time.time()
+        return update
+
+    def _plan(self, state: HousingAgentState, token: CancellationToken | None = None) -> dict:
+        """상황에 맞는 경로로 계획을 만든다."""
+        question = (state.question or "").strip()
+        if not question:
+            return {"plan": None, "errors": ["질문이 비어 있습니다."]}
+
+        version = plan_cache_version(self._constants.plan_version, state.tool_cards_version)
+        if state.retry_count > 0 and state.plan is not None:
+            return self._replan(state, question, version, token)
+
+        if self._fast_planner is not None:
+            plan = self._fast_planner.plan(question, state.tool_cards)
+            if plan is not None:
+                return {"plan": plan, "plan_source": "fast_path"}
+
+        cached = self._plan_cache.get(question, version)
+        if cached is not None:
+            plan, source = cached
+            return {"plan": plan, "plan_source": source}
+
+        try:
+            plan = self._generate_plan(
+                self._prompts.plan_prompt(),
+                {"question": question, "tool_cards": self._tool_card_text(state)},
+                token,
+            )
+        except JobCancelledError:
+            raise
+        except Exception as error:  # noqa: BLE001 - LLM/파싱 실패는 errors로 전달한다.
+            return {"plan": None, "errors": [f"계획 생성 실패: {error}"]}
+
+        if self._is_cacheable(plan, state.tool_cards):
+            self._plan_cache.put(question, version, plan)
+        return {"plan": plan, "plan_source": "llm"}
+
+    def _replan(
+        self,
+        state: HousingAgentState,
+        question: str,
+        version: str,
+        token: CancellationToken | None = None,
+    ) -> dict:
+        """이전 계획과 실패 내용을 바탕으로 계획을 고친다."""
+        # 실패한 계획이 캐시에서 다시 나오지 않도록 먼저 지운다.
+        self._plan_cache.discard(question, version)
+        feedback = [
+            {"id": result.get("id"), "tool": result.get("tool"), "status": result.get("status"),
+             "error": result.get("error")}
+            for result in state.tool_results
+            if result.get("status") != "ok"
+        ]
+        if not feedback:
+            feedback = [{"error": message} for message in state.errors[-5:]]
+        try:
+            plan = self._generate_plan(
+                self._prompts.replan_prompt(),
+                {
+                    "question": question,
+                    "tool_cards": self._tool_card_text(state),
+                    "previous_plan": self._dump(state.plan),
+                    "feedback": self._dump(feedback),
+                },
+                token,
+            )
+        except JobCancelledError:
+            raise
+        except Exception as error:  # noqa: BLE001 - LLM/파싱 실패는 errors로 전달한다.
+            return {"plan": None, "errors": [f"재계획 실패: {error}"]}
+        return {"plan": plan, "plan_source": "replan"}
+
+    def _generate_plan(
+        self,
+        template: str,
+        variables: dict,
+        token: CancellationToken | None = None,
+    ) -> dict:
+        """LLM으로 계획 JSON을 생성한다."""
+        prompt = PromptTemplate.from_template(template)
+        chain = prompt | self._get_chat_model() | StrOutputParser()
+        plan = json_repair.loads(self._invoke_chain(chain, variables, token))
+        if not isinstance(plan, dict) or not isinstance(plan.get("steps"), list):
+            raise ValueError("steps 배열을 가진 JSON 객체가 아닙니다.")
+        return plan
+
+    def _invoke_chain(
+        self,
+        chain: Runnable,
+        variables: dict,
+        token: CancellationToken | None,
+    ) -> str:
+        """체인을 실행한다. 토큰이 있으면 취소될 때 호출을 끊는다.
+
+        비동기 호출은 태스크를 취소하면 HTTP 요청도 닫히므로 노드 전용 이벤트
+        루프에서 ainvoke로 실행하고, 토큰이 취소되면 그 태스크를 취소한다.
+        """
+        if token is None:
+            return chain.invoke(variables)
+        token.raise_if_cancelled()
+        future = asyncio.run_coroutine_threadsafe(chain.ainvoke(variables), self._get_llm_loop())
+        remove_callback = token.add_callback(future.cancel)
+        try:
+            return future.result()
+        except CancelledError:
+            raise JobCancelledError(token.job_id) from None
+        finally:
+            remove_callback()
+
+    def _get_llm_loop(self) -> asyncio.AbstractEventLoop:
+        """LLM 비동기 호출용 이벤트 루프를 반환한다.
+
+        비동기 HTTP 클라이언트가 루프에 묶이므로 호출마다 새 루프를 만들지 않고
+        전용 스레드의 루프 하나를 계속 쓴다.
+        """
+        if self._llm_loop is None:
+            with self._llm_loop_lock:
+                if self._llm_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="housing-plan-llm",
+                        daemon=True,
+                    ).start()
+                    self._llm_loop = loop
+        return self._llm_loop
+
+    def _tool_card_text(self, state: HousingAgentState) -> str:
+        """카탈로그에 미리 직렬화해 둔 도구 카드 텍스트를 반환한다."""
+        catalog = resolve_tool_card_catalog(state.tool_cards_version)
+        if catalog is None:
+            return self._dump(state.tool_cards)
+        return catalog.prompt_text(self._constants.plan_tool_card_token_budget)
+
+    def _dump(self, value: object) -> str:
+        """프롬프트에 넣을 JSON 문자열을 만든다."""
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    def _get_chat_model(self) -> BaseChatModel:
+        """계획 생성 모델을 반환한다."""
+        if self._chat_model is None:
+            from langchain_openai import ChatOpenAI
+
+            self._chat_model = ChatOpenAI(
+                model=self._constants.plan_model,
+                temperature=self._constants.plan_temperature,
+            )
+        return self._chat_model
+
+    def _is_cacheable(self, plan: dict, tool_cards: tuple) -> bool:
+        """등록된 Tool만 호출하는 계획인지 확인한다. 잘못된 계획은 캐시하지 않는다."""
+        tool_names = {card.get("name") for card in tool_cards}
+        steps = plan.get("steps") or []
+        return bool(steps) and all(
+            isinstance(step, dict)
+            and step.get("action", self._constants.plan_action_name)
+            == self._constants.plan_action_name
+            and step.get("tool") in tool_names
+            for step in steps
+        )
@@ -5,21 +5,124 @@
 
 """계획 검증 노드 모듈."""
 
+from __future__ import annotations
+
+from fourthsession.core.common.tools.schema_validator import SchemaValidator, compile_schema
+from fourthsession.core.housing_agent.const.agent_constants import HousingAgentConstants
+from fourthsession.core.housing_agent.nodes.execute_node import build_step_graph
+from fourthsession.core.housing_agent.nodes.feedback_node import FeedbackLoopNode
 from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
 
 
 class ValidatePlanNode:
     """계획 검증 노드."""
 
+    def __init__(
+        self,
+        constants: HousingAgentConstants | None = None,
+        feedback_node: FeedbackLoopNode | None = None,
+    ) -> None:
+        """노드를 초기화한다.
+
+        Args:
+            constants (HousingAgentConstants | None): 에이전트 상수.
+            feedback_node (FeedbackLoopNode | None): 재계획 중단 여부를 판단할 피드백 노드.
+        """
+        self._constants = constants or HousingAgentConstants()
+        self._feedback_node = feedback_node or FeedbackLoopNode()
+        # Tool 이름별 (스키마, 컴파일한 검사 함수). 스키마 객체가 바뀌면 다시 컴파일한다.
+        self._validators: dict[str, tuple[dict, SchemaValidator]] = {}
+
     def __call__(self, state: HousingAgentState) -> dict:
         """계획 검증 결과를 상태 업데이트로 반환한다.
 
+        검증에 실패하면 피드백 노드와 같은 규칙으로, 재시도 횟수를 올리기 전에
+        재계획을 더 할 수 있는지 확인한다. 할 수 없으면 finalized로 표시한다.
+
         Args:
             state (HousingAgentState): 현재 상태.
 
         Returns:
             dict: 상태 업데이트 딕셔너리.
         """
-        # TODO: 계획 스키마, 도구 존재 여부, 정책을 검증한다.
-        # - 실패 시 errors 누적 + retry_count 증가
-        raise NotImplementedError("TODO: 계획 검증 노드 구현")
+        errors = self.validate(state.plan, state.tool_cards)
+        if not errors:
+            return {"plan_valid": True}
+        reason = self._feedback_node.stop_reason(state)
+        if reason is not None:
+            return {"plan_valid": False, "errors": [*errors, reason], "finalized": True}
+        return {
+            "plan_valid": False,
+            "errors": errors,
+            "retry_count": state.retry_count + 1,
+        }
+
+    def validate(self, plan: dict | None, tool_cards: list[dict] | tuple) -> list[str]:
+        """계획 스키마, 도구 존재 여부, 입력 스키마, 의존성을 검사한다.
+
+        Args:
+            plan (dict | None): 검사할 계획.
+            tool_cards (list[dict] | tuple): 사용할 수 있는 도구 카드 목록.
+
+        Returns:
+            list[str]: 오류 메시지 목록. 비어 있으면 유효하다.
+        """
+        if not isinstance(plan, dict):
+            return ["계획이 JSON 객체가 아닙니다."]
+        steps = plan.get("steps")
+        if not isinstance(steps, list) or not steps:
+            return ["계획에 steps가 없습니다."]
+
+        errors: list[str] = []
+        policy = plan.get("policy")
+        if policy is not None and not isinstance(policy, dict):
+            errors.append("policy가 객체가 아닙니다.")
+        elif policy:
+            errors.extend(self._timeout_errors(policy, "policy"))
+
+        schemas = {card.get("name"): card.get("input_schema") or {} for card in tool_cards}
+        for index, step in enumerate(steps, start=1):
+            if not isinstance(step, dict):
+                errors.append(f"step {index}: 객체가 아닙니다.")
+                continue
+            label = f"step {step.get('id', index)}"
+            if step.get("action") != self._constants.plan_action_name:
+                errors.append(f"{label}: action은 {self._constants.plan_action_name}이어야 합니다.")
+            errors.extend(self._timeout_errors(step, label))
+            tool_name = step.get("tool")
+            if tool_name not in schemas:
+                errors.append(f"{label}: 등록되지 않은 Tool입니다: {tool_name}")
+                continue
+            validator = self._validator(tool_name, schemas[tool_name])
+            errors.extend(
+                f"{label}: {message}" for message in validator(step.get("input", {}), "input")
+            )
+
+        if not errors:
+            try:
+                build_step_graph(steps)
+            except ValueError as error:
+                errors.append(str(error))
+        return errors
+
+    def _timeout_errors(self, source: dict, label: str) -> list[str]:
+        """timeout_ms가 있으면 1 이상 최대 제한 시간 이하의 수인지 검사한다."""
+        timeout_ms = source.get("timeout_ms")
+        if timeout_ms is None:
+            return []
+        maximum = self._constants.max_step_timeout_ms
+        if (
+            isinstance(timeout_ms, bool)
+            or not isinstance(timeout_ms, (int, float))
+            or not 1 <= timeout_ms <= maximum
+        ):
+            return [f"{label}: timeout_ms는 1 이상 {maximum} 이하의 수여야 합니다: {timeout_ms!r}"]
+        return []
+
+    def _validator(self, tool_name: str, schema: dict) -> SchemaValidator:
+        """Tool 입력 스키마의 컴파일한 검사 함수를 반환한다."""
+        cached = self._validators.get(tool_name)
+        if cached is None or cached[0] is not schema:
+            cached = (schema, compile_schema(schema))
+            self._validators[tool_name] = cached
+        return cached[1]
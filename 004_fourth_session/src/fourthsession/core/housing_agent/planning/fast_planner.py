@@ -0,0 +1,280 @@
+# 목적: 규칙 기반 빠른 계획기를 정의한다.
+# 설명: 단순한 목록/통계/집계 질문을 LLM 없이 바로 계획으로 바꾼다.
+# 디자인 패턴: 인터프리터 패턴
+# 참조: fourthsession/core/housing_agent/nodes/plan_node.py
+
+"""규칙 기반 빠른 계획기 모듈."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import Counter
+
+from fourthsession.core.housing_agent.const.agent_constants import HousingAgentConstants
+from fourthsession.core.housing_agent.nodes.validate_plan_node import ValidatePlanNode
+from fourthsession.core.housing_agent.planning.plan_cache import (
+    find_numbers,
+    normalize_question,
+)
+
+_STATS_PATTERN = re.compile(r"평균|중앙값|통계|average|mean|median|stat")
+_LIST_PATTERN = re.compile(r"목록|리스트|보여|찾아|알려|조회|검색|\blist|\bshow|\bfind|\bsearch")
+_GROUP_PATTERN = re.compile(
+    r"(침실|방|욕실|화장실|층|주차)\s*(?:수|개수)?\s*별"
+    r"|\bby\s+(bedrooms?|bathrooms?|stories|floors?|parking)\b"
+    r"|\bper\s+(bedroom|bathroom|story|floor)\b"
+)
+_GROUP_COLUMNS = {
+    "침실": "bedrooms",
+    "방": "bedrooms",
+    "bedroom": "bedrooms",
+    "bedrooms": "bedrooms",
+    "욕실": "bathrooms",
+    "화장실": "bathrooms",
+    "bathroom": "bathrooms",
+    "bathrooms": "bathrooms",
+    "층": "stories",
+    "stories": "stories",
+    "story": "stories",
+    "floor": "stories",
+    "floors": "stories",
+    "주차": "parking",
+    "parking": "parking",
+}
+# list/stats 입력 스키마로 표현할 수 없는 조건이나 정렬/비교 요청은 LLM에 맡긴다.
+_UNSUPPORTED_PATTERN = re.compile(
+    r"욕실|화장실|bath|층|stor|floor|주차|parking|도로|road|게스트|손님|guest|지하|basement"
+    r"|온수|hot\s*water|에어컨|냉방|air\s*con|선호|pref|가구|furnish|비교|compare|\bvs\b"
+    r"|상위|하위|\btop\b|가장|(?<!at )\bmost\b|(?<!at )\bleast\b|정렬|\bsort|개수|몇\s*(?:개|채|건)|how many"
+    r"|\bcount\b|제외|except|아닌|\bnot\b|또는|최대|최소|\bmax|\bmin"
+)
+_BEDROOM_AFTER = re.compile(r"^\s*(?:개의?\s*)?(?:침실|방\b|방이|방인|bed)|^-bed")
+_BEDROOM_BEFORE = re.compile(r"(?:침실|방|bedrooms?)\s*(?:수\s*)?(?:가|는|이|:|=)?\s*$")
+_BEDROOM_COMPARATOR = re.compile(
+    r"^\s*(?:개)?\s*(?:이상|이하|초과|미만|넘|or more|or less|or fewer|\+)"
+    r"|^\s*(?:개의?\s*)?(?:침실|방|bedrooms?)\s*(?:이|가)?\s*(?:이상|이하|초과|미만|or more|or less)"
+)
+_UNIT_SUFFIX = r"\s*(?:원|won|krw|sqft|sq\s*ft|제곱피트|square\s+feet)?"
+_MAX_AFTER = re.compile(
+    rf"^{_UNIT_SUFFIX}\s*(?:이하|미만|까지|아래|or less|or below|and below|and under)"
+)
+_MIN_AFTER = re.compile(
+    rf"^{_UNIT_SUFFIX}\s*(?:이상|초과|넘는|넘게|부터|or more|or above|and above|and up|\+)"
+)
+_MAX_BEFORE = re.compile(
+    r"(?:under|below|less than|at most|up to|no more than|cheaper than|smaller than|<=?|≤)\s*$"
+)
+_MIN_BEFORE = re.compile(
+    r"(?:over|above|more than|at least|greater than|bigger than|larger than|>=?|≥)\s*$"
+)
+_RANGE_GAP = re.compile(rf"^{_UNIT_SUFFIX}\s*(?:~|-|–|to|에서|부터|and)\s*$")
+_RANGE_TAIL = re.compile(rf"^{_UNIT_SUFFIX}\s*(?:사이|까지|이내)?")
+_PRICE_KEYWORD = re.compile(r"가격|집값|값|price|cost|budget|예산")
+_AREA_KEYWORD = re.compile(r"면적|넓이|\barea|\bsize|sqft|평방|제곱")
+_PRICE_SUFFIX = re.compile(r"^\s*(?:원|won|krw)")
+_AREA_SUFFIX = re.compile(r"^\s*(?:sqft|sq\s*ft|제곱피트|square\s+feet)")
+
+# 데이터셋 면적 최댓값(약 16,200)보다 충분히 큰 값은 키워드가 없어도 가격으로 본다.
+_PRICE_MAGNITUDE = 1_000_000
+
+_TOOL_BY_INTENT = {
+    "list": "housing_list_tool",
+    "stats": "housing_price_stats_tool",
+    "aggregate": "housing_price_aggregate_tool",
+}
+
+
+class _NotConfident(Exception):
+    """규칙으로 확정할 수 없는 질문임을 알린다."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class FastPathPlanner:
+    """규칙 기반 빠른 계획기."""
+
+    def __init__(
+        self,
+        validator: ValidatePlanNode | None = None,
+        constants: HousingAgentConstants | None = None,
+    ) -> None:
+        """계획기를 초기화한다.
+
+        Args:
+            validator (ValidatePlanNode | None): 계획 검증기.
+            constants (HousingAgentConstants | None): 에이전트 상수.
+        """
+        self._constants = constants or HousingAgentConstants()
+        self._validator = validator or ValidatePlanNode(self._constants)
+        self._lock = threading.Lock()
+        self._attempts = 0
+        self._hits = 0
+        self._elapsed_seconds = 0.0
+        self._hits_by_tool: Counter[str] = Counter()
+        self._fallback_reasons: Counter[str] = Counter()
+
+    def plan(self, question: str, tool_cards: list[dict] | tuple) -> dict | None:
+        """질문을 규칙으로 해석해 계획을 만든다.
+
+        해석에 확신이 있고 ValidatePlanNode 검증을 통과한 계획만 반환한다.
+        그 밖의 경우는 None을 반환해 LLM 계획으로 넘긴다.
+
+        Args:
+            question (str): 사용자 질문.
+            tool_cards (list[dict] | tuple): 사용할 수 있는 도구 카드 목록.
+
+        Returns:
+            dict | None: 계획. 확신이 없으면 None.
+        """
+        started = time.perf_counter()
+        try:
+            plan = self._build_plan(normalize_question(question))
+            if self._validator.validate(plan, tool_cards):
+                raise _NotConfident("invalid_plan")
+        except _NotConfident as miss:
+            self._record(started, reason=miss.reason)
+            return None
+        self._record(started, tool=plan["steps"][0]["tool"])
+        return plan
+
+    def metrics(self) -> dict:
+        """빠른 계획기 적중 지표를 반환한다.
+
+        Returns:
+            dict: 시도/적중 수, 적중률, Tool별 적중 수, 폴백 사유별 건수, 평균 처리 시간.
+        """
+        with self._lock:
+            return {
+                "attempts": self._attempts,
+                "hits": self._hits,
+                "fallbacks": self._attempts - self._hits,
+                "hit_rate": round(self._hits / self._attempts, 4) if self._attempts else 0.0,
+                "hits_by_tool": dict(self._hits_by_tool),
+                "fallback_reasons": dict(self._fallback_reasons),
+                "avg_latency_us": (
+                    round(self._elapsed_seconds / self._attempts * 1_000_000, 1)
+                    if self._attempts
+                    else 0.0
+                ),
+            }
+
+    def _build_plan(self, text: str) -> dict:
+        """정규화한 질문에서 의도와 필터를 뽑아 단일 단계 계획을 만든다."""
+        group_by = None
+        group_match = _GROUP_PATTERN.search(text)
+        if group_match:
+            word = next(group for group in group_match.groups() if group)
+            group_by = _GROUP_COLUMNS[word]
+            text = text[: group_match.start()] + " " + text[group_match.end() :]
+
+        if _UNSUPPORTED_PATTERN.search(text):
+            raise _NotConfident("unsupported_condition")
+
+        if group_by:
+            intent = "aggregate"
+        elif _STATS_PATTERN.search(text):
+            intent = "stats"
+        elif _LIST_PATTERN.search(text):
+            intent = "list"
+        else:
+            raise _NotConfident("unknown_intent")
+
+        tool_input = self._extract_filters(text)
+        if intent == "aggregate":
+            tool_input["group_by"] = group_by
+        elif intent == "list":
+            tool_input["limit"] = self._constants.default_list_limit
+        return {
+            "steps": [
+                {
+                    "id": 1,
+                    "action": self._constants.plan_action_name,
+                    "tool": _TOOL_BY_INTENT[intent],
+                    "input": tool_input,
+                }
+            ]
+        }
+
+    def _extract_filters(self, text: str) -> dict:
+        """질문의 모든 숫자를 침실 수/가격/면적 필터로 해석한다."""
+        numbers = find_numbers(text)
+        filters: dict = {}
+        previous_end = 0
+        index = 0
+        while index < len(numbers):
+            start, end, value, has_unit = numbers[index]
+            left = text[previous_end:start]
+            right = text[end:]
+
+            if _BEDROOM_AFTER.match(right) or (
+                _BEDROOM_BEFORE.search(left) and not has_unit and not _PRICE_SUFFIX.match(right)
+            ):
+                if _BEDROOM_COMPARATOR.match(right) or _MIN_BEFORE.search(left) or _MAX_BEFORE.search(left):
+                    raise _NotConfident("bedroom_range")
+                if not isinstance(value, int):
+                    raise _NotConfident("unparsed_number")
+                self._set_filter(filters, "bedrooms", value)
+                previous_end, index = end, index + 1
+                continue
+
+            kind = self._number_kind(left, right, value, has_unit)
+            following = numbers[index + 1] if index + 1 < len(numbers) else None
+            if following and _RANGE_GAP.match(text[end : following[0]]) and not (
+                _BEDROOM_AFTER.match(text[following[1] :])
+            ):
+                upper_value = following[2]
+                kind = kind or self._number_kind("", text[following[1] :], upper_value, following[3])
+                if kind is None or upper_value < value:
+                    raise _NotConfident("unparsed_number")
+                self._set_filter(filters, f"min_{kind}", value)
+                self._set_filter(filters, f"max_{kind}", upper_value)
+                tail = _RANGE_TAIL.match(text[following[1] :])
+                previous_end, index = following[1] + (tail.end() if tail else 0), index + 2
+                continue
+
+            if kind is None:
+                raise _NotConfident("unparsed_number")
+            if _MAX_AFTER.match(right) or _MAX_BEFORE.search(left):
+                bound = "max"
+            elif _MIN_AFTER.match(right) or _MIN_BEFORE.search(left):
+                bound = "min"
+            else:
+                raise _NotConfident("unparsed_number")
+            self._set_filter(filters, f"{bound}_{kind}", value)
+            previous_end, index = end, index + 1
+        return filters
+
+    def _number_kind(self, left: str, right: str, value: int | float, has_unit: bool) -> str | None:
+        """숫자가 가격인지 면적인지 주변 키워드와 크기로 판단한다."""
+        if _PRICE_SUFFIX.match(right):
+            return "price"
+        if _AREA_SUFFIX.match(right):
+            return "area"
+        price = [match.end() for match in _PRICE_KEYWORD.finditer(left)]
+        area = [match.end() for match in _AREA_KEYWORD.finditer(left)]
+        if price or area:
+            return "price" if max(price, default=-1) > max(area, default=-1) else "area"
+        if has_unit or value >= _PRICE_MAGNITUDE:
+            return "price"
+        return None
+
+    def _set_filter(self, filters: dict, key: str, value: int | float) -> None:
+        """같은 필터가 다른 값으로 두 번 나오면 해석을 포기한다."""
+        if key in filters and filters[key] != value:
+            raise _NotConfident("conflicting_filters")
+        filters[key] = value
+
+    def _record(self, started: float, tool: str | None = None, reason: str | None = None) -> None:
+        """시도 결과를 지표에 반영한다."""
+        with self._lock:
+            self._attempts += 1
+            self._elapsed_seconds += time.perf_counter() - started
+            if tool:
+                self._hits += 1
+                self._hits_by_tool[tool] += 1
+            else:
+                self._fallback_reasons[reason] += 1
@@ -0,0 +1,275 @@
+# 목적: 계획 캐시를 정의한다.
+# 설명: 정규화한 질문과 도구 카드 버전을 키로 LLM이 만든 계획을 재사용한다.
+# 디자인 패턴: 캐시 어사이드 패턴
+# 참조: fourthsession/core/housing_agent/nodes/plan_node.py
+
+"""계획 캐시 모듈."""
+
+from __future__ import annotations
+
+import copy
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# 앞이 영문자/숫자가 아닌 숫자만 잡아 p25, v1 같은 식별자는 제외한다.
+_NUMBER_PATTERN = re.compile(
+    r"(?<![A-Za-z\d.,])(\d{1,3}(?:,\d{3})+|\d+)(\.\d+)?(?:\s*(억|천만|백만|만|천))?"
+)
+_UNIT_MULTIPLIERS = {"억": 100_000_000, "천만": 10_000_000, "백만": 1_000_000, "만": 10_000, "천": 1_000}
+_NUMBER_TOKEN = "<num>"
+_PARAM_KEY = "$param"
+
+
+def plan_cache_version(plan_version: str, tool_cards_version: str | None) -> str:
+    """계획 버전과 도구 카드 버전으로 캐시 버전 문자열을 만든다.
+
+    Args:
+        plan_version (str): HousingAgentConstants.plan_version.
+        tool_cards_version (str | None): 도구 카드 내용 해시 버전.
+
+    Returns:
+        str: 캐시 버전 문자열.
+    """
+    return f"{plan_version}:{tool_cards_version or '-'}"
+
+
+def normalize_question(question: str) -> str:
+    """대소문자/공백/끝 문장부호 차이를 없앤 질문을 반환한다.
+
+    Args:
+        question (str): 사용자 질문.
+
+    Returns:
+        str: 정규화한 질문.
+    """
+    text = unicodedata.normalize("NFKC", question).lower()
+    return " ".join(text.split()).rstrip("?!.。 ")
+
+
+def find_numbers(text: str) -> list[tuple[int, int, int | float, bool]]:
+    """문장에 나온 숫자의 위치와 값을 반환한다.
+
+    "5,000,000", "3.5", "5억", "3천만" 같은 표기를 값으로 변환한다.
+
+    Args:
+        text (str): 정규화한 질문.
+
+    Returns:
+        list[tuple[int, int, int | float, bool]]: (시작, 끝, 값, 만/억 단위 사용 여부) 목록.
+    """
+    numbers = []
+    for match in _NUMBER_PATTERN.finditer(text):
+        integer, fraction, unit = match.groups()
+        value = float(integer.replace(",", "") + (fraction or ""))
+        value *= _UNIT_MULTIPLIERS.get(unit, 1)
+        numbers.append(
+            (match.start(), match.end(), int(value) if value.is_integer() else value, unit is not None)
+        )
+    return numbers
+
+
+def extract_numbers(question: str) -> tuple[str, list[int | float]]:
+    """질문에서 숫자를 뽑고 숫자 자리를 자리표시자로 바꾼 질문 형태를 반환한다.
+
+    Args:
+        question (str): 정규화한 질문.
+
+    Returns:
+        tuple[str, list[int | float]]: 질문 형태, 등장 순서대로의 숫자 값.
+    """
+    parts: list[str] = []
+    values: list[int | float] = []
+    cursor = 0
+    for start, end, value, _ in find_numbers(question):
+        parts.append(question[cursor:start])
+        parts.append(_NUMBER_TOKEN)
+        values.append(value)
+        cursor = end
+    parts.append(question[cursor:])
+    return "".join(parts), values
+
+
+class PlanCache:
+    """LRU+TTL 계획 캐시."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        template_mode: bool = False,
+    ) -> None:
+        """캐시를 초기화한다.
+
+        Args:
+            max_entries (int): 최대 항목 수.
+            ttl_seconds (float): 항목 유효 시간(초).
+            template_mode (bool): 숫자만 다른 질문에 계획 골격을 재사용할지 여부.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._template_mode = template_mode
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._exact_hits = 0
+        self._template_hits = 0
+        self._misses = 0
+
+    def get(self, question: str, version: str) -> tuple[dict, str] | None:
+        """캐시된 계획을 조회한다.
+
+        정확히 같은 질문을 먼저 찾고, 템플릿 모드면 숫자만 다른 질문의 골격에
+        이번 질문의 숫자를 다시 채워 넣는다.
+
+        Args:
+            question (str): 사용자 질문.
+            version (str): plan_cache_version으로 만든 버전.
+
+        Returns:
+            tuple[dict, str] | None: (계획 복사본, "cache" 또는 "template"). 없으면 None.
+        """
+        normalized = normalize_question(question)
+        plan = self._lookup(("exact", version, normalized))
+        if plan is not None:
+            with self._lock:
+                self._exact_hits += 1
+            return plan, "cache"
+
+        if self._template_mode:
+            shape, values = extract_numbers(normalized)
+            skeleton = self._lookup(("template", version, shape)) if values else None
+            if skeleton is not None:
+                with self._lock:
+                    self._template_hits += 1
+                return self._bind(skeleton, values), "template"
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, question: str, version: str, plan: dict) -> None:
+        """계획을 저장한다.
+
+        템플릿 모드에서는 질문의 숫자가 계획 input에 각각 정확히 한 번씩 대응할
+        때만 골격을 함께 저장한다. 대응이 모호하면 숫자가 바뀐 질문에 잘못된
+        계획을 돌려줄 수 있으므로 정확히 일치하는 질문에만 재사용한다.
+
+        Args:
+            question (str): 사용자 질문.
+            version (str): plan_cache_version으로 만든 버전.
+            plan (dict): 저장할 계획.
+        """
+        normalized = normalize_question(question)
+        self._store(("exact", version, normalized), copy.deepcopy(plan))
+        if not self._template_mode:
+            return
+        shape, values = extract_numbers(normalized)
+        if not values:
+            return
+        skeleton = self._build_skeleton(plan, values)
+        if skeleton is not None:
+            self._store(("template", version, shape), skeleton)
+
+    def discard(self, question: str, version: str) -> None:
+        """질문에 대한 항목을 지운다. 실패한 계획을 다시 돌려주지 않기 위해 쓴다.
+
+        Args:
+            question (str): 사용자 질문.
+            version (str): plan_cache_version으로 만든 버전.
+        """
+        normalized = normalize_question(question)
+        shape, _ = extract_numbers(normalized)
+        with self._lock:
+            self._entries.pop(("exact", version, normalized), None)
+            self._entries.pop(("template", version, shape), None)
+
+    def clear(self) -> None:
+        """모든 항목을 비운다."""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> dict:
+        """캐시 적중 지표를 반환한다.
+
+        Returns:
+            dict: 캐시 지표.
+        """
+        with self._lock:
+            hits = self._exact_hits + self._template_hits
+            lookups = hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "exact_hits": self._exact_hits,
+                "template_hits": self._template_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _lookup(self, key: tuple[str, str, str]) -> dict | None:
+        """유효한 항목의 복사본을 반환한다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, plan = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(plan)
+
+    def _store(self, key: tuple[str, str, str], plan: dict) -> None:
+        """항목을 저장하고 최대 항목 수를 넘으면 오래된 항목을 제거한다."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, plan)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _build_skeleton(self, plan: dict, values: list[int | float]) -> dict | None:
+        """계획 input의 숫자를 질문 숫자 순번 자리표시자로 바꾼 골격을 만든다."""
+        used: set[int] = set()
+
+        def _replace(value):
+            if isinstance(value, dict):
+                return {key: _replace(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [_replace(item) for item in value]
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                matches = [index for index, number in enumerate(values) if number == value]
+                if len(matches) > 1:
+                    raise ValueError("ambiguous")
+                if matches:
+                    used.add(matches[0])
+                    return {_PARAM_KEY: matches[0]}
+            return value
+
+        skeleton = copy.deepcopy(plan)
+        try:
+            for step in skeleton.get("steps", []):
+                if "input" in step:
+                    step["input"] = _replace(step["input"])
+        except ValueError:
+            return None
+        if len(used) != len(values):
+            return None
+        return skeleton
+
+    def _bind(self, skeleton: dict, values: list[int | float]) -> dict:
+        """골격의 자리표시자에 이번 질문의 숫자를 채운다."""
+
+        def _fill(value):
+            if isinstance(value, dict):
+                if value.keys() == {_PARAM_KEY}:
+                    return values[value[_PARAM_KEY]]
+                return {key: _fill(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [_fill(item) for item in value]
+            return value
+
+        for step in skeleton.get("steps", []):
+            if "input" in step:
+                step["input"] = _fill(step["input"])
+        return skeleton
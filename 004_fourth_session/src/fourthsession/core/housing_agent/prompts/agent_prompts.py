@@ -5,6 +5,8 @@
 
 """주택 에이전트 프롬프트 모듈."""
 
+from textwrap import dedent
+
 
 class HousingAgentPrompts:
     """주택 에이전트 프롬프트 모음."""
@@ -13,12 +15,46 @@ class HousingAgentPrompts:
         """계획 생성 프롬프트를 반환한다.
 
         Returns:
-            str: 계획 생성용 프롬프트.
+            str: 계획 생성용 프롬프트. {question}, {tool_cards} 자리표시자를 가진다.
+        """
+        return dedent(
+            """
+            너는 주택 데이터 질문에 답하기 위한 실행 계획(Plan)을 만드는 역할이다.
+            아래 규칙을 반드시 지켜서 JSON만 출력하라. 설명 문장은 출력하지 않는다.
+            규칙:
+            - 최상위는 {{"steps": [...]}} 형태의 객체다.
+            - 각 step은 id(1부터 증가하는 정수)/action/tool/input을 포함한다.
+            - action은 항상 "tool_call"이다.
+            - tool은 제공된 Tool 목록의 name 중에서만 선택한다.
+            - input은 해당 Tool의 input_schema를 따르고, 질문에 나온 숫자는 그대로 옮긴다.
+            - 다른 step의 결과가 필요하면 depends_on에 선행 step id 배열을 넣는다.
+            질문: {question}
+            Tool 목록: {tool_cards}
+            """
+        ).strip()
+
+    def replan_prompt(self) -> str:
+        """재계획 프롬프트를 반환한다.
+
+        Returns:
+            str: 재계획용 프롬프트. {question}, {tool_cards}, {previous_plan},
+            {feedback} 자리표시자를 가진다.
         """
-        # TODO: 계획 생성에 필요한 지시문을 설계한다.
-        # - JSON만 출력하도록 강제
-        # - steps/id/action/tool/input 규칙 명시
-        raise NotImplementedError("TODO: 계획 프롬프트 구현")
+        return dedent(
+            """
+            너는 실패한 실행 계획(Plan)을 고치는 역할이다.
+            아래 규칙을 반드시 지켜서 JSON만 출력하라. 설명 문장은 출력하지 않는다.
+            규칙:
+            - 출력 형식은 이전 계획과 같다({{"steps": [...]}}).
+            - 성공한 step은 tool/input/depends_on을 그대로 둔다. 그대로 둔 step은 다시 실행하지 않는다.
+            - 피드백에 나온 실패 step만 고치거나 다른 Tool 호출로 바꾼다.
+            - tool은 제공된 Tool 목록의 name 중에서만 선택하고 input은 input_schema를 따른다.
+            질문: {question}
+            Tool 목록: {tool_cards}
+            이전 계획: {previous_plan}
+            피드백: {feedback}
+            """
+        ).strip()
 
     def tool_selection_prompt(self) -> str:
         """도구 선택 프롬프트를 반환한다.
@@ -5,23 +5,44 @@
 
 """주택 에이전트 상태 모델 모듈."""
 
-from pydantic import BaseModel, Field
+from __future__ import annotations
 
+import operator
+from dataclasses import asdict, dataclass, field
+from typing import Annotated
 
-class HousingAgentState(BaseModel):
-    """주택 에이전트 상태 모델."""
+from fourthsession.core.common.tools.tool_card_store import resolve_tool_cards
 
-    question: str | None = Field(default=None, description="사용자 질문")
-    plan: dict | None = Field(default=None, description="계획 JSON")
-    tool_results: list[dict] = Field(default_factory=list, description="도구 실행 결과")
-    answer: str | None = Field(default=None, description="최종 답변")
-    errors: list[str] = Field(default_factory=list, description="오류 메시지 목록")
-    trace_id: str | None = Field(default=None, description="추적 식별자")
-    plan_valid: bool = Field(default=False, description="계획 유효성 여부")
-    retry_count: int = Field(default=0, description="재시도 횟수")
-    max_retries: int = Field(default=2, description="최대 재시도 횟수")
-    tool_cards: list[dict] = Field(default_factory=list, description="MCP 도구 카드 목록")
-    finalized: bool = Field(default=False, description="종료 여부")
+
+@dataclass(slots=True)
+class HousingAgentState:
+    """주택 에이전트 상태 모델.
+
+    LangGraph는 노드 전이마다 상태 객체를 다시 만들므로 검증 비용이 없는
+    slots dataclass로 둔다. 도구 카드는 버전만 싣고 공유 저장소에서 참조한다.
+    tool_results에는 단계 상태와 출력 참조 키(output_ref)만 두고 출력은
+    tool_output_store에서 읽는다. errors는 리듀서로 누적하므로 노드는 새 오류만 반환한다.
+    """
+
+    question: str | None = None  # 사용자 질문
+    plan: dict | None = None  # 계획 JSON
+    plan_source: str | None = None  # 계획 출처(fast_path/llm/cache/template/replan)
+    tool_results: list[dict] = field(default_factory=list)  # 도구 실행 결과(출력은 output_ref로 참조)
+    answer: str | None = None  # 최종 답변
+    errors: Annotated[list[str], operator.add] = field(default_factory=list)  # 오류 메시지 목록(누적)
+    trace_id: str | None = None  # 추적 식별자
+    plan_valid: bool = False  # 계획 유효성 여부
+    retry_count: int = 0  # 재시도 횟수
+    max_retries: int = 2  # 최대 재시도 횟수
+    started_at: float | None = None  # 처리 시작 시각(epoch 초)
+    time_budget_seconds: float = 30.0  # 재계획을 포함한 전체 시간 예산(초)
+    tool_cards_version: str | None = None  # MCP 도구 카드 버전(tool_card_store 키)
+    finalized: bool = False  # 종료 여부
+
+    @property
+    def tool_cards(self) -> tuple:
+        """tool_cards_version에 해당하는 공유 도구 카드 목록을 반환한다."""
+        return resolve_tool_cards(self.tool_cards_version)
 
     @classmethod
     def empty(cls) -> "HousingAgentState":
@@ -30,5 +51,12 @@ class HousingAgentState(BaseModel):
         Returns:
             HousingAgentState: 기본값으로 초기화된 상태.
         """
-        # TODO: 최소 필수 필드를 설정한 초기 상태를 만든다.
-        raise NotImplementedError("TODO: 상태 초기화 구현")
+        return cls()
+
+    def to_dict(self) -> dict:
+        """응답/로그용 딕셔너리로 변환한다.
+
+        Returns:
+            dict: 상태 필드 딕셔너리.
+        """
+        return asdict(self)
@@ -0,0 +1,195 @@
+# 목적: 에이전트 상태 전이 비용을 측정한다.
+# 설명: 예전 pydantic 상태와 slots dataclass 상태로 같은 그래프를 돌려 전이당 오버헤드를 비교한다.
+# 디자인 패턴: 벤치마크 스크립트
+# 참조: fourthsession/core/housing_agent/state/agent_state.py
+
+"""상태 전이 벤치마크 모듈.
+
+실행 예:
+    uv run python -m fourthsession.core.housing_agent.state.state_benchmark --nodes 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from langgraph.graph import END, START, StateGraph
+from pydantic import BaseModel, Field
+
+from fourthsession.core.common.tools.tool_card_store import publish_tool_cards
+from fourthsession.core.common.tools.tool_output_store import publish_tool_output
+from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
+
+
+class _PydanticAgentState(BaseModel):
+    """비교 기준으로 쓰는 예전 pydantic 상태(카드/결과를 상태에 직접 싣는다)."""
+
+    question: str | None = Field(default=None)
+    plan: dict | None = Field(default=None)
+    tool_results: list[dict] = Field(default_factory=list)
+    answer: str | None = Field(default=None)
+    errors: list[str] = Field(default_factory=list)
+    trace_id: str | None = Field(default=None)
+    plan_valid: bool = Field(default=False)
+    retry_count: int = Field(default=0)
+    max_retries: int = Field(default=2)
+    tool_cards: list[dict] = Field(default_factory=list)
+    finalized: bool = Field(default=False)
+
+
+@dataclass(slots=True)
+class _FloorState:
+    """LangGraph 자체 전이 비용을 재기 위한 최소 상태."""
+
+    retry_count: int = 0
+
+
+def _sample_payload(card_count: int, result_count: int) -> tuple[list[dict], list[dict]]:
+    """도구 카드/결과 크기를 실제와 비슷하게 맞춘 표본을 만든다."""
+    schema = {
+        "type": "object",
+        "properties": {
+            key: {"type": "number", "minimum": 0}
+            for key in ("min_price", "max_price", "min_area", "max_area", "bedrooms")
+        },
+        "additionalProperties": False,
+    }
+    cards = [
+        {
+            "name": f"tool_{index}",
+            "description": "가격/면적/침실 수 조건에 맞는 주택을 조회한다.",
+            "input_schema": schema,
+            "hints": {key: f"{key} 힌트" for key in schema["properties"]},
+            "example_request": {"max_price": 5000000, "bedrooms": 3},
+            "example_response": {"count": 2, "items": [{"price": 1750000.0, "area": 3850.0}]},
+        }
+        for index in range(card_count)
+    ]
+    house = {"price": 1750000.0, "area": 3850.0, "bedrooms": 3, "furnishingstatus": "unfurnished"}
+    results = [
+        {
+            "id": index,
+            "tool": "tool_0",
+            "status": "ok",
+            "output": {"items": [dict(house) for _ in range(10)], "count": 10},
+            "elapsed_ms": 1.0,
+        }
+        for index in range(result_count)
+    ]
+    return cards, results
+
+
+def _build_graph(schema: type, node_count: int, update: Callable[[object], dict]):
+    """update만 반환하는 노드를 일렬로 이은 그래프를 컴파일한다."""
+    graph = StateGraph(schema)
+    names = [f"node_{index}" for index in range(node_count)]
+    for name in names:
+        graph.add_node(name, update)
+    graph.add_edge(START, names[0])
+    for current, following in zip(names, names[1:]):
+        graph.add_edge(current, following)
+    graph.add_edge(names[-1], END)
+    return graph.compile()
+
+
+def _measure(run: Callable[[], object], iterations: int, repeats: int = 3) -> float:
+    """한 번 워밍업한 뒤 repeats번 재서 가장 빠른 평균 실행 시간(초)을 반환한다."""
+    run()
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            run()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best
+
+
+def run_benchmark(
+    node_count: int = 5,
+    iterations: int = 200,
+    card_count: int = 3,
+    result_count: int = 4,
+) -> dict:
+    """두 상태 표현의 전이당 오버헤드를 측정한다.
+
+    Args:
+        node_count (int): 그래프 노드 수(전이 수).
+        iterations (int): 그래프 실행 반복 횟수.
+        card_count (int): 도구 카드 수.
+        result_count (int): 도구 결과 수.
+
+    Returns:
+        dict: 상태 표현별 전이당 시간(us), 최소 상태 대비 상태 오버헤드(us),
+            상태 생성 시간(us).
+    """
+    cards, results = _sample_payload(card_count, result_count)
+    version = publish_tool_cards(cards)
+
+    def _pydantic_update(state: _PydanticAgentState) -> dict:
+        return {"retry_count": state.retry_count + 1, "errors": [*state.errors, "e"]}
+
+    def _slotted_update(state: HousingAgentState) -> dict:
+        return {"retry_count": state.retry_count + 1, "errors": ["e"]}
+
+    def _floor_update(state: _FloorState) -> dict:
+        return {"retry_count": state.retry_count + 1}
+
+    floor = _build_graph(_FloorState, node_count, _floor_update)
+    floor_us = _measure(lambda: floor.invoke({}), iterations) / node_count * 1_000_000
+
+    baseline = _build_graph(_PydanticAgentState, node_count, _pydantic_update)
+    slotted = _build_graph(HousingAgentState, node_count, _slotted_update)
+    baseline_input = {"question": "q", "tool_cards": cards, "tool_results": results}
+    # 실제 상태처럼 출력은 저장소에 두고 참조 키만 싣는다.
+    slotted_results = [
+        {
+            **{key: value for key, value in result.items() if key != "output"},
+            "output_ref": publish_tool_output(str(result["id"]), result["output"]),
+        }
+        for result in results
+    ]
+    slotted_input = {"question": "q", "tool_cards_version": version, "tool_results": slotted_results}
+
+    report = {}
+    for label, graph, payload, schema in (
+        ("pydantic", baseline, baseline_input, _PydanticAgentState),
+        ("slotted", slotted, slotted_input, HousingAgentState),
+    ):
+        per_transition_us = _measure(lambda: graph.invoke(payload), iterations) / node_count * 1_000_000
+        construct = _measure(lambda: schema(**payload), iterations * 10)
+        report[label] = {
+            "per_transition_us": round(per_transition_us, 1),
+            "state_overhead_us": round(per_transition_us - floor_us, 1),
+            "state_construct_us": round(construct * 1_000_000, 2),
+        }
+    report["floor"] = {
+        "per_transition_us": round(floor_us, 1),
+        "state_overhead_us": 0.0,
+        "state_construct_us": 0.0,
+    }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    """벤치마크 CLI 진입점."""
+    parser = argparse.ArgumentParser(description="에이전트 상태 전이 오버헤드를 비교한다.")
+    parser.add_argument("--nodes", type=int, default=5, help="그래프 노드 수")
+    parser.add_argument("--iterations", type=int, default=200, help="그래프 실행 반복 횟수")
+    parser.add_argument("--cards", type=int, default=3, help="도구 카드 수")
+    parser.add_argument("--results", type=int, default=4, help="도구 결과 수")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.nodes, args.iterations, args.cards, args.results)
+    print(f"{'state':<10}{'per transition (us)':>22}{'overhead (us)':>16}{'construct (us)':>18}")
+    for label, values in report.items():
+        print(
+            f"{label:<10}{values['per_transition_us']:>22}"
+            f"{values['state_overhead_us']:>16}{values['state_construct_us']:>18}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@
 """주택 에이전트 Tool 패키지."""
 
 from fourthsession.core.housing_agent.tools.housing_list_tool import HousingListTool
+from fourthsession.core.housing_agent.tools.housing_price_aggregate_tool import (
+    HousingPriceAggregateTool,
+)
 from fourthsession.core.housing_agent.tools.housing_price_stats_tool import HousingPriceStatsTool
 
-__all__ = ["HousingListTool", "HousingPriceStatsTool"]
+__all__ = ["HousingListTool", "HousingPriceAggregateTool", "HousingPriceStatsTool"]
@@ -1,51 +1,87 @@
 # 목적: 주택 목록 조회 Tool을 정의한다.
 # 설명: 필터 조건에 맞는 주택 목록을 반환한다.
 # 디자인 패턴: 커맨드 패턴
-# 참조: fourthsession/core/repository/sqlite/housing_repository.py
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
 
 """주택 목록 조회 Tool 모듈."""
 
+from typing import Iterator
+
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    HousingRepository,
+)
 from fourthsession.core.common.tools.base_tool import BaseTool
 
 
 class HousingListTool(BaseTool):
     """주택 목록 조회 Tool."""
 
+    cacheable = True
+
+    def __init__(self, repository: HousingRepository | None = None) -> None:
+        """Tool을 초기화한다.
+
+        Args:
+            repository (HousingRepository | None): 주택 데이터 레포지토리.
+        """
+        self._repository = repository or HousingRepository()
+
     @property
     def name(self) -> str:
         """Tool 이름을 반환한다."""
-        # TODO: Tool 이름을 고정 값으로 반환한다.
-        raise NotImplementedError("TODO: Tool 이름 구현")
+        return "housing_list_tool"
 
     @property
     def description(self) -> str:
         """Tool 설명을 반환한다."""
-        # TODO: Tool 설명을 반환한다.
-        raise NotImplementedError("TODO: Tool 설명 구현")
+        return "가격/면적/침실 수 조건에 맞는 주택 목록을 가격 오름차순으로 페이지 단위 조회한다."
 
     @property
     def input_schema(self) -> dict:
         """입력 스키마를 반환한다."""
-        # TODO: 입력 스키마를 딕셔너리로 반환한다.
-        raise NotImplementedError("TODO: 입력 스키마 구현")
+        return {
+            "type": "object",
+            "properties": {
+                "min_price": {"type": "number", "minimum": 0},
+                "max_price": {"type": "number", "minimum": 0},
+                "min_area": {"type": "number", "minimum": 0},
+                "max_area": {"type": "number", "minimum": 0},
+                "bedrooms": {"type": "integer", "minimum": 0},
+                "limit": {"type": "integer", "minimum": 1, "maximum": 100, "default": 10},
+                "cursor": {"type": "string"},
+            },
+            "additionalProperties": False,
+        }
 
     @property
     def example_request(self) -> dict:
         """예시 요청을 반환한다."""
-        # TODO: 예시 요청을 구성한다.
-        raise NotImplementedError("TODO: 예시 요청 구현")
+        return {"max_price": 5000000, "bedrooms": 3, "limit": 2}
 
     @property
     def example_response(self) -> dict:
         """예시 응답을 반환한다."""
-        # TODO: 예시 응답을 구성한다.
-        raise NotImplementedError("TODO: 예시 응답 구현")
+        return {
+            "items": [
+                {"price": 1750000.0, "area": 3850.0, "bedrooms": 3, "furnishingstatus": "unfurnished"},
+                {"price": 1767150.0, "area": 2400.0, "bedrooms": 3, "furnishingstatus": "semi-furnished"},
+            ],
+            "count": 2,
+            "next_cursor": "eyJwIjoxNzY3MTUwLjAsInIiOjU0NCwiZiI6IjAxMjM0NTY3ODlhYiJ9",
+        }
 
     @property
     def hints(self) -> dict:
         """도구 힌트를 반환한다."""
-        # TODO: 필드별 입력 힌트를 정의한다.
-        raise NotImplementedError("TODO: 힌트 구현")
+        return {
+            "min_price": "최소 가격(이상), 숫자",
+            "max_price": "최대 가격(이하), 숫자",
+            "min_area": "최소 면적(이상), 숫자",
+            "max_area": "최대 면적(이하), 숫자",
+            "bedrooms": "침실 수(정확히 일치), 정수",
+            "limit": "페이지 크기, 1~100 사이 정수",
+            "cursor": "다음 페이지 조회 시 직전 응답의 next_cursor를 그대로 전달, 필터는 동일하게 유지",
+        }
 
     def execute(self, payload: dict) -> dict:
         """Tool을 실행한다.
@@ -54,7 +90,23 @@ class HousingListTool(BaseTool):
             payload (dict): 입력 데이터.
 
         Returns:
-            dict: 실행 결과.
+            dict: 실행 결과. next_cursor가 있으면 다음 페이지가 남아 있다.
+        """
+        filters = {key: value for key, value in payload.items() if key != "cursor"}
+        return self._repository.list_houses_page(filters, cursor=payload.get("cursor"))
+
+    def iter_items(self, payload: dict, fetch_size: int = 500) -> Iterator[dict]:
+        """조건에 맞는 주택을 전부 메모리에 올리지 않고 하나씩 반환한다.
+
+        SSE처럼 결과를 흘려보내는 경로에서 사용한다. payload의 limit가 없으면
+        조건에 맞는 전체 행을 순회한다.
+
+        Args:
+            payload (dict): 입력 데이터.
+            fetch_size (int): fetchmany 한 번에 읽을 행 수.
+
+        Yields:
+            dict: 주택 정보.
         """
-        # TODO: HousingRepository.list_houses를 호출한다.
-        raise NotImplementedError("TODO: Tool 실행 구현")
+        filters = {key: value for key, value in payload.items() if key != "cursor"}
+        yield from self._repository.iter_houses(filters, fetch_size=fetch_size)
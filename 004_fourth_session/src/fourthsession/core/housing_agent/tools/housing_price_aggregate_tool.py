@@ -0,0 +1,126 @@
+# 목적: 주택 가격 집계 Tool을 정의한다.
+# 설명: 그룹별 요약 통계/백분위수/히스토그램을 한 번의 호출로 계산한다.
+# 디자인 패턴: 커맨드 패턴
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
+
+"""주택 가격 집계 Tool 모듈."""
+
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    GROUPABLE_COLUMNS,
+    HousingRepository,
+)
+from fourthsession.core.common.tools.base_tool import BaseTool
+
+
+class HousingPriceAggregateTool(BaseTool):
+    """주택 가격 집계 Tool."""
+
+    cacheable = True
+
+    def __init__(self, repository: HousingRepository | None = None) -> None:
+        """Tool을 초기화한다.
+
+        Args:
+            repository (HousingRepository | None): 주택 데이터 레포지토리.
+        """
+        self._repository = repository or HousingRepository()
+
+    @property
+    def name(self) -> str:
+        """Tool 이름을 반환한다."""
+        return "housing_price_aggregate_tool"
+
+    @property
+    def description(self) -> str:
+        """Tool 설명을 반환한다."""
+        return (
+            "조건에 맞는 주택 가격을 범주별(group_by)로 묶어 건수/평균/최소/최대/백분위수와 "
+            "가격 구간 히스토그램을 한 번에 계산한다. 여러 그룹 비교 질문에 사용한다."
+        )
+
+    @property
+    def input_schema(self) -> dict:
+        """입력 스키마를 반환한다."""
+        return {
+            "type": "object",
+            "properties": {
+                "min_price": {"type": "number", "minimum": 0},
+                "max_price": {"type": "number", "minimum": 0},
+                "min_area": {"type": "number", "minimum": 0},
+                "max_area": {"type": "number", "minimum": 0},
+                "bedrooms": {"type": "integer", "minimum": 0},
+                "group_by": {"type": "string", "enum": list(GROUPABLE_COLUMNS)},
+                "percentiles": {
+                    "type": "array",
+                    "items": {"type": "number", "minimum": 0, "maximum": 100},
+                    "maxItems": 10,
+                },
+                "histogram_bucket_size": {"type": "number", "exclusiveMinimum": 0},
+                "histogram_start": {"type": "number", "default": 0},
+            },
+            "additionalProperties": False,
+        }
+
+    @property
+    def example_request(self) -> dict:
+        """예시 요청을 반환한다."""
+        return {
+            "max_price": 6000000,
+            "group_by": "furnishingstatus",
+            "percentiles": [25, 50, 75],
+            "histogram_bucket_size": 2000000,
+        }
+
+    @property
+    def example_response(self) -> dict:
+        """예시 응답을 반환한다."""
+        return {
+            "group_by": "furnishingstatus",
+            "total_count": 2,
+            "groups": [
+                {
+                    "key": "furnished",
+                    "count": 2,
+                    "average": 4550000.0,
+                    "min": 3500000.0,
+                    "max": 5600000.0,
+                    "percentiles": {"p25": 4025000.0, "p50": 4550000.0, "p75": 5075000.0},
+                    "histogram": [
+                        {"lower": 2000000.0, "upper": 4000000.0, "count": 1},
+                        {"lower": 4000000.0, "upper": 6000000.0, "count": 1},
+                    ],
+                }
+            ],
+        }
+
+    @property
+    def hints(self) -> dict:
+        """도구 힌트를 반환한다."""
+        return {
+            "min_price": "최소 가격(이상), 숫자",
+            "max_price": "최대 가격(이하), 숫자",
+            "min_area": "최소 면적(이상), 숫자",
+            "max_area": "최대 면적(이하), 숫자",
+            "bedrooms": "침실 수(정확히 일치), 정수",
+            "group_by": "비교 기준 컬럼, 생략하면 전체를 하나의 그룹으로 집계",
+            "percentiles": "0~100 사이 숫자 배열, 생략하면 [25, 50, 75]",
+            "histogram_bucket_size": "가격 구간 폭, 생략하면 히스토그램을 만들지 않음",
+            "histogram_start": "첫 구간 시작 가격, 기본 0",
+        }
+
+    def execute(self, payload: dict) -> dict:
+        """Tool을 실행한다.
+
+        Args:
+            payload (dict): 입력 데이터.
+
+        Returns:
+            dict: 실행 결과.
+        """
+        return self._repository.get_price_aggregates(
+            payload,
+            group_by=payload.get("group_by"),
+            percentiles=payload.get("percentiles"),
+            histogram_bucket_size=payload.get("histogram_bucket_size"),
+            histogram_start=float(payload.get("histogram_start", 0.0)),
+        )
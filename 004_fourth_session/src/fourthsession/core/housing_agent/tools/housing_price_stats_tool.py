@@ -1,51 +1,80 @@
 # 목적: 주택 가격 통계 Tool을 정의한다.
 # 설명: 필터 조건에 맞는 가격 통계를 계산한다.
 # 디자인 패턴: 커맨드 패턴
-# 참조: fourthsession/core/repository/sqlite/housing_repository.py
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
 
 """주택 가격 통계 Tool 모듈."""
 
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    HousingRepository,
+)
 from fourthsession.core.common.tools.base_tool import BaseTool
 
 
 class HousingPriceStatsTool(BaseTool):
     """주택 가격 통계 Tool."""
 
+    cacheable = True
+
+    def __init__(self, repository: HousingRepository | None = None) -> None:
+        """Tool을 초기화한다.
+
+        Args:
+            repository (HousingRepository | None): 주택 데이터 레포지토리.
+        """
+        self._repository = repository or HousingRepository()
+
     @property
     def name(self) -> str:
         """Tool 이름을 반환한다."""
-        # TODO: Tool 이름을 고정 값으로 반환한다.
-        raise NotImplementedError("TODO: Tool 이름 구현")
+        return "housing_price_stats_tool"
 
     @property
     def description(self) -> str:
         """Tool 설명을 반환한다."""
-        # TODO: Tool 설명을 반환한다.
-        raise NotImplementedError("TODO: Tool 설명 구현")
+        return "가격/면적/침실 수 조건에 맞는 주택의 가격 통계(건수/평균/중앙값/최소/최대)를 계산한다."
 
     @property
     def input_schema(self) -> dict:
         """입력 스키마를 반환한다."""
-        # TODO: 입력 스키마를 딕셔너리로 반환한다.
-        raise NotImplementedError("TODO: 입력 스키마 구현")
+        return {
+            "type": "object",
+            "properties": {
+                "min_price": {"type": "number", "minimum": 0},
+                "max_price": {"type": "number", "minimum": 0},
+                "min_area": {"type": "number", "minimum": 0},
+                "max_area": {"type": "number", "minimum": 0},
+                "bedrooms": {"type": "integer", "minimum": 0},
+            },
+            "additionalProperties": False,
+        }
 
     @property
     def example_request(self) -> dict:
         """예시 요청을 반환한다."""
-        # TODO: 예시 요청을 구성한다.
-        raise NotImplementedError("TODO: 예시 요청 구현")
+        return {"bedrooms": 3, "min_area": 700, "max_area": 1500}
 
     @property
     def example_response(self) -> dict:
         """예시 응답을 반환한다."""
-        # TODO: 예시 응답을 구성한다.
-        raise NotImplementedError("TODO: 예시 응답 구현")
+        return {
+            "count": 120,
+            "average": 3400000.0,
+            "median": 3200000.0,
+            "min": 1200000.0,
+            "max": 9100000.0,
+        }
 
     @property
     def hints(self) -> dict:
         """도구 힌트를 반환한다."""
-        # TODO: 필드별 입력 힌트를 정의한다.
-        raise NotImplementedError("TODO: 힌트 구현")
+        return {
+            "min_price": "최소 가격(이상), 숫자",
+            "max_price": "최대 가격(이하), 숫자",
+            "min_area": "최소 면적(이상), 숫자",
+            "max_area": "최대 면적(이하), 숫자",
+            "bedrooms": "침실 수(정확히 일치), 정수",
+        }
 
     def execute(self, payload: dict) -> dict:
         """Tool을 실행한다.
@@ -56,5 +85,4 @@ class HousingPriceStatsTool(BaseTool):
         Returns:
             dict: 실행 결과.
         """
-        # TODO: HousingRepository.get_price_stats를 호출한다.
-        raise NotImplementedError("TODO: Tool 실행 구현")
+        return self._repository.get_price_stats(payload)
@@ -5,8 +5,32 @@
 
 """FastAPI 애플리케이션 진입점 모듈."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from fourthsession.core.common.repository.sqlite.async_report_job_repository import (
+    AsyncReportJobRepository,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """앱 수명 동안 쓸 자원을 만들고 종료 시 정리한다.
+
+    리포트 작업 레포지토리는 상태 갱신을 버퍼에 모아 기록하므로,
+    종료할 때 close()로 남은 버퍼를 기록하고 스레드를 멈춘다.
+
+    Args:
+        app (FastAPI): 애플리케이션 인스턴스.
+    """
+    app.state.report_job_repository = AsyncReportJobRepository()
+    try:
+        yield
+    finally:
+        await app.state.report_job_repository.close()
+
 
 def create_app() -> FastAPI:
     """FastAPI 애플리케이션을 생성한다.
@@ -14,7 +38,7 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: 구성된 애플리케이션 인스턴스.
     """
-    app = FastAPI(title="fourthSession API")
+    app = FastAPI(title="fourthSession API", lifespan=lifespan)
 
     @app.get("/health", tags=["health"])
     def health() -> dict[str, str]:
@@ -5,21 +5,53 @@
 
 """주택 에이전트 MCP 서버 모듈."""
 
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
 
+from fourthsession.core.common.tools.base_tool import BaseTool
+from fourthsession.core.common.tools.latency_histogram import LatencyHistogram
+from fourthsession.core.common.tools.schema_validator import SchemaValidator, compile_schema
 from fourthsession.mcp.tool_registry import HousingToolRegistry
 
 
 class HousingMcpServer:
-    """주택 에이전트 MCP 서버."""
+    """주택 에이전트 MCP 서버.
 
-    def __init__(self, registry: HousingToolRegistry | None = None) -> None:
+    Tool 실행은 동기 함수이므로 서버 이벤트 루프에서 직접 부르지 않고
+    스레드 풀로 넘긴다. 입력은 등록 시점에 컴파일한 스키마 검사 함수로 먼저
+    거르고, 요청마다 제한 시간을 두며, Tool별 지연 시간 히스토그램을 남긴다.
+    """
+
+    def __init__(
+        self,
+        registry: HousingToolRegistry | None = None,
+        max_workers: int = 8,
+        request_timeout: float = 10.0,
+        name: str = "housing-agent",
+    ) -> None:
         """MCP 서버 구성 객체를 초기화한다.
 
         Args:
             registry (HousingToolRegistry | None): 도구 레지스트리.
+            max_workers (int): Tool을 동시에 실행할 스레드 수.
+            request_timeout (float): 요청별 제한 시간(초). 풀 대기 시간을 포함한다.
+            name (str): MCP 서버 이름.
         """
         self._registry = registry or HousingToolRegistry()
+        self._max_workers = max_workers
+        self._request_timeout = request_timeout
+        self._name = name
+        self._executor: ThreadPoolExecutor | None = None
+        self._validators: dict[str, SchemaValidator] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
 
     def build(self) -> FastMCP:
         """MCP 서버 인스턴스를 구성한다.
@@ -27,12 +59,127 @@ class HousingMcpServer:
         Returns:
             FastMCP: MCP 서버 인스턴스.
         """
-        # TODO: Tool 등록과 정책 설정을 포함한 MCP 서버를 구성한다.
-        # - FastMCP 인스턴스를 만든다.
-        # - @mcp.tool()로 Tool을 등록한다.
-        raise NotImplementedError("TODO: MCP 서버 구성 구현")
-
-    def run(self) -> None:
-        """MCP 서버를 실행한다."""
-        # TODO: 전송 방식(stdio/http)을 선택하고 서버를 기동한다.
-        raise NotImplementedError("TODO: MCP 서버 실행 구현")
+        self._prepare()
+        tools = [self._build_tool(tool) for tool in self._registry.list_tools()]
+        return FastMCP(
+            self._name,
+            instructions="주택 데이터 조회/통계 Tool을 제공한다.",
+            tools=tools,
+        )
+
+    def run(self, transport: Literal["stdio", "sse", "streamable-http"] = "stdio") -> None:
+        """MCP 서버를 실행한다.
+
+        Args:
+            transport (Literal["stdio", "sse", "streamable-http"]): 전송 방식.
+        """
+        try:
+            self.build().run(transport=transport)
+        finally:
+            self.close()
+
+    async def call_tool(self, name: str, arguments: dict) -> dict:
+        """입력을 검증하고 스레드 풀에서 Tool을 실행한다.
+
+        제한 시간을 넘기면 오류 결과를 바로 반환한다. 이미 실행 중인 스레드는
+        멈출 수 없으므로 끝날 때까지 풀의 슬롯을 차지한다.
+
+        Args:
+            name (str): Tool 이름.
+            arguments (dict): Tool 입력.
+
+        Returns:
+            dict: Tool 실행 결과. 실패하면 error 키를 담는다.
+        """
+        self._prepare()
+        tool = self._registry.get_tool(name)
+        if tool is None:
+            return {"error": f"등록되지 않은 Tool입니다: {name}"}
+        histogram = self._histograms[name]
+
+        started = time.perf_counter()
+        errors = self._validators[name](arguments, "input")
+        if errors:
+            histogram.record((time.perf_counter() - started) * 1000, "rejected")
+            return {"error": "; ".join(errors)}
+
+        status = "ok"
+        loop = asyncio.get_running_loop()
+        try:
+            result = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, tool.run, arguments),
+                timeout=self._request_timeout,
+            )
+            if isinstance(result, dict) and "error" in result:
+                status = "error"
+        except asyncio.TimeoutError:
+            status = "timeout"
+            result = {"error": f"제한 시간 {self._request_timeout:g}s를 초과했습니다."}
+        except Exception as exc:  # noqa: BLE001 - Tool 예외는 오류 결과로 돌려준다.
+            status = "error"
+            result = {"error": str(exc) or exc.__class__.__name__}
+        histogram.record((time.perf_counter() - started) * 1000, status)
+        return result
+
+    def metrics(self) -> dict:
+        """Tool별 지연 시간 히스토그램을 반환한다.
+
+        Returns:
+            dict: Tool 이름별 히스토그램 스냅숏과 풀 설정.
+        """
+        return {
+            "max_workers": self._max_workers,
+            "request_timeout": self._request_timeout,
+            "tools": {name: histogram.snapshot() for name, histogram in self._histograms.items()},
+        }
+
+    def close(self) -> None:
+        """스레드 풀을 정리한다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _prepare(self) -> None:
+        """Tool 등록, 스키마 컴파일, 스레드 풀 생성을 한 번만 수행한다."""
+        if self._registry.catalog is None:
+            self._registry.register_tools()
+        if not self._validators:
+            for tool in self._registry.list_tools():
+                self._validators[tool.name] = compile_schema(tool.input_schema)
+                self._histograms[tool.name] = LatencyHistogram()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="housing-mcp",
+            )
+
+    def _build_tool(self, tool: BaseTool) -> Tool:
+        """Tool을 FastMCP Tool로 감싼다.
+
+        FastMCP는 함수 시그니처로 입력 모델을 만들므로 input_schema의 필드를
+        키워드 인자로 가진 핸들러를 만들고, 타입 검사는 컴파일한 스키마 검사
+        함수에 맡긴다. 클라이언트에는 원래 input_schema를 그대로 노출한다.
+        """
+        properties = (tool.input_schema or {}).get("properties") or {}
+
+        async def handler(**arguments: Any) -> dict:
+            payload = {key: value for key, value in arguments.items() if value is not None}
+            return await self.call_tool(tool.name, payload)
+
+        handler.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(key, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Any)
+                for key in properties
+            ]
+        )
+        mcp_tool = Tool.from_function(
+            handler,
+            name=tool.name,
+            description=tool.description,
+            structured_output=False,
+        )
+        return mcp_tool.model_copy(update={"parameters": tool.input_schema})
+
+
+if __name__ == "__main__":
+    HousingMcpServer().run()
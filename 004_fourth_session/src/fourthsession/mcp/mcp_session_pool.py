@@ -0,0 +1,327 @@
+# 목적: MCP 클라이언트 세션 풀을 정의한다.
+# 설명: HousingMcpServer 세션을 미리 열어 두고 Tool 호출마다 빌려 쓰게 한다.
+# 디자인 패턴: 오브젝트 풀 패턴
+# 참조: fourthsession/mcp/mcp_server.py, fourthsession/core/housing_agent/nodes/execute_node.py
+
+"""MCP 클라이언트 세션 풀 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from contextlib import AbstractAsyncContextManager
+from datetime import timedelta
+from typing import Callable
+
+from langchain_mcp_adapters.sessions import Connection, create_session
+from mcp import ClientSession
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[ClientSession]]
+
+
+class _PooledSession:
+    """풀이 보관하는 세션 하나."""
+
+    __slots__ = ("session", "created_at", "last_used", "last_checked", "closer")
+
+    def __init__(self, session: ClientSession, closer: asyncio.Event) -> None:
+        now = time.monotonic()
+        self.session = session
+        self.created_at = now
+        self.last_used = now
+        self.last_checked = now
+        self.closer = closer
+
+
+class McpSessionPool:
+    """MCP 클라이언트 세션 풀.
+
+    세션은 풀 전용 이벤트 루프 스레드에서 열고 닫는다. MCP 전송(stdio/HTTP)은
+    세션을 연 태스크에서 닫아야 하므로 세션마다 보관 태스크를 하나씩 둔다.
+    동기 코드(ExecuteNode 스레드)는 call_tool/list_tools로 이 루프에 요청을 넘긴다.
+    """
+
+    def __init__(
+        self,
+        connection: Connection | None = None,
+        session_factory: SessionFactory | None = None,
+        max_sessions: int = 4,
+        min_sessions: int = 1,
+        max_idle_seconds: float = 300.0,
+        health_check_interval: float = 30.0,
+        list_tools_ttl_seconds: float = 300.0,
+        connect_timeout: float = 10.0,
+    ) -> None:
+        """세션 풀을 초기화한다.
+
+        Args:
+            connection (Connection | None): langchain-mcp-adapters 연결 설정.
+                예: {"transport": "stdio", "command": "python", "args": [...]}.
+            session_factory (SessionFactory | None): 세션을 여는 비동기 컨텍스트
+                매니저 팩토리. 있으면 connection 대신 사용한다.
+            max_sessions (int): 동시에 빌려 줄 수 있는 최대 세션 수.
+            min_sessions (int): warm_up/유휴 정리 후에도 유지할 세션 수.
+            max_idle_seconds (float): 이보다 오래 쓰지 않은 유휴 세션은 닫는다.
+            health_check_interval (float): 빌려 주기 전 ping으로 확인하는 주기(초).
+            list_tools_ttl_seconds (float): list_tools 결과 캐시 유지 시간(초).
+            connect_timeout (float): 세션 연결/초기화 제한 시간(초).
+        """
+        if session_factory is None:
+            if connection is None:
+                raise ValueError("connection 또는 session_factory가 필요합니다.")
+            session_factory = lambda: create_session(connection)  # noqa: E731
+        self._session_factory = session_factory
+        self._max_sessions = max_sessions
+        self._min_sessions = min(min_sessions, max_sessions)
+        self._max_idle_seconds = max_idle_seconds
+        self._health_check_interval = health_check_interval
+        self._list_tools_ttl_seconds = list_tools_ttl_seconds
+        self._connect_timeout = connect_timeout
+
+        self._idle: list[_PooledSession] = []
+        self._holders: set[asyncio.Task] = set()
+        self._in_use = 0
+        self._tools_cache: tuple[float, list[dict]] | None = None
+        self._counters = {
+            "opened": 0,
+            "closed": 0,
+            "borrows": 0,
+            "reused": 0,
+            "health_failures": 0,
+            "idle_evictions": 0,
+            "list_tools_hits": 0,
+            "list_tools_misses": 0,
+        }
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="housing-mcp-pool",
+            daemon=True,
+        )
+        self._thread.start()
+        self._slots = self._run(self._create_slots())
+        self._reaper = asyncio.run_coroutine_threadsafe(self._reap_idle(), self._loop)
+
+    def warm_up(self) -> None:
+        """min_sessions개 세션을 미리 연다."""
+        self._run(self._warm_up())
+
+    def call_tool(self, name: str, arguments: dict, timeout: float | None = None) -> dict:
+        """세션을 빌려 Tool을 호출한다.
+
+        Args:
+            name (str): Tool 이름.
+            arguments (dict): Tool 입력.
+            timeout (float | None): 응답 제한 시간(초).
+
+        Returns:
+            dict: Tool 결과. 서버가 오류를 돌려주면 error 키를 담는다.
+        """
+        return self._run(self._call_tool(name, arguments, timeout), timeout)
+
+    def list_tools(self) -> list[dict]:
+        """서버 Tool 목록을 반환한다. TTL 동안은 캐시한 결과를 쓴다.
+
+        Returns:
+            list[dict]: name, description, input_schema를 담은 Tool 목록.
+        """
+        cached = self._tools_cache
+        if cached is not None and time.monotonic() - cached[0] < self._list_tools_ttl_seconds:
+            self._counters["list_tools_hits"] += 1
+            return cached[1]
+        self._counters["list_tools_misses"] += 1
+        tools = self._run(self._list_tools())
+        self._tools_cache = (time.monotonic(), tools)
+        return tools
+
+    def metrics(self) -> dict:
+        """풀 지표를 반환한다.
+
+        Returns:
+            dict: 유휴/사용 중 세션 수와 누적 카운터.
+        """
+        borrows = self._counters["borrows"]
+        return {
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "max_sessions": self._max_sessions,
+            **self._counters,
+            "reuse_rate": round(self._counters["reused"] / borrows, 4) if borrows else 0.0,
+        }
+
+    def close(self) -> None:
+        """모든 세션을 닫고 루프 스레드를 멈춘다."""
+        if self._closed:
+            return
+        self._closed = True
+        self._reaper.cancel()
+        self._run(self._close_idle())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=self._connect_timeout)
+
+    def _run(self, coroutine, timeout: float | None = None):
+        """코루틴을 풀 루프에서 실행하고 결과를 기다린다."""
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def _create_slots(self) -> asyncio.Semaphore:
+        """풀 루프에 묶인 세마포어를 만든다."""
+        return asyncio.Semaphore(self._max_sessions)
+
+    async def _warm_up(self) -> None:
+        """부족한 만큼 세션을 열어 유휴 목록에 넣는다."""
+        while len(self._idle) + self._in_use < self._min_sessions:
+            self._idle.append(await self._open())
+
+    async def _call_tool(self, name: str, arguments: dict, timeout: float | None) -> dict:
+        """세션을 빌려 Tool을 호출하고 결과를 dict로 바꾼다."""
+        entry = await self._acquire()
+        healthy = False
+        try:
+            result = await entry.session.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds=timedelta(seconds=timeout) if timeout else None,
+            )
+            healthy = True
+        finally:
+            self._release(entry, healthy)
+        return self._to_dict(result)
+
+    async def _list_tools(self) -> list[dict]:
+        """세션을 빌려 Tool 목록을 조회한다."""
+        entry = await self._acquire()
+        healthy = False
+        try:
+            result = await entry.session.list_tools()
+            healthy = True
+        finally:
+            self._release(entry, healthy)
+        return [
+            {"name": tool.name, "description": tool.description, "input_schema": tool.inputSchema}
+            for tool in result.tools
+        ]
+
+    async def _acquire(self) -> _PooledSession:
+        """유휴 세션을 꺼내거나 새로 연다.
+
+        최근에 쓴 세션부터 꺼내고, 오래 쉰 세션은 닫으며, 확인 주기가 지난
+        세션은 ping으로 살아 있는지 본다.
+        """
+        await self._slots.acquire()
+        try:
+            self._counters["borrows"] += 1
+            while self._idle:
+                entry = self._idle.pop()
+                now = time.monotonic()
+                if now - entry.last_used > self._max_idle_seconds:
+                    self._counters["idle_evictions"] += 1
+                    self._close(entry)
+                    continue
+                if now - entry.last_checked > self._health_check_interval:
+                    try:
+                        await asyncio.wait_for(entry.session.send_ping(), self._connect_timeout)
+                    except Exception:  # noqa: BLE001 - 응답 없는 세션은 버리고 새로 연다.
+                        self._counters["health_failures"] += 1
+                        self._close(entry)
+                        continue
+                    entry.last_checked = time.monotonic()
+                self._counters["reused"] += 1
+                self._in_use += 1
+                return entry
+            entry = await self._open()
+            self._in_use += 1
+            return entry
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, entry: _PooledSession, healthy: bool) -> None:
+        """세션을 돌려받는다. 호출이 실패한 세션은 닫는다."""
+        self._in_use -= 1
+        self._slots.release()
+        if healthy and not self._closed:
+            entry.last_used = entry.last_checked = time.monotonic()
+            self._idle.append(entry)
+        else:
+            self._close(entry)
+
+    async def _open(self) -> _PooledSession:
+        """새 세션을 열고 초기화될 때까지 기다린다."""
+        opened: asyncio.Future[_PooledSession] = self._loop.create_future()
+        holder = self._loop.create_task(self._hold(opened, asyncio.Event()))
+        self._holders.add(holder)
+        holder.add_done_callback(self._holders.discard)
+        try:
+            entry = await asyncio.wait_for(asyncio.shield(opened), self._connect_timeout)
+        except BaseException:
+            # 늦게 연결된 세션은 _hold가 opened 취소를 보고 바로 닫는다.
+            opened.cancel()
+            raise
+        self._counters["opened"] += 1
+        return entry
+
+    async def _hold(self, opened: asyncio.Future, closer: asyncio.Event) -> None:
+        """세션을 열어 두었다가 closer가 설정되면 같은 태스크에서 닫는다."""
+        try:
+            async with self._session_factory() as session:
+                await session.initialize()
+                if opened.done():
+                    return
+                opened.set_result(_PooledSession(session, closer))
+                await closer.wait()
+        except BaseException as error:  # noqa: BLE001 - 연결 실패는 _open으로 전달한다.
+            if not opened.done():
+                opened.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+        finally:
+            if opened.done() and not opened.cancelled() and opened.exception() is None:
+                self._counters["closed"] += 1
+
+    def _close(self, entry: _PooledSession) -> None:
+        """세션 보관 태스크에 닫기를 알린다."""
+        entry.closer.set()
+
+    async def _close_idle(self) -> None:
+        """유휴 세션을 모두 닫고 보관 태스크가 끝나기를 기다린다."""
+        while self._idle:
+            self._close(self._idle.pop())
+        if self._holders:
+            await asyncio.wait(list(self._holders), timeout=self._connect_timeout)
+
+    async def _reap_idle(self) -> None:
+        """주기적으로 오래 쉰 유휴 세션을 닫는다. min_sessions개는 남긴다."""
+        interval = max(min(self._max_idle_seconds, self._health_check_interval) / 2, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            # 오래된 세션이 앞쪽에 있으므로 앞에서부터 본다.
+            while (
+                len(self._idle) + self._in_use > self._min_sessions
+                and self._idle
+                and now - self._idle[0].last_used > self._max_idle_seconds
+            ):
+                self._counters["idle_evictions"] += 1
+                self._close(self._idle.pop(0))
+
+    def _to_dict(self, result) -> dict:
+        """CallToolResult를 Tool 결과 dict로 바꾼다."""
+        text = "\n".join(getattr(block, "text", "") for block in result.content)
+        if result.isError:
+            return {"error": text or "MCP Tool 호출이 실패했습니다."}
+        if isinstance(result.structuredContent, dict):
+            return result.structuredContent
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            return {"text": text}
+        return parsed if isinstance(parsed, dict) else {"result": parsed}
@@ -5,25 +5,109 @@
 
 """MCP Tool 레지스트리 모듈."""
 
+from fourthsession.core.common.repository.sqlite.housing_repository import (
+    HousingRepository,
+)
+from fourthsession.core.common.tools.base_tool import BaseTool
+from fourthsession.core.common.tools.tool_card_catalog import ToolCardCatalog
+from fourthsession.core.common.tools.tool_card_store import publish_tool_card_catalog
+from fourthsession.core.common.tools.tool_result_cache import ToolResultCache
+from fourthsession.core.housing_agent.tools import (
+    HousingListTool,
+    HousingPriceAggregateTool,
+    HousingPriceStatsTool,
+)
+
 
 class HousingToolRegistry:
     """주택 에이전트 Tool 레지스트리."""
 
+    def __init__(
+        self,
+        repository: HousingRepository | None = None,
+        result_cache: ToolResultCache | None = None,
+        enable_result_cache: bool = True,
+    ) -> None:
+        """레지스트리를 초기화한다.
+
+        Args:
+            repository (HousingRepository | None): Tool이 공유할 주택 데이터 레포지토리.
+            result_cache (ToolResultCache | None): Tool이 공유할 결과 캐시.
+                없으면 레포지토리 data_version을 따르는 기본 캐시를 만든다.
+            enable_result_cache (bool): 결과 캐시 사용 여부.
+        """
+        self._repository = repository
+        self._result_cache = result_cache
+        self._enable_result_cache = enable_result_cache
+        self._tools: dict[str, BaseTool] = {}
+        self._catalog: ToolCardCatalog | None = None
+
+    @property
+    def result_cache(self) -> ToolResultCache | None:
+        """Tool 결과 캐시를 반환한다."""
+        return self._result_cache
+
+    @property
+    def catalog(self) -> ToolCardCatalog | None:
+        """등록 시점에 만든 도구 카드 카탈로그를 반환한다."""
+        return self._catalog
+
+    @property
+    def tool_cards_version(self) -> str | None:
+        """등록된 도구 카드의 내용 해시 버전을 반환한다.
+
+        에이전트 상태에는 카드 대신 이 버전을 싣는다.
+        """
+        return self._catalog.version if self._catalog is not None else None
+
     def register_tools(self) -> None:
         """Tool 목록을 등록한다."""
-        # TODO: Tool 인스턴스를 생성하고 레지스트리에 등록한다.
-        raise NotImplementedError("TODO: Tool 등록 구현")
+        repository = self._repository or HousingRepository()
+        if self._enable_result_cache and self._result_cache is None:
+            self._result_cache = ToolResultCache(
+                version_source=lambda: repository.data_version,
+            )
+        cache = self._result_cache if self._enable_result_cache else None
+        for tool in (
+            HousingListTool(repository),
+            HousingPriceStatsTool(repository),
+            HousingPriceAggregateTool(repository),
+        ):
+            tool.bind_result_cache(cache)
+            self._tools[tool.name] = tool
+        self._catalog = ToolCardCatalog(self._build_tool_cards())
+        publish_tool_card_catalog(self._catalog)
 
     def list_tool_cards(self) -> list[dict]:
         """도구 카드 목록을 반환한다.
 
+        등록 후에는 카탈로그에 만들어 둔 카드를 복사해 돌려준다.
+
         Returns:
             list[dict]: 도구 카드 목록.
         """
-        # TODO: 스키마/힌트/예시를 포함한 도구 카드 생성 로직을 구현한다.
-        raise NotImplementedError("TODO: 도구 카드 목록 구현")
+        if self._catalog is None:
+            return self._build_tool_cards()
+        return [dict(card) for card in self._catalog.cards]
+
+    def _build_tool_cards(self) -> list[dict]:
+        """Tool 속성으로 도구 카드 목록을 만든다."""
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.input_schema,
+                "hints": tool.hints,
+                "example_request": tool.example_request,
+                "example_response": tool.example_response,
+            }
+            for tool in self._tools.values()
+        ]
+
+    def list_tools(self) -> list[BaseTool]:
+        """등록된 Tool 목록을 반환한다."""
+        return list(self._tools.values())
 
-    def get_tool(self, name: str):
+    def get_tool(self, name: str) -> BaseTool | None:
         """이름으로 Tool을 조회한다."""
-        # TODO: Tool 이름으로 인스턴스를 반환한다.
-        raise NotImplementedError("TODO: Tool 조회 구현")
+        return self._tools.get(name)
@@ -0,0 +1,75 @@
+# 목적: 테스트 공용 픽스처를 정의한다.
+# 설명: 임시 디렉터리에 주택 CSV/DB를 만들어 실제 데이터 파일을 건드리지 않는다.
+# 디자인 패턴: 픽스처
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
+
+"""테스트 공용 픽스처 모듈."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from fourthsession.core.common.queue.redis_connection_provider import RedisConnectionProvider
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+)
+
+HOUSING_CSV = Path(__file__).resolve().parents[1] / "data" / "housing.csv"
+
+
+@pytest.fixture
+def make_provider(tmp_path):
+    """임시 DB를 쓰는 SQLite 연결 제공자를 만드는 함수를 반환한다.
+
+    null_price_rows에 준 데이터 행 번호(0부터)의 가격은 비워 NULL로 적재한다.
+    """
+    providers: list[SqliteConnectionProvider] = []
+
+    def factory(null_price_rows: tuple[int, ...] = ()) -> SqliteConnectionProvider:
+        with HOUSING_CSV.open(encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+        for index in null_price_rows:
+            rows[index + 1][0] = ""
+        csv_path = tmp_path / f"housing_{len(providers)}.csv"
+        with csv_path.open("w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerows(rows)
+        provider = SqliteConnectionProvider(
+            db_path=str(tmp_path / f"housing_{len(providers)}.db"),
+            csv_path=str(csv_path),
+        )
+        providers.append(provider)
+        return provider
+
+    yield factory
+    for provider in providers:
+        provider.close()
+
+
+@pytest.fixture
+def redis_server():
+    """테스트마다 새 fakeredis 서버를 만든다. 같은 서버를 쓰는 클라이언트는 데이터를 공유한다."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def make_redis_provider(redis_server):
+    """fakeredis 서버에 붙는 Redis 연결 제공자를 만드는 함수를 반환한다.
+
+    제공자마다 클라이언트가 따로 있어 별도 프로세스의 워커처럼 쓸 수 있다.
+    """
+
+    def factory() -> RedisConnectionProvider:
+        provider = RedisConnectionProvider()
+        provider._client = fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+        provider._async_client = fakeredis.aioredis.FakeRedis(
+            server=redis_server,
+            decode_responses=True,
+        )
+        return provider
+
+    return factory
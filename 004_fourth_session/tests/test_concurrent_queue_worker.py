@@ -0,0 +1,60 @@
+# 목적: 동시 처리 큐 워커의 종료 흐름을 검증한다.
+# 설명: stop() 후에도 선반입 버퍼와 처리 중인 작업을 모두 끝내고 ack하는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/worker/concurrent_queue_worker.py
+
+"""동시 처리 큐 워커 테스트 모듈."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.worker.concurrent_queue_worker import ConcurrentQueueWorker
+
+
+class _RecordingWorker(ConcurrentQueueWorker):
+    """release가 열릴 때까지 작업 처리를 막고 처리한 작업을 기록하는 워커."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+        self.handled: list[str] = []
+        self._handled_lock = threading.Lock()
+
+    def handle(self, payload: dict) -> None:
+        self.release.wait(5)
+        with self._handled_lock:
+            self.handled.append(payload["job_id"])
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "조건을 기다리다 시간이 지났습니다."
+        time.sleep(0.01)
+
+
+def test_stop_drains_prefetched_jobs_before_returning(make_redis_provider):
+    queue = RedisJobQueue(make_redis_provider(), consumer_id="w")
+    for index in range(10):
+        queue.enqueue({"job_id": f"j{index}"})
+    worker = _RecordingWorker(queue, concurrency=2, prefetch=2, block_timeout=0.1, reliable=True)
+    runner = threading.Thread(target=worker.run)
+    runner.start()
+
+    # 처리 스레드 2개가 막혀 있고 버퍼 2칸이 차면 루프는 다음 put에서 기다린다.
+    _wait_until(lambda: worker.metrics()["in_flight"] == 2 and worker.metrics()["buffered"] == 2)
+    worker.stop()
+    worker.release.set()
+    runner.join(timeout=5)
+
+    assert not runner.is_alive()
+    fetched = worker.metrics()["fetched"]
+    assert sorted(worker.handled) == sorted(f"j{index}" for index in range(fetched))
+    client = make_redis_provider().get_client()
+    # 꺼낸 작업은 모두 ack되고, 꺼내지 않은 작업은 큐에 남는다.
+    assert client.llen(queue.processing_key) == 0
+    assert queue.size() == 10 - fetched
+    assert "w" not in client.smembers("housing:jobs:consumers")
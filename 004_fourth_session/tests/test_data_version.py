@@ -0,0 +1,68 @@
+# 목적: 프로세스 사이 적재 버전 공유를 검증한다.
+# 설명: 다른 프로세스의 CLI 적재가 서버 쪽 캐시를 무효화하는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/repository/sqlite/connection_provider.py
+
+"""적재 버전 공유 테스트 모듈."""
+
+from __future__ import annotations
+
+import csv
+import subprocess
+import sys
+from pathlib import Path
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _write_prices(path: Path, source: Path, price: float) -> None:
+    """모든 가격을 price로 바꾼 CSV를 만든다."""
+    with source.open(encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file))
+    for row in rows[1:]:
+        row[0] = str(price)
+    with path.open("w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+def test_version_bumped_by_another_provider_is_visible(make_provider):
+    server = make_provider()
+    loader = SqliteConnectionProvider(db_path=str(server.db_path), csv_path=str(server.csv_path))
+    before = server.data_version
+
+    loader.reload_housing_data()
+
+    assert server.data_version == before + 1
+    loader.close()
+
+
+def test_cli_load_in_another_process_invalidates_stats_cache(make_provider, tmp_path):
+    server = make_provider()
+    repository = HousingRepository(server)
+    original = repository.get_price_stats({})
+    new_csv = tmp_path / "reloaded.csv"
+    _write_prices(new_csv, server.csv_path, 1234.0)
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "fourthsession.core.common.repository.sqlite.housing_csv_loader",
+            "--db",
+            str(server.db_path),
+            "--csv",
+            str(new_csv),
+            "--no-resume",
+        ],
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR)},
+    )
+
+    reloaded = repository.get_price_stats({})
+    assert original["average"] != 1234.0
+    assert reloaded["average"] == 1234.0
@@ -0,0 +1,82 @@
+# 목적: 주택 CSV 대량 적재기를 검증한다.
+# 설명: 적재 중에도 실행 중인 서버가 완전한 기존 테이블을 읽는지, 중단 후 재개되는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/repository/sqlite/housing_csv_loader.py
+
+"""주택 CSV 적재기 테스트 모듈."""
+
+from __future__ import annotations
+
+import pytest
+
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    HOUSING_INDEXES,
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.housing_csv_loader import HousingCsvLoader
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+
+
+def _row_count(provider: SqliteConnectionProvider) -> int:
+    with provider.connection() as connection:
+        return connection.execute("SELECT COUNT(*) FROM houses").fetchone()[0]
+
+
+def _index_names(provider: SqliteConnectionProvider) -> set[str]:
+    with provider.connection() as connection:
+        rows = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'houses'"
+        ).fetchall()
+    return {row["name"] for row in rows}
+
+
+def test_live_reader_sees_old_table_until_swap(make_provider):
+    server = make_provider()
+    before = _row_count(server)
+    version = server.data_version
+    seen: list[tuple[int, set[str], int]] = []
+
+    def on_progress(_progress: dict) -> None:
+        # 통계 캐시를 거치지 않고 테이블을 직접 읽는다.
+        seen.append((_row_count(server), _index_names(server), server.data_version))
+
+    loader = HousingCsvLoader(
+        SqliteConnectionProvider(db_path=str(server.db_path), csv_path=str(server.csv_path)),
+        batch_size=50,
+        batches_per_commit=2,
+        progress_callback=on_progress,
+    )
+    summary = loader.load(resume=False)
+
+    assert len(seen) > 1
+    expected_indexes = {name for name, _ in HOUSING_INDEXES}
+    for count, indexes, seen_version in seen:
+        assert count == before
+        assert expected_indexes <= indexes
+        assert seen_version == version
+    assert summary["rows_total"] == before
+    assert server.data_version == version + 1
+    assert expected_indexes <= _index_names(server)
+
+
+def test_interrupted_load_resumes_from_checkpoint(make_provider):
+    server = make_provider()
+    total = HousingRepository(server).get_price_stats({})["count"]
+
+    def fail_after_first_commit(progress: dict) -> None:
+        if progress["rows_committed"] >= 100:
+            raise RuntimeError("중단")
+
+    target = SqliteConnectionProvider(db_path=str(server.db_path), csv_path=str(server.csv_path))
+    with pytest.raises(RuntimeError):
+        HousingCsvLoader(
+            target, batch_size=50, batches_per_commit=2, progress_callback=fail_after_first_commit
+        ).load()
+
+    summary = HousingCsvLoader(
+        target, batch_size=50, batches_per_commit=2, progress_callback=lambda _: None
+    ).load()
+
+    assert summary["rows_skipped"] == 100
+    assert summary["rows_total"] == total
+    assert HousingRepository(server).get_price_stats({})["count"] == total
@@ -0,0 +1,96 @@
+# 목적: 주택 작업 취소를 검증한다.
+# 설명: 끝난 작업은 덮어쓰지 않고, 신호 발행이 실패하면 상태를 되돌리는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/api/housing_agent/service/housing_job_service.py
+
+"""주택 작업 취소 테스트 모듈."""
+
+from __future__ import annotations
+
+import pytest
+
+from fourthsession.api.housing_agent.service.housing_job_service import HousingJobService
+from fourthsession.core.common.queue.inmemory_job_store import InMemoryJobStore
+from fourthsession.core.common.queue.job_cancellation import RedisCancellationSignal
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.queue.stream_event_queue import RedisStreamEventQueue
+
+
+class _CompletingJobStore(InMemoryJobStore):
+    """get 직후 워커가 작업을 끝낸 상황을 흉내 내는 저장소."""
+
+    def get(self, job_id):
+        record = super().get(job_id)
+        if record is not None:
+            self.update_status(job_id, "COMPLETED")
+        return record
+
+
+class _BrokenCancellationSignal(RedisCancellationSignal):
+    """Redis가 내려간 상황을 흉내 내는 취소 신호."""
+
+    def cancel(self, job_id):
+        raise ConnectionError("redis down")
+
+
+def _service(provider, job_store=None, cancellation=None) -> HousingJobService:
+    return HousingJobService(
+        job_queue=RedisJobQueue(provider),
+        stream_queue=RedisStreamEventQueue(provider),
+        job_store=job_store or InMemoryJobStore(),
+        cancellation=cancellation or RedisCancellationSignal(provider),
+    )
+
+
+def test_cancel_running_job_signals_and_ends_stream(make_redis_provider):
+    provider = make_redis_provider()
+    service = _service(provider)
+    service._job_store.create("job-1", {})
+    service._job_store.update_status("job-1", "RUNNING")
+
+    response = service.cancel_job("job-1")
+
+    assert response.status == "CANCELLED"
+    assert service._cancellation.is_cancelled("job-1")
+    assert service._stream_queue.read_events("job-1")[-1][1] == {
+        "type": "done",
+        "status": "CANCELLED",
+    }
+
+
+def test_cancel_does_not_overwrite_job_completed_in_between(make_redis_provider):
+    provider = make_redis_provider()
+    service = _service(provider, job_store=_CompletingJobStore())
+    service._job_store.create("job-1", {})
+
+    response = service.cancel_job("job-1")
+
+    assert response.status == "COMPLETED"
+    assert service._job_store.get("job-1").status == "COMPLETED"
+    assert not service._cancellation.is_cancelled("job-1")
+    assert service._stream_queue.read_events("job-1") == []
+
+
+def test_cancel_reverts_status_when_signal_fails(make_redis_provider):
+    provider = make_redis_provider()
+    service = _service(provider, cancellation=_BrokenCancellationSignal(provider))
+    service._job_store.create("job-1", {})
+    service._job_store.update_status("job-1", "RUNNING")
+
+    with pytest.raises(ConnectionError):
+        service.cancel_job("job-1")
+
+    assert service._job_store.get("job-1").status == "RUNNING"
+    assert service._stream_queue.read_events("job-1") == []
+
+
+def test_update_status_unless_skips_blocked_status():
+    store = InMemoryJobStore()
+    store.create("job-1", {})
+    store.update_status("job-1", "COMPLETED")
+
+    record, updated = store.update_status_unless("job-1", "CANCELLED", {"COMPLETED"})
+
+    assert not updated
+    assert record.status == "COMPLETED"
+    assert store.update_status_unless("missing", "CANCELLED", {"COMPLETED"}) == (None, False)
@@ -0,0 +1,93 @@
+# 목적: 주택 작업 SSE 스트림을 검증한다.
+# 설명: 스트림이 asyncio로 기다려 스레드 풀을 차지하지 않는지, 없는 작업은 404인지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/api/housing_agent/service/housing_job_service.py
+
+"""주택 작업 SSE 스트림 테스트 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fourthsession.api.housing_agent.const.api_constants import HousingApiConstants
+from fourthsession.api.housing_agent.router.housing_stream_router import HousingJobStreamRouter
+from fourthsession.api.housing_agent.service.housing_job_service import HousingJobService
+from fourthsession.core.common.queue.inmemory_job_store import InMemoryJobStore
+from fourthsession.core.common.queue.job_cancellation import RedisCancellationSignal
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+from fourthsession.core.common.queue.stream_event_queue import RedisStreamEventQueue
+
+
+@pytest.fixture
+def service(make_redis_provider):
+    provider = make_redis_provider()
+    job_store = InMemoryJobStore()
+    service = HousingJobService(
+        job_queue=RedisJobQueue(provider),
+        stream_queue=RedisStreamEventQueue(provider),
+        job_store=job_store,
+        cancellation=RedisCancellationSignal(provider),
+        stream_heartbeat_seconds=5.0,
+        stream_idle_timeout_seconds=30.0,
+    )
+    yield service
+    job_store.close()
+
+
+def _stream_path(job_id: str) -> str:
+    return HousingApiConstants().job_stream_path.replace("{job_id}", job_id)
+
+
+def _client(service: HousingJobService) -> TestClient:
+    app = FastAPI()
+    app.include_router(HousingJobStreamRouter(service).build())
+    return TestClient(app)
+
+
+def test_unknown_job_returns_404(service):
+    response = _client(service).get(_stream_path("missing"))
+
+    assert response.status_code == 404
+
+
+def test_stream_sends_events_until_done(service):
+    service._job_store.create("job-1", {})
+    service._stream_queue.push_event("job-1", {"type": "status", "status": "RUNNING"})
+    service._stream_queue.push_event("job-1", {"type": "done", "status": "COMPLETED"})
+
+    response = _client(service).get(_stream_path("job-1"))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert body.startswith("retry: ")
+    assert '"status": "RUNNING"' in body
+    assert body.rstrip().endswith('"status": "COMPLETED"}')
+
+
+@pytest.mark.asyncio
+async def test_waiting_streams_do_not_hold_threads(service):
+    job_ids = [f"job-{index}" for index in range(60)]
+    for job_id in job_ids:
+        service._job_store.create(job_id, {})
+    streams = [service.stream_events(job_id) for job_id in job_ids]
+    for stream in streams:
+        await anext(stream)
+    threads_before = threading.active_count()
+
+    # 60개 스트림이 모두 XREAD BLOCK으로 기다리는 동안 스레드가 늘지 않아야 한다.
+    waiting = [asyncio.ensure_future(anext(stream)) for stream in streams]
+    await asyncio.sleep(0.02)
+    assert threading.active_count() == threads_before
+
+    for job_id in job_ids:
+        service._stream_queue.push_event(job_id, {"type": "done", "status": "COMPLETED"})
+    chunks = await asyncio.gather(*waiting)
+    assert all("COMPLETED" in chunk for chunk in chunks)
+    for stream in streams:
+        await stream.aclose()
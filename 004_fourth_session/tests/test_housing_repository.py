@@ -0,0 +1,90 @@
+# 목적: 주택 레포지토리 목록 조회를 검증한다.
+# 설명: SQLite/컬럼형 백엔드가 같은 키셋 페이지와 limit 검사 규칙을 따르는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/repository/sqlite/housing_repository.py
+
+"""주택 레포지토리 테스트 모듈."""
+
+from __future__ import annotations
+
+import pytest
+
+from fourthsession.core.common.repository.memory.columnar_housing_repository import (
+    ColumnarHousingRepository,
+)
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+
+BACKENDS = [HousingRepository, ColumnarHousingRepository]
+
+
+@pytest.mark.parametrize("repository_class", BACKENDS)
+def test_pages_cover_all_rows_including_null_prices(make_provider, repository_class):
+    repository = repository_class(make_provider(null_price_rows=(0, 4, 8, 77)))
+    seen = []
+    cursor = None
+    while True:
+        page = repository.list_houses_page({"limit": 7}, cursor)
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 545
+    assert [house["price"] for house in seen[:4]] == [None] * 4
+    prices = [house["price"] for house in seen[4:]]
+    assert prices == sorted(prices)
+
+
+@pytest.mark.parametrize("repository_class", BACKENDS)
+@pytest.mark.parametrize("limit", [0, -3, 101, "10", 2.5])
+def test_invalid_limit_is_rejected(make_provider, repository_class, limit):
+    repository = repository_class(make_provider())
+
+    with pytest.raises(ValueError, match="limit"):
+        repository.list_houses_page({"limit": limit})
+    with pytest.raises(ValueError, match="limit"):
+        repository.list_houses({"limit": limit})
+
+
+@pytest.mark.parametrize("repository_class", BACKENDS)
+def test_batch_reports_invalid_limit_per_spec(make_provider, repository_class):
+    repository = repository_class(make_provider())
+
+    results = repository.execute_batch(
+        [
+            {"id": "bad", "kind": "list", "filters": {"limit": -3}},
+            {"id": "ok", "kind": "list", "filters": {"limit": 2}},
+        ]
+    )
+
+    assert "limit" in results["bad"]["error"]
+    assert results["ok"]["count"] == 2
+
+
+@pytest.mark.parametrize("repository_class", BACKENDS)
+def test_batch_rejects_duplicate_and_missing_ids(make_provider, repository_class):
+    repository = repository_class(make_provider())
+
+    results = repository.execute_batch(
+        [
+            {"id": "dup", "kind": "list", "filters": {"limit": 1}},
+            {"id": "dup", "kind": "stats", "filters": {}},
+            {"kind": "stats", "filters": {}},
+            {"id": ["x"], "kind": "stats", "filters": {}},
+            {"id": 7, "kind": "list", "filters": {"limit": 2}},
+        ]
+    )
+
+    assert set(results) == {7, "dup", None}
+    assert "겹칩니다" in results["dup"]["error"]
+    assert "2건" in results[None]["error"]
+    assert results[7]["count"] == 2
+
+
+@pytest.mark.parametrize("repository_class", BACKENDS)
+def test_iter_houses_allows_limits_above_page_size(make_provider, repository_class):
+    repository = repository_class(make_provider())
+
+    assert len(list(repository.iter_houses({"limit": 150}))) == 150
+    with pytest.raises(ValueError, match="limit"):
+        list(repository.iter_houses({"limit": 0}))
@@ -0,0 +1,90 @@
+# 목적: Redis 작업 큐의 신뢰 모드를 검증한다.
+# 설명: lease가 끊긴 소비자의 작업 복구와 읽을 수 없는 작업의 dead-letter 처리를 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/queue/job_queue.py
+
+"""작업 큐 테스트 모듈."""
+
+from __future__ import annotations
+
+from fourthsession.core.common.queue.job_queue import RedisJobQueue
+
+
+def test_reserve_and_ack_remove_job_from_processing_list(make_redis_provider):
+    queue = RedisJobQueue(make_redis_provider(), consumer_id="a")
+    queue.enqueue({"job_id": "j1"})
+
+    lease = queue.reserve(timeout=0.1)
+    client = make_redis_provider().get_client()
+
+    assert lease.payload == {"job_id": "j1"}
+    assert client.lrange(queue.processing_key, 0, -1) == [lease.raw]
+    assert queue.ack(lease)
+    assert client.llen(queue.processing_key) == 0
+
+
+def test_recover_takes_back_jobs_of_expired_consumer_only(make_redis_provider):
+    dead = RedisJobQueue(make_redis_provider(), consumer_id="dead")
+    alive = RedisJobQueue(make_redis_provider(), consumer_id="alive")
+    recovering = RedisJobQueue(make_redis_provider(), consumer_id="recovering")
+    for index in range(3):
+        dead.enqueue({"job_id": f"j{index}"})
+    for queue in (dead, alive, recovering):
+        queue.heartbeat()
+    dead_first = dead.reserve(timeout=0.1)
+    dead_second = dead.reserve(timeout=0.1)
+    alive_lease = alive.reserve(timeout=0.1)
+
+    # dead 소비자의 lease가 만료된 상황을 만든다.
+    make_redis_provider().get_client().delete("housing:jobs:consumer:dead")
+    moved = recovering.recover()
+
+    assert moved == 2
+    # 먼저 꺼낸 작업이 큐 앞쪽에 오도록 되돌린다.
+    assert [recovering.dequeue()["job_id"] for _ in range(2)] == [
+        dead_first.payload["job_id"],
+        dead_second.payload["job_id"],
+    ]
+    client = make_redis_provider().get_client()
+    assert client.lrange(alive.processing_key, 0, -1) == [alive_lease.raw]
+    assert "dead" not in client.smembers("housing:jobs:consumers")
+
+
+def test_release_keeps_consumer_with_pending_jobs_recoverable(make_redis_provider):
+    worker = RedisJobQueue(make_redis_provider(), consumer_id="w")
+    other = RedisJobQueue(make_redis_provider(), consumer_id="other")
+    worker.enqueue({"job_id": "j1"})
+    worker.heartbeat()
+    worker.reserve(timeout=0.1)
+
+    worker.release()
+
+    assert other.recover() == 1
+    assert other.dequeue() == {"job_id": "j1"}
+
+
+def test_reserve_moves_malformed_payload_to_dead_letter(make_redis_provider):
+    queue = RedisJobQueue(make_redis_provider(), consumer_id="a")
+    client = make_redis_provider().get_client()
+    client.rpush("housing:jobs", "{not json", "[1, 2]")
+    queue.enqueue({"job_id": "j1"})
+
+    assert queue.reserve(timeout=0.1) is None
+    assert queue.reserve(timeout=0.1) is None
+    lease = queue.reserve(timeout=0.1)
+
+    assert lease.payload == {"job_id": "j1"}
+    assert client.lrange(queue.dead_letter_key, 0, -1) == ["{not json", "[1, 2]"]
+    assert client.lrange(queue.processing_key, 0, -1) == [lease.raw]
+    # 처리 중 리스트에 남지 않으므로 recover가 다시 큐로 되돌리지 않는다.
+    queue.ack(lease)
+    assert queue.recover() == 0
+
+
+def test_dequeue_moves_malformed_payload_to_dead_letter(make_redis_provider):
+    queue = RedisJobQueue(make_redis_provider())
+    client = make_redis_provider().get_client()
+    client.rpush("housing:jobs", "oops")
+
+    assert queue.dequeue() is None
+    assert client.lrange(queue.dead_letter_key, 0, -1) == ["oops"]
@@ -0,0 +1,35 @@
+# 목적: 결과 합성 노드를 검증한다.
+# 설명: NULL 값이 있는 주택 목록도 요약할 수 있는지 확인한다.
+# 디자인 패턴: 단위 테스트
+# 참조: fourthsession/core/housing_agent/nodes/merge_node.py
+
+"""결과 합성 노드 테스트 모듈."""
+
+from __future__ import annotations
+
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+from fourthsession.core.common.tools.tool_output_store import publish_tool_output
+from fourthsession.core.housing_agent.nodes.merge_node import MergeResultNode
+from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
+
+
+def test_list_summary_shows_null_price_as_placeholder(make_provider):
+    repository = HousingRepository(make_provider(null_price_rows=(3,)))
+    page = repository.list_houses_page({"limit": 3})
+    # NULL 가격은 오름차순에서 맨 앞에 온다.
+    assert page["items"][0]["price"] is None
+
+    state = HousingAgentState(
+        tool_results=[
+            {
+                "id": "s1",
+                "tool": "housing_list_tool",
+                "status": "ok",
+                "output_ref": publish_tool_output("s1", page),
+            },
+        ]
+    )
+    answer = MergeResultNode()(state)["answer"]
+
+    assert answer.startswith("주택 3건(가격 오름차순): 가격 - / 면적 ")
+    assert "(다음 페이지 있음)" in answer
@@ -0,0 +1,117 @@
+# 목적: 리포트 작업 레포지토리의 쓰기 버퍼를 검증한다.
+# 설명: 버퍼에 모은 상태 갱신이 flush/close로 기록되는지, async 래퍼가 같은 메서드를 제공하는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/repository/sqlite/report_job_repository.py,
+#       fourthsession/core/common/repository/sqlite/async_report_job_repository.py
+
+"""리포트 작업 레포지토리 테스트 모듈."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fourthsession.core.common.repository.sqlite.async_report_job_repository import (
+    AsyncReportJobRepository,
+)
+from fourthsession.core.common.repository.sqlite.connection_provider import (
+    SqliteConnectionProvider,
+)
+from fourthsession.core.common.repository.sqlite.report_job_repository import (
+    ReportJobRepository,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture
+def provider(tmp_path):
+    provider = SqliteConnectionProvider(db_path=str(tmp_path / "jobs.db"))
+    yield provider
+    provider.close()
+
+
+def _stored_status(provider: SqliteConnectionProvider, job_id: str) -> str:
+    with provider.connection() as connection:
+        row = connection.execute(
+            "SELECT status FROM report_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+    return row["status"]
+
+
+def test_buffered_updates_are_coalesced_and_flushed(provider):
+    repository = ReportJobRepository(provider, flush_interval_ms=60_000)
+    job_id = repository.create_job({"query": "q"})["job_id"]
+
+    repository.update_job_status(job_id, "RUNNING")
+    repository.update_job_status(job_id, "SUMMARIZING")
+
+    # 아직 기록 전이지만 조회는 버퍼의 최신 상태를 본다.
+    assert _stored_status(provider, job_id) == "CREATED"
+    assert repository.get_job_status(job_id)["status"] == "SUMMARIZING"
+    assert repository.metrics()["coalesced"] == 1
+
+    repository.flush()
+
+    assert _stored_status(provider, job_id) == "SUMMARIZING"
+    history = [item["status"] for item in repository.get_status_history(job_id)]
+    assert history == ["CREATED", "RUNNING", "SUMMARIZING"]
+    repository.close()
+
+
+def test_terminal_status_is_written_immediately(provider):
+    repository = ReportJobRepository(provider, flush_interval_ms=60_000)
+    job_id = repository.create_job({})["job_id"]
+
+    repository.update_job_status(job_id, "COMPLETED")
+
+    assert _stored_status(provider, job_id) == "COMPLETED"
+    assert repository.metrics()["pending_jobs"] == 0
+    repository.close()
+
+
+def test_close_flushes_pending_updates(provider):
+    repository = ReportJobRepository(provider, flush_interval_ms=60_000)
+    job_id = repository.create_job({})["job_id"]
+    repository.update_job_status(job_id, "RUNNING")
+
+    repository.close()
+
+    assert _stored_status(provider, job_id) == "RUNNING"
+    with pytest.raises(RuntimeError):
+        repository.update_job_status(job_id, "FAILED")
+
+
+@pytest.mark.asyncio
+async def test_async_repository_exposes_same_methods(provider):
+    repository = AsyncReportJobRepository(provider)
+    job_id = (await repository.create_job({"query": "q"}))["job_id"]
+    await repository.update_job_status(job_id, "RUNNING")
+
+    await repository.flush()
+
+    assert _stored_status(provider, job_id) == "RUNNING"
+    history = await repository.get_status_history(job_id)
+    assert [item["status"] for item in history] == ["CREATED", "RUNNING"]
+    assert repository.metrics()["flushes"] == 1
+
+    await repository.update_job_status(job_id, "SUMMARIZING")
+    await repository.close()
+
+    assert _stored_status(provider, job_id) == "SUMMARIZING"
+
+
+def test_repository_imports_without_redis():
+    # redis import를 막은 인터프리터에서도 SQLite 레포지토리를 불러올 수 있어야 한다.
+    code = (
+        "import sys; sys.modules['redis'] = None; "
+        "import fourthsession.core.common.repository.sqlite.async_report_job_repository"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR)},
+    )
@@ -0,0 +1,69 @@
+# 목적: 계획의 단계 제한 시간 처리를 검증한다.
+# 설명: 잘못된 timeout_ms를 검증 노드가 거르고, 실행 노드가 최대값으로 자르는지 확인한다.
+# 디자인 패턴: 단위 테스트
+# 참조: fourthsession/core/housing_agent/nodes/validate_plan_node.py,
+#       fourthsession/core/housing_agent/nodes/execute_node.py
+
+"""단계 제한 시간 테스트 모듈."""
+
+from __future__ import annotations
+
+import pytest
+
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+from fourthsession.core.housing_agent.nodes.execute_node import ExecuteNode
+from fourthsession.core.housing_agent.nodes.validate_plan_node import ValidatePlanNode
+from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
+from fourthsession.mcp.tool_registry import HousingToolRegistry
+
+
+@pytest.fixture
+def registry(make_provider):
+    registry = HousingToolRegistry(repository=HousingRepository(make_provider()))
+    registry.register_tools()
+    return registry
+
+
+def _plan(step_timeout=None, policy_timeout=None) -> dict:
+    step = {"id": "s1", "action": "tool_call", "tool": "housing_list_tool", "input": {"limit": 2}}
+    if step_timeout is not None:
+        step["timeout_ms"] = step_timeout
+    plan = {"steps": [step]}
+    if policy_timeout is not None:
+        plan["policy"] = {"timeout_ms": policy_timeout}
+    return plan
+
+
+@pytest.mark.parametrize("timeout_ms", ["fast", True, 0, -5, float("inf"), float("nan"), 10**9])
+def test_validate_rejects_invalid_timeout(registry, timeout_ms):
+    validator = ValidatePlanNode()
+    cards = registry.list_tool_cards()
+
+    step_errors = validator.validate(_plan(step_timeout=timeout_ms), cards)
+    policy_errors = validator.validate(_plan(policy_timeout=timeout_ms), cards)
+
+    assert any("timeout_ms" in error for error in step_errors)
+    assert any("timeout_ms" in error for error in policy_errors)
+
+
+def test_validate_accepts_bounded_timeout(registry):
+    cards = registry.list_tool_cards()
+
+    assert ValidatePlanNode().validate(_plan(step_timeout=500, policy_timeout=2000.5), cards) == []
+
+
+def test_execute_ignores_non_numeric_timeout(registry):
+    node = ExecuteNode(registry=registry)
+    state = HousingAgentState(plan=_plan(step_timeout="fast", policy_timeout="slow"))
+
+    results = node(state)["tool_results"]
+
+    assert [result["status"] for result in results] == ["ok"]
+
+
+def test_execute_clamps_timeout_to_maximum(registry):
+    node = ExecuteNode(registry=registry, step_timeout=10.0, max_step_timeout=5.0)
+
+    assert node._resolve_timeout({"timeout_ms": 10**12}, 10.0) == 5.0
+    assert node._resolve_timeout({"timeout_ms": 0}, 10.0) == 0.001
+    assert node._resolve_timeout({"timeout_ms": float("inf")}, 10.0) == 10.0
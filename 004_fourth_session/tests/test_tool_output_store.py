@@ -0,0 +1,69 @@
+# 목적: Tool 출력 저장소를 검증한다.
+# 설명: 실행 노드가 상태에 출력 대신 참조 키만 싣고, 합성 노드가 저장소에서 출력을 읽는지 확인한다.
+# 디자인 패턴: 통합 테스트
+# 참조: fourthsession/core/common/tools/tool_output_store.py
+
+"""Tool 출력 저장소 테스트 모듈."""
+
+from __future__ import annotations
+
+from fourthsession.core.common.repository.sqlite.housing_repository import HousingRepository
+from fourthsession.core.common.tools import tool_output_store
+from fourthsession.core.common.tools.tool_output_store import (
+    publish_tool_output,
+    resolve_tool_output,
+)
+from fourthsession.core.housing_agent.nodes.execute_node import ExecuteNode
+from fourthsession.core.housing_agent.nodes.merge_node import MergeResultNode
+from fourthsession.core.housing_agent.state.agent_state import HousingAgentState
+from fourthsession.mcp.tool_registry import HousingToolRegistry
+
+_PLAN = {
+    "steps": [
+        {"id": "s1", "action": "tool_call", "tool": "housing_list_tool", "input": {"limit": 2}},
+    ]
+}
+
+
+def test_execute_keeps_only_output_ref_in_state(make_provider):
+    registry = HousingToolRegistry(repository=HousingRepository(make_provider()))
+    registry.register_tools()
+    node = ExecuteNode(registry=registry)
+
+    results = node(HousingAgentState(plan=_PLAN))["tool_results"]
+
+    assert "output" not in results[0]
+    assert results[0]["output_ref"].startswith("s1:")
+    assert len(resolve_tool_output(results[0]["output_ref"])["items"]) == 2
+    answer = MergeResultNode()(HousingAgentState(tool_results=results))["answer"]
+    assert answer.startswith("주택 ")
+
+    # 재계획으로 같은 계획을 다시 실행하면 저장소의 출력을 그대로 재사용한다.
+    rerun = node(HousingAgentState(plan=_PLAN, tool_results=results))["tool_results"]
+    assert rerun[0]["reused"] is True
+    assert rerun[0]["output_ref"] == results[0]["output_ref"]
+
+
+def test_store_evicts_least_recently_read_output(monkeypatch):
+    monkeypatch.setattr(tool_output_store, "MAX_TOOL_OUTPUTS", 2)
+    first = publish_tool_output("s1", {"n": 1})
+    second = publish_tool_output("s2", {"n": 2})
+    resolve_tool_output(first)
+
+    publish_tool_output("s3", {"n": 3})
+
+    assert resolve_tool_output(first) == {"n": 1}
+    assert resolve_tool_output(second) is None
+    assert publish_tool_output("s4", None) is None
+
+
+def test_merge_reports_expired_output():
+    state = HousingAgentState(
+        tool_results=[
+            {"id": "s1", "tool": "housing_list_tool", "status": "ok", "output_ref": "s1:gone"},
+        ]
+    )
+
+    answer = MergeResultNode()(state)["answer"]
+
+    assert "출력이 저장소에서 만료되었습니다" in answer